@@ -1,5 +1,10 @@
 """Key OpenMDAO classes can be imported from here."""
 
+import os
+import sys
+from importlib import import_module
+from types import ModuleType
+
 # Core
 from openmdao.core.problem import Problem
 from openmdao.core.group import Group
@@ -13,14 +18,11 @@ from openmdao.core.analysis_error import AnalysisError
 from openmdao.components.deprecated_component import Component
 from openmdao.components.exec_comp import ExecComp
 from openmdao.components.linear_system_comp import LinearSystemComp
-from openmdao.components.meta_model import MetaModel
-from openmdao.components.multifi_meta_model import MultiFiMetaModel
 
 # Solvers
 from openmdao.solvers.linear.linear_block_gs import LinearBlockGS
 from openmdao.solvers.linear.linear_block_jac import LinearBlockJac
 from openmdao.solvers.linear.direct import DirectSolver
-from openmdao.solvers.linear.petsc_ksp import PetscKSP
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
 from openmdao.solvers.linear.scipy_iter_solver import ScipyIterativeSolver
 from openmdao.solvers.linesearch.backtracking import ArmijoGoldsteinLS
@@ -30,42 +32,135 @@ from openmdao.solvers.nonlinear.nonlinear_block_jac import NonlinearBlockJac
 from openmdao.solvers.nonlinear.newton import NewtonSolver
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonLinearRunOnce
 
-# Surrogate Models
-from openmdao.surrogate_models.kriging import KrigingSurrogate, FloatKrigingSurrogate
-from openmdao.surrogate_models.multifi_cokriging import MultiFiCoKrigingSurrogate, \
-    FloatMultiFiCoKrigingSurrogate
-from openmdao.surrogate_models.nearest_neighbor import NearestNeighbor
-from openmdao.surrogate_models.response_surface import ResponseSurface
-from openmdao.surrogate_models.surrogate_model import SurrogateModel, \
-    MultiFiSurrogateModel
-
 # Vectors
 from openmdao.vectors.default_vector import DefaultVector
-try:
-    from openmdao.vectors.petsc_vector import PETScVector
-except ImportError:
-    PETScVector = None
-
-# Developer Tools
-from openmdao.devtools.problem_viewer.problem_viewer import view_model
-from openmdao.devtools.viewconns import view_connections
 
 # Derivative Specification
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian, \
     DenseJacobian, COOJacobian, CSRJacobian, CSCJacobian
 
-# Drivers
-try:
-    from openmdao.drivers.pyoptsparse_driver import pyOptSparseDriver
-except ImportError:
-    pass
-from openmdao.drivers.scipy_optimizer import ScipyOptimizer
-
 # System-Building Tools
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Classes and functions whose modules, or the libraries those modules use, are slow to import.
+# They are only imported when first accessed, e.g., by 'from openmdao.api import MetaModel'.
+_lazy_imports = {
+    # Components
+    'MetaModel': 'openmdao.components.meta_model',
+    'MultiFiMetaModel': 'openmdao.components.multifi_meta_model',
+
+    # Solvers
+    'PetscKSP': 'openmdao.solvers.linear.petsc_ksp',
+
+    # Surrogate Models
+    'KrigingSurrogate': 'openmdao.surrogate_models.kriging',
+    'FloatKrigingSurrogate': 'openmdao.surrogate_models.kriging',
+    'MultiFiCoKrigingSurrogate': 'openmdao.surrogate_models.multifi_cokriging',
+    'FloatMultiFiCoKrigingSurrogate': 'openmdao.surrogate_models.multifi_cokriging',
+    'NearestNeighbor': 'openmdao.surrogate_models.nearest_neighbor',
+    'ResponseSurface': 'openmdao.surrogate_models.response_surface',
+    'SparseKrigingSurrogate': 'openmdao.surrogate_models.sparse_kriging',
+    'SurrogateModel': 'openmdao.surrogate_models.surrogate_model',
+    'MultiFiSurrogateModel': 'openmdao.surrogate_models.surrogate_model',
+
+    # Vectors
+    'PETScVector': 'openmdao.vectors.petsc_vector',
+
+    # Developer Tools
+    'view_model': 'openmdao.devtools.problem_viewer.problem_viewer',
+    'view_connections': 'openmdao.devtools.viewconns',
+
+    # Drivers
+    'pyOptSparseDriver': 'openmdao.drivers.pyoptsparse_driver',
+    'ScipyOptimizer': 'openmdao.drivers.scipy_optimizer',
+}
+
+# Value of each lazy import whose module may fail to import because of a missing optional
+# dependency. If absent, a failed import makes the name unavailable.
+_optional_defaults = {
+    'PETScVector': None,
+}
+
+
+class _LazyAPI(ModuleType):
+    """
+    Module type of openmdao.api that imports the entries of _lazy_imports on first access.
+
+    Attributes
+    ----------
+    _module : module
+        the original openmdao.api module, which owns the globals used here.
+    """
+
+    def __init__(self, module):
+        """
+        Copy the contents of the original module.
+
+        Parameters
+        ----------
+        module : module
+            the original openmdao.api module.
+        """
+        super(_LazyAPI, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        self._module = module
+
+    def __getattr__(self, name):
+        """
+        Import a lazily imported class or function.
+
+        Parameters
+        ----------
+        name : str
+            name of the attribute.
+
+        Returns
+        -------
+        object
+            the imported class or function.
+        """
+        if name == '__all__':
+            # for 'from openmdao.api import *', import everything that is available
+            names = [key for key, value in self._module.__dict__.items()
+                     if not key.startswith('_') and not isinstance(value, ModuleType) and
+                     value is not import_module and value is not ModuleType]
+            for key in _lazy_imports:
+                try:
+                    getattr(self, key)
+                except AttributeError:
+                    continue
+                names.append(key)
+            self.__all__ = names = sorted(names)
+            return names
+
+        if name not in _lazy_imports:
+            raise AttributeError("module '%s' has no attribute '%s'" % (self.__name__, name))
+
+        try:
+            value = getattr(import_module(_lazy_imports[name]), name)
+        except ImportError as err:
+            if name not in _optional_defaults:
+                raise AttributeError("'%s' is not available: %s" % (name, err))
+            value = _optional_defaults[name]
+
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        """
+        List the contents of the module, including the lazy imports.
+
+        Returns
+        -------
+        list of str
+            the names in the module.
+        """
+        return sorted(set(self.__dict__).union(_lazy_imports))
+
+
+sys.modules[__name__] = _LazyAPI(sys.modules[__name__])
+
 # set up tracing or memory profiling if env vars are set.
-import os
 if os.environ.get('OPENMDAO_TRACE'):
     from openmdao.devtools.itrace import setup, start
     ret = bool(os.environ.get('OPENMDAO_TRACE_RETURN'))
@@ -1,14 +1,74 @@
 """Base class used to define the interface for derivative approximation schemes."""
 from __future__ import print_function, division
 
+import sys
+import multiprocessing
+
+from six import iteritems
+from six.moves import range
+
+import numpy as np
+
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+BACKENDS = ('serial', 'process', 'mpi')
+
+# The column function of the running approximation, inherited by forked worker processes.
+_column_func = None
+
+
+def _run_column(idx):
+    """
+    Evaluate one column in a worker process.
+
+    Parameters
+    ----------
+    idx : int
+        index of the column.
+
+    Returns
+    -------
+    list of ndarray
+        the column, for each of the approximated outputs.
+    """
+    return _column_func(idx)
+
+
+def _get_fork_context():
+    """
+    Get a multiprocessing context that forks, if the platform supports it.
+
+    Returns
+    -------
+    module or multiprocessing context or None
+        the object that creates forked worker pools, or None if forking isn't supported.
+    """
+    if not hasattr(multiprocessing, 'get_context'):
+        # python 2 always forks, where it is supported.
+        return None if sys.platform == 'win32' else multiprocessing
+    try:
+        return multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+
 
 class ApproximationScheme(object):
     """
     Base class used to define the interface for derivative approximation schemes.
+
+    Attributes
+    ----------
+    _approx_subjacs : dict
+        Dense sub-Jacobian workspace arrays keyed by absolute (of, wrt), reused between
+        calls to compute_approximations.
     """
 
+    def __init__(self):
+        """
+        Initialize the ApproximationScheme.
+        """
+        self._approx_subjacs = {}
+
     def add_approximation(self, abs_key, kwargs):
         """
         Use this approximation scheme to approximate the derivative d(of)/d(wrt).
@@ -45,22 +105,139 @@ class ApproximationScheme(object):
         """
         pass
 
-    def _run_point(self, system, input_deltas, deriv_type='partial'):
+    def _check_backend(self, options):
         """
-        Alter the specified inputs by the given deltas, runs the system, and returns the results.
+        Check the options that control how the columns are evaluated.
 
         Parameters
         ----------
-        input_deltas : list
-            List of (input name, indices, delta) tuples, where input name is an absolute name.
+        options : dict
+            options of one approximation.
+        """
+        if options['backend'] not in BACKENDS:
+            msg = 'Backend "{}" is not supported, backend must be one of {}'
+            raise ValueError(msg.format(options['backend'], BACKENDS))
+        if options['num_workers'] < 1:
+            raise ValueError('num_workers must be at least 1, but got {}'.format(
+                options['num_workers']))
+
+    def _get_subjac(self, abs_key, shape):
+        """
+        Get the workspace array for an approximated sub-Jacobian.
+
+        Parameters
+        ----------
+        abs_key : tuple(str,str)
+            Absolute name pairing of (of, wrt) for the derivative.
+        shape : tuple(int, int)
+            shape of the sub-Jacobian.
+
+        Returns
+        -------
+        ndarray
+            the workspace array.
+        """
+        subjac = self._approx_subjacs.get(abs_key)
+        if subjac is None or subjac.shape != shape:
+            self._approx_subjacs[abs_key] = subjac = np.zeros(shape)
+        return subjac
+
+    def _compute_columns(self, system, column_func, ncols, subjacs, backend, num_workers):
+        """
+        Evaluate the columns of approximated sub-Jacobians, possibly concurrently.
+
+        With the 'process' backend, the columns are split over a pool of num_workers forked
+        processes, which each work on their own copy of the system. With the 'mpi' backend,
+        they are split over the processes of the system's communicator, which requires the
+        system to be a component that isn't distributed.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        column_func : callable
+            function that takes the index of a column, writes that column of each of the
+            subjacs and returns the columns.
+        ncols : int
+            number of columns.
+        subjacs : list of ndarray
+            the sub-Jacobians being computed.
+        backend : str
+            one of 'serial', 'process' or 'mpi'.
+        num_workers : int
+            number of worker processes for the 'process' backend.
+        """
+        global _column_func
+
+        if backend == 'mpi' and system.comm.size > 1:
+            if system._subsystems_allprocs or getattr(system, 'distributed', False):
+                raise RuntimeError("The 'mpi' backend in system '%s' requires a component that "
+                                   "isn't distributed." % system.pathname)
+            comm = system.comm
+            local = [(idx, column_func(idx)) for idx in range(comm.rank, ncols, comm.size)]
+            columns = [column for part in comm.allgather(local) for column in part]
+
+        elif backend == 'process' and num_workers > 1 and ncols > 1 and \
+                _get_fork_context() is not None:
+            _column_func = column_func
+            pool = _get_fork_context().Pool(min(num_workers, ncols))
+            try:
+                columns = enumerate(pool.map(_run_column, range(ncols)))
+            finally:
+                pool.close()
+                pool.join()
+                _column_func = None
+
+        else:
+            for idx in range(ncols):
+                column_func(idx)
+            return
+
+        for idx, column in columns:
+            for subjac, col in zip(subjacs, column):
+                subjac[:, idx] = col
+
+    def _get_cache(self, system, deriv_type='partial'):
+        """
+        Allocate the workspace used to save the results vector while running points.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
         deriv_type : str
             One of 'total' or 'partial', indicating if total or partial derivatives are being
             approximated.
 
         Returns
         -------
-        Vector
-            Copy of the results from running the perturbed system.
+        dict of ndarray
+            arrays matching the data of the results vector, keyed by var_set name.
+        """
+        if deriv_type == 'total':
+            results_vec = system._outputs
+        else:
+            results_vec = system._residuals
+
+        return {set_name: np.empty_like(data) for set_name, data in iteritems(results_vec._data)}
+
+    def _run_point(self, system, input_deltas, cache, results, deriv_type='partial'):
+        """
+        Alter the specified inputs by the given deltas, runs the system, and saves the results.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        input_deltas : list
+            List of (input name, indices, delta) tuples, where input name is an absolute name.
+        cache : dict of ndarray
+            workspace from _get_cache, used to restore the results vector.
+        results : list of (str, ndarray)
+            absolute output names and the arrays that their results are copied into.
+        deriv_type : str
+            One of 'total' or 'partial', indicating if total or partial derivatives are being
+            approximated.
         """
         # TODO: MPI
 
@@ -82,17 +259,20 @@ class ApproximationScheme(object):
             else:
                 inputs._views_flat[in_name][idxs] += delta
 
-        # TODO: Grab only results of interest
-        cache = results_vec._clone()
+        for set_name, data in iteritems(results_vec._data):
+            cache[set_name][:] = data
+
         run_model()
 
-        results = results_vec._clone()
-        results_vec.set_vec(cache)
+        # Only grab the results of interest
+        for name, array in results:
+            array[:] = results_vec._views_flat[name]
+
+        for set_name, data in iteritems(results_vec._data):
+            data[:] = cache[set_name]
 
         for in_name, idxs, delta in input_deltas:
             if in_name in outputs._views_flat:
                 outputs._views_flat[in_name][idxs] -= delta
             else:
                 inputs._views_flat[in_name][idxs] -= delta
-
-        return results
@@ -4,6 +4,7 @@ from __future__ import division, print_function
 import numpy as np
 from collections import namedtuple
 from itertools import groupby
+from six import iteritems
 from six.moves import range
 
 from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme
@@ -13,6 +14,8 @@ from openmdao.utils.name_maps import abs_key2rel_key
 DEFAULT_CS_OPTIONS = {
     'step': 1e-15,
     'form': 'forward',
+    'backend': 'serial',
+    'num_workers': 1,
 }
 
 
@@ -27,6 +30,9 @@ class ComplexStep(ApproximationScheme):
 
         f'(x) = \Im{\frac{f(x+ih)}{h}}.
 
+    As with <FiniteDifference>, the 'backend' and 'num_workers' options control whether the
+    perturbed points are evaluated serially, in forked processes, or over MPI.
+
     Attributes
     ----------
     _exec_list : list
@@ -56,6 +62,7 @@ class ComplexStep(ApproximationScheme):
         of, wrt = abs_key
         options = DEFAULT_CS_OPTIONS.copy()
         options.update(kwargs)
+        self._check_backend(options)
         self._exec_list.append((of, wrt, options))
 
     @staticmethod
@@ -70,12 +77,13 @@ class ComplexStep(ApproximationScheme):
 
         Returns
         -------
-        tuple(str, str, float)
-            Sorting key (wrt, form, step_size)
+        tuple(str, str, float, str, int)
+            Sorting key (wrt, form, step_size, backend, num_workers)
 
         """
         options = approx_tuple[2]
-        return (approx_tuple[1], options['form'], options['step'])
+        return (approx_tuple[1], options['form'], options['step'], options['backend'],
+                options['num_workers'])
 
     def _init_approximations(self):
         """
@@ -114,13 +122,16 @@ class ComplexStep(ApproximationScheme):
         else:
             raise ValueError('deriv_type must be one of "total" or "partial"')
 
+        cache = self._get_cache(system, deriv_type)
+        imag_cache = self._get_cache(system, deriv_type)
+
         # Turn on complex step.
         system._inputs._vector_info._under_complex_step = True
 
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
-            wrt, form, delta = key
+            wrt, form, delta, backend, num_workers = key
             if form == 'reverse':
                 delta *= -1.0
 
@@ -130,27 +141,39 @@ class ComplexStep(ApproximationScheme):
                 in_size = np.prod(system._var_abs2meta['output'][wrt]['shape'])
 
             outputs = []
+            seen = set()
 
             # Note: If access to `approximations` is required again in the future, we will need to
             # throw it in a list first. The groupby iterator only works once.
             for approx_tuple in approximations:
                 of = approx_tuple[0]
+                if of in seen:
+                    # the same approximation may have been added more than once.
+                    continue
+                seen.add(of)
+
                 # TODO: Sparse derivatives
                 out_size = np.prod(system._var_abs2meta['output'][of]['shape'])
-                outputs.append((of, np.zeros((out_size, in_size))))
+                outputs.append((of, self._get_subjac((of, wrt), (out_size, in_size))))
 
-            for idx in range(in_size):
+            fact = 1.0 / delta
+            if deriv_type == 'total':
+                # Sign difference between output and resids
+                fact = -fact
+
+            def column_func(idx):
                 # Run the Finite Difference
                 input_delta = [(wrt, idx, delta)]
-                result = self._run_point_complex(system, input_delta, deriv_type)
+                results = [(of, subjac[:, idx]) for of, subjac in outputs]
+                self._run_point_complex(system, input_delta, cache, imag_cache, results,
+                                        deriv_type)
 
-                for of, subjac in outputs:
-                    fact = 1.0 / delta
-                    if deriv_type == 'total':
-                        # Sign difference between output and resids
-                        fact = -fact
+                for of, col in results:
+                    col *= fact
+                return [col for of, col in results]
 
-                    subjac[:, idx] = result._imag_views_flat[of] * fact
+            self._compute_columns(system, column_func, in_size,
+                                  [subjac for of, subjac in outputs], backend, num_workers)
 
             for of, subjac in outputs:
                 rel_key = abs_key2rel_key(system, (of, wrt))
@@ -159,22 +182,27 @@ class ComplexStep(ApproximationScheme):
         # Turn off complex step.
         system._inputs._vector_info._under_complex_step = False
 
-    def _run_point_complex(self, system, input_deltas, deriv_type='partial'):
+    def _run_point_complex(self, system, input_deltas, cache, imag_cache, results,
+                           deriv_type='partial'):
         """
-        Perturb the system inputs with a complex step, runs, and returns the results.
+        Perturb the system inputs with a complex step, runs, and saves the results.
 
         Parameters
         ----------
+        system : System
+            System on which the execution is run.
         input_deltas : list
             List of (input name, indices, delta) tuples, where input name is an absolute name.
+        cache : dict of ndarray
+            workspace from _get_cache, used to restore the real part of the results vector.
+        imag_cache : dict of ndarray
+            workspace from _get_cache, used to restore the imaginary part of the results vector.
+        results : list of (str, ndarray)
+            absolute output names and the arrays that the imaginary parts of their results
+            are copied into.
         deriv_type : str
             One of 'total' or 'partial', indicating if total or partial derivatives are being
             approximated.
-
-        Returns
-        -------
-        Vector
-            Copy of the results from running the perturbed system.
         """
         # TODO: MPI
 
@@ -196,18 +224,22 @@ class ComplexStep(ApproximationScheme):
             else:
                 inputs._imag_views_flat[in_name][idxs] += delta
 
-        # TODO: A full clone here (and below) is overkill.
-        cache = results_vec._clone(initialize_views=True)
+        for set_name, data in iteritems(results_vec._data):
+            cache[set_name][:] = data
+            imag_cache[set_name][:] = results_vec._imag_data[set_name]
+
         run_model()
 
-        # TODO: Grab only results of interest
-        results = results_vec._clone(initialize_views=True)
-        results_vec.set_vec(cache)
+        # Only grab the results of interest
+        for name, array in results:
+            array[:] = results_vec._imag_views_flat[name]
+
+        for set_name, data in iteritems(results_vec._data):
+            data[:] = cache[set_name]
+            results_vec._imag_data[set_name][:] = imag_cache[set_name]
 
         for in_name, idxs, delta in input_deltas:
             if in_name in outputs._imag_views_flat:
                 outputs._imag_views_flat[in_name][idxs] -= delta
             else:
                 inputs._imag_views_flat[in_name][idxs] -= delta
-
-        return results
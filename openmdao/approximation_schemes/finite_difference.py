@@ -17,6 +17,8 @@ DEFAULT_FD_OPTIONS = {
     'form': 'forward',
     'order': None,
     'step_calc': 'abs',
+    'backend': 'serial',
+    'num_workers': 1,
 }
 
 DEFAULT_ORDER = {
@@ -74,6 +76,10 @@ class FiniteDifference(ApproximationScheme):
 
         f'(x) = \frac{f(x+h) - f(x)}{h} + O(h).
 
+    The perturbed points are evaluated serially by default. The 'backend' option can be set
+    to 'process' to evaluate them in a pool of 'num_workers' forked processes, or to 'mpi' to
+    split them over the processes of a component's communicator.
+
     Attributes
     ----------
     _exec_list : list
@@ -105,6 +111,7 @@ class FiniteDifference(ApproximationScheme):
         fd_options.update(kwargs)
         if fd_options['order'] is None:
             fd_options['order'] = DEFAULT_ORDER[fd_options['form']]
+        self._check_backend(fd_options)
         self._exec_list.append((of, wrt, fd_options))
 
     @staticmethod
@@ -119,13 +126,14 @@ class FiniteDifference(ApproximationScheme):
 
         Returns
         -------
-        tuple(str, str, float, int, str)
-            Sorting key (wrt, form, step_size, order, step_calc)
+        tuple(str, str, float, int, str, str, int)
+            Sorting key (wrt, form, step_size, order, step_calc, backend, num_workers)
 
         """
         fd_options = approx_tuple[2]
         return (approx_tuple[1], fd_options['form'], fd_options['order'],
-                fd_options['step'], fd_options['step_calc'])
+                fd_options['step'], fd_options['step_calc'], fd_options['backend'],
+                fd_options['num_workers'])
 
     def _init_approximations(self):
         """
@@ -164,10 +172,18 @@ class FiniteDifference(ApproximationScheme):
         else:
             raise ValueError('deriv_type must be one of "total" or "partial"')
 
+        cache = self._get_cache(system, deriv_type)
+
+        # Sign difference between output and resids. This arises from the definitions
+        # in the unified derivatives equations.
+        # For ExplicitComponent: resid = output(n-1) - output(n)
+        # so dresid/d* = - doutput/d*
+        sign = -1.0 if deriv_type == 'total' else 1.0
+
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
-            wrt, form, order, step, step_calc = key
+            wrt, form, order, step, step_calc, backend, num_workers = key
 
             # FD forms are written as a collection of changes to inputs (deltas) and the associated
             # coefficients (coeffs). Since we do not need to (re)evaluate the current step, its
@@ -195,40 +211,45 @@ class FiniteDifference(ApproximationScheme):
             elif wrt in system._var_abs2meta['output']:
                 in_size = np.prod(system._var_abs2meta['output'][wrt]['shape'])
 
-            result = system._outputs._clone(True)
-
             outputs = []
+            seen = set()
 
             # Note: If access to `approximations` is required again in the future, we will need to
             # throw it in a list first. The groupby iterator only works once.
             for approx_tuple in approximations:
                 of = approx_tuple[0]
+                if of in seen:
+                    # the same approximation may have been added more than once.
+                    continue
+                seen.add(of)
+
                 # TODO: Sparse derivatives
                 out_size = np.prod(system._var_abs2meta['output'][of]['shape'])
-                outputs.append((of, np.zeros((out_size, in_size))))
+                subjac = self._get_subjac((of, wrt), (out_size, in_size))
+                current = sign * current_coeff * current_vec._views_flat[of]
+                outputs.append((of, subjac, current, np.empty(out_size)))
 
-            for idx in range(in_size):
-                if current_coeff:
-                    result.set_vec(current_vec)
-                    result *= current_coeff
-                else:
-                    result.set_const(0.)
+            results = [(of, work) for of, subjac, current, work in outputs]
+            coeffs *= sign
+
+            def column_func(idx):
+                for of, subjac, current, work in outputs:
+                    subjac[:, idx] = current
 
                 # Run the Finite Difference
                 for delta, coeff in zip(deltas, coeffs):
                     input_delta = [(wrt, idx, delta)]
-                    result.add_scal_vec(coeff, self._run_point(system, input_delta, deriv_type))
+                    self._run_point(system, input_delta, cache, results, deriv_type)
+                    for of, subjac, current, work in outputs:
+                        work *= coeff
+                        subjac[:, idx] += work
 
-                if deriv_type == 'total':
-                    # Sign difference between output and resids. This arises from the definitions
-                    # in the unified derivatives equations.
-                    # For ExplicitComponent: resid = output(n-1) - output(n)
-                    # so dresid/d* = - doutput/d*
-                    result *= -1.0
+                return [subjac[:, idx] for of, subjac, current, work in outputs]
 
-                for of, subjac in outputs:
-                    subjac[:, idx] = result._views_flat[of]
+            self._compute_columns(system, column_func, in_size,
+                                  [subjac for of, subjac, current, work in outputs],
+                                  backend, num_workers)
 
-            for of, subjac in outputs:
+            for of, subjac, current, work in outputs:
                 rel_key = abs_key2rel_key(system, (of, wrt))
                 jac[rel_key] = subjac
@@ -178,7 +178,7 @@ class Component(BaseComponent):
             self._scale_vec(self._outputs, 'output', 'norm')
             self._scale_vec(self._residuals, 'residual', 'norm')
 
-    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None):
+    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None, rel_systems=None):
         """
         Compute jac-vec product.
 
@@ -194,6 +194,9 @@ class Component(BaseComponent):
         scope_in : set or None
             Set of absolute input names in the scope of this mat-vec product.
             If None, all are in the scope.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
         """
         for vec_name in vec_names:
             with self._matvec_context(vec_name, scope_out, scope_in, mode) as vecs:
@@ -217,7 +220,7 @@ class Component(BaseComponent):
                         for name in d_inputs:
                             d_inputs[name] *= -1.0
 
-    def _solve_linear(self, vec_names, mode):
+    def _solve_linear(self, vec_names, mode, rel_systems=None):
         """
         Apply inverse jac product.
 
@@ -227,6 +230,9 @@ class Component(BaseComponent):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
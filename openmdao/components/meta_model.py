@@ -161,6 +161,27 @@ class MetaModel(ExplicitComponent):
 
         return super(MetaModel, self)._setup_vars()
 
+    def _setup_partials(self, recurse=True):
+        """
+        Declare the block diagonal partials of a vectorized metamodel.
+
+        Parameters
+        ----------
+        recurse : bool
+            Whether to call this method in subsystems.
+        """
+        super(MetaModel, self)._setup_partials()
+
+        if self._vectorize is not None:
+            vec_size = self._vectorize
+            for name, shape in self._surrogate_output_names:
+                n_of = np.prod(shape)
+                for in_name, sz in self._surrogate_input_names:
+                    rows = np.repeat(np.arange(vec_size * n_of), sz)
+                    cols = np.tile(np.arange(sz), vec_size * n_of) + \
+                        np.repeat(np.arange(vec_size) * sz, n_of * sz)
+                    self._declare_partials(of=name, wrt=in_name, rows=rows, cols=cols)
+
     def check_config(self, logger):
         """
         Perform optional error checks.
@@ -223,8 +244,8 @@ class MetaModel(ExplicitComponent):
                         predicted = predicted[0]
                     outputs[name] = np.reshape(predicted, outputs[name].shape)
                 elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
-                    # multiple inputs flattened, one prediction of multiple outputs
-                    predicted = surrogate.vectorized_predict(inputs.flat)
+                    # multiple inputs, all predicted in one call
+                    predicted = surrogate.vectorized_predict(inputs)
                     if isinstance(predicted, tuple):  # rmse option
                         self._metadata(name)['rmse'] = predicted[1]
                         predicted = predicted[0]
@@ -325,6 +346,20 @@ class MetaModel(ExplicitComponent):
         partials : Jacobian
             sub-jac components written to partials[output_name, input_name]
         """
+        if self._vectorize is not None:
+            arr = self._vec_to_array2d(inputs)
+
+            for uname, _ in self._surrogate_output_names:
+                surrogate = self._metadata(uname).get('surrogate')
+                sjac = surrogate.vectorized_linearize(arr)
+
+                # values of the block diagonal declared in _setup_partials
+                idx = 0
+                for pname, sz in self._surrogate_input_names:
+                    partials[(uname, pname)] = sjac[:, :, idx:idx + sz].ravel()
+                    idx += sz
+            return
+
         arr = self._vec_to_array(inputs)
 
         for uname, _ in self._surrogate_output_names:
@@ -430,7 +465,14 @@ class MetaModel(ExplicitComponent):
                         new_output[row_idx, :] = v.flat
 
             surrogate = self._metadata(name).get('surrogate')
-            if surrogate is not None:
+            if surrogate is None:
+                continue
+
+            if self.warm_restart and num_old_pts > 0 and num_sample > 0 and \
+                    surrogate.trained and overrides_method('update', surrogate, SurrogateModel):
+                # only the new data is given to surrogates that can be updated
+                surrogate.update(new_input, self._training_output[name][num_old_pts:])
+            else:
                 surrogate.train(self._training_input,
                                 self._training_output[name])
 
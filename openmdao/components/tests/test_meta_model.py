@@ -569,6 +569,39 @@ class MetaModelTestCase(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          "Metamodel: First dimension of output 'y' must be 3")
 
+    def test_vectorized_derivatives(self):
+        size = 3
+
+        for surrogate in (FloatKrigingSurrogate(), ResponseSurface()):
+            mm = MetaModel(vectorize=size, default_surrogate=surrogate)
+            mm.add_input('x', np.zeros((size, 2)))
+            mm.add_input('z', np.zeros(size))
+            mm.add_output('y', np.zeros((size, 2)))
+
+            prob = Problem()
+            prob.model.add_subsystem('p', IndepVarComp([('x', np.zeros((size, 2))),
+                                                        ('z', np.zeros(size))]))
+            prob.model.add_subsystem('mm', mm)
+            prob.model.connect('p.x', 'mm.x')
+            prob.model.connect('p.z', 'mm.z')
+            prob.setup(check=False)
+
+            train_x = np.random.RandomState(0).random_sample((20, 2))
+            train_z = np.linspace(0., 1., 20)
+            mm.metadata['train:x'] = list(train_x)
+            mm.metadata['train:z'] = train_z
+            mm.metadata['train:y'] = list(np.column_stack((train_x[:, 0] * train_z,
+                                                           train_x[:, 1] + train_z)))
+
+            prob['p.x'] = np.array([[.2, .3], [.5, .5], [.7, .1]])
+            prob['p.z'] = np.array([.4, .6, .2])
+            prob.run_model()
+
+            data = prob.check_partials(out_stream=None)
+
+            for key in (('y', 'x'), ('y', 'z')):
+                assert_rel_error(self, data['mm'][key]['J_fwd'], data['mm'][key]['J_fd'], 1e-4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Define a base class for all Drivers in OpenMDAO."""
 
+from collections import OrderedDict
+
 from six import iteritems
 
 import numpy as np
@@ -29,6 +31,22 @@ class Driver(object):
         Contains all objective info.
     _responses : dict
         Contains all response info.
+    _total_jac_sparsity : dict or None
+        Boolean sparsity of the total jacobian keyed by [of][wrt], used for simultaneous
+        derivatives.
+    _simul_colorings : dict
+        Cache of colorings computed from _total_jac_sparsity, keyed by (mode, of, wrt).
+    _eval_cache : OrderedDict
+        LRU cache of the model evaluations at recent design points, keyed by the bytes of
+        the scaled design vector. Each entry is a dict holding the objective ('objs') and
+        constraint ('cons') values and, once computed, the total jacobian ('jac').
+    _eval_cache_size : int
+        Maximum number of design points in _eval_cache.
+    _eval_key : bytes or None
+        Key of the design point at which the model was last run, or None if unknown.
+    _active_rows : dict
+        Boolean masks of the entries of the constraints with an activity tolerance that
+        were active at the last computation of the total derivatives, keyed by name.
     """
 
     def __init__(self):
@@ -40,6 +58,12 @@ class Driver(object):
         self._cons = None
         self._objs = None
         self._responses = None
+        self._total_jac_sparsity = None
+        self._simul_colorings = {}
+        self._eval_cache = OrderedDict()
+        self._eval_cache_size = 0
+        self._eval_key = None
+        self._active_rows = {}
         self.options = OptionsDictionary()
 
         # What the driver supports.
@@ -79,6 +103,23 @@ class Driver(object):
         self._objs = model.get_objectives(recurse=True)
         self._cons = model.get_constraints(recurse=True)
 
+    def set_total_jac_sparsity(self, sparsity):
+        """
+        Set the sparsity of the total jacobian to enable simultaneous derivatives.
+
+        Design variable (fwd) or response (rev) indices whose columns (rows) of the total
+        jacobian don't overlap are then seeded together and solved for in a single linear
+        solve.
+
+        Parameters
+        ----------
+        sparsity : dict or None
+            Nested dict of boolean arrays keyed by [of][wrt] using absolute names, such as
+            the one returned by get_total_jac_sparsity. None turns simultaneous derivatives off.
+        """
+        self._total_jac_sparsity = sparsity
+        self._simul_colorings = {}
+
     def get_design_var_values(self):
         """
         Return the design variable values.
@@ -237,6 +278,96 @@ class Driver(object):
 
         return con_dict
 
+    def _reset_eval_cache(self, cache_size):
+        """
+        Empty the cache of model evaluations, e.g., at the start of an optimization.
+
+        Parameters
+        ----------
+        cache_size : int
+            Maximum number of design points in the cache.
+        """
+        self._eval_cache = OrderedDict()
+        self._eval_cache_size = cache_size
+        self._eval_key = None
+
+    def _get_cached_eval(self, x):
+        """
+        Return the cached model evaluation at a design point, if any.
+
+        Parameters
+        ----------
+        x : ndarray
+            Scaled design vector, with the design variables in the order of _designvars.
+
+        Returns
+        -------
+        bytes
+            Cache key of the design point.
+        dict or None
+            The cached evaluation, or None if the point is not in the cache.
+        """
+        key = x.tobytes()
+        entry = self._eval_cache.pop(key, None)
+        if entry is not None:
+            # move it to the most recently used position
+            self._eval_cache[key] = entry
+        return key, entry
+
+    def _cache_eval(self, key):
+        """
+        Store the responses at the current state of the model in the cache.
+
+        Parameters
+        ----------
+        key : bytes
+            Cache key of the design point at which the model was run.
+
+        Returns
+        -------
+        dict
+            The new cache entry.
+        """
+        self._eval_key = key
+        entry = {'objs': self.get_objective_values(), 'cons': self.get_constraint_values()}
+
+        cache = self._eval_cache
+        cache.pop(key, None)
+        cache[key] = entry
+        while len(cache) > self._eval_cache_size:
+            cache.popitem(last=False)
+
+        return entry
+
+    def _run_model_at(self, x, key):
+        """
+        Set the design variables to a design vector, run the model and cache the responses.
+
+        Parameters
+        ----------
+        x : ndarray
+            Scaled design vector, with the design variables in the order of _designvars.
+        key : bytes
+            Cache key of the design point.
+
+        Returns
+        -------
+        dict
+            The new cache entry.
+        """
+        # if the model fails, its state no longer corresponds to any known point
+        self._eval_key = None
+
+        i = 0
+        for name, meta in iteritems(self._designvars):
+            size = meta['size']
+            self.set_design_var(name, x[i:i + size])
+            i += size
+
+        self._problem.model._solve_nonlinear()
+
+        return self._cache_eval(key)
+
     def run(self):
         """
         Execute this driver.
@@ -251,8 +382,42 @@ class Driver(object):
         """
         return self._problem.model._solve_nonlinear()
 
+    def _get_active_rows(self, names):
+        """
+        Return the entries of the constraints with an activity tolerance that are active.
+
+        An entry is active if its value is within the tolerance of its lower or upper bound.
+        Equality and linear constraints are always fully active, so they are not included.
+
+        Parameters
+        ----------
+        names : list of str
+            Absolute names of the responses whose derivatives are about to be computed.
+
+        Returns
+        -------
+        dict
+            Boolean mask of the active entries, keyed by constraint name.
+        """
+        active_rows = {}
+        con_vals = None
+        for name in names:
+            meta = self._cons.get(name)
+            if meta is None or meta['active_tol'] is None or meta['equals'] is not None \
+               or meta['linear']:
+                continue
+
+            if con_vals is None:
+                con_vals = self.get_constraint_values()
+
+            val = con_vals[name]
+            tol = meta['active_tol']
+            active_rows[name] = (val >= meta['upper'] - tol) | (val <= meta['lower'] + tol)
+
+        return active_rows
+
     def _compute_total_derivs(self, of=None, wrt=None, return_format='flat_dict',
-                              global_names=True):
+                              global_names=True, linearize=True):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
 
@@ -272,6 +437,9 @@ class Driver(object):
             the scipy optimizer, 'array' is also supported.
         global_names : bool
             Set to True when passing in global names to skip some translation steps.
+        linearize : bool
+            If False, the model is assumed to be linearized at the current point already, e.g.,
+            by a previous call for other variables of interest.
 
         Returns
         -------
@@ -280,10 +448,22 @@ class Driver(object):
         """
         prob = self._problem
 
+        # Skip the derivatives of the inactive entries of constraints for the optimizers
+        # that can make do without them.
+        active_rows = None
+        if self.supports['active_set'] and global_names and of is not None:
+            active_rows = self._get_active_rows(of)
+            # later calls at the same point add to the active set
+            if linearize:
+                self._active_rows = active_rows
+            else:
+                self._active_rows.update(active_rows)
+
         if return_format == 'dict':
 
             derivs = prob._compute_total_derivs(of=of, wrt=wrt, return_format=return_format,
-                                                global_names=global_names)
+                                                global_names=global_names,
+                                                active_rows=active_rows, linearize=linearize)
 
             for okey, oval in iteritems(derivs):
                 for ikey, val in iteritems(oval):
@@ -306,7 +486,8 @@ class Driver(object):
 
             # Compute the derivatives in dict format, and then convert to array.
             derivs = prob._compute_total_derivs(of=of, wrt=wrt, return_format='dict',
-                                                global_names=global_names)
+                                                global_names=global_names,
+                                                active_rows=active_rows, linearize=linearize)
 
             # Use sizes pre-computed in derivs for ease
             osize = 0
@@ -204,7 +204,7 @@ class ExplicitComponent(Component):
 
         return bool(failed), 0., 0.
 
-    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None):
+    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None, rel_systems=None):
         """
         Compute jac-vec product. The model is assumed to be in a scaled state.
 
@@ -220,6 +220,9 @@ class ExplicitComponent(Component):
         scope_in : set or None
             Set of absolute input names in the scope of this mat-vec product.
             If None, all are in the scope.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
         """
         for vec_name in vec_names:
             with self._matvec_context(vec_name, scope_out, scope_in, mode) as vecs:
@@ -237,7 +240,7 @@ class ExplicitComponent(Component):
                                                 d_inputs, d_residuals, mode)
                     d_residuals *= -1.0
 
-    def _solve_linear(self, vec_names, mode):
+    def _solve_linear(self, vec_names, mode, rel_systems=None):
         """
         Apply inverse jac product. The model is assumed to be in a scaled state.
 
@@ -247,6 +250,9 @@ class ExplicitComponent(Component):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
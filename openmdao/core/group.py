@@ -21,7 +21,7 @@ from openmdao.solvers.nonlinear.nonlinear_runonce import NonLinearRunOnce
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
 from openmdao.utils.array_utils import convert_neg
 from openmdao.utils.general_utils import warn_deprecation
-from openmdao.utils.units import is_compatible
+from openmdao.utils.units import is_compatible, get_conversion
 
 
 class Group(System):
@@ -386,6 +386,7 @@ class Group(System):
                     self.comm.Allgather(
                         sizes_byset[type_][set_name][iproc, :], sizes_byset[type_][set_name])
 
+        self._setup_var_offsets()
         self._setup_global_shapes()
 
     def _setup_global_connections(self, recurse=True, conns=None):
@@ -543,6 +544,18 @@ class Group(System):
             for myproc_global_abs_in2out in gathered:
                 global_abs_in2out.update(myproc_global_abs_in2out)
 
+        # Compute the unit conversion of each connection once, reusing those of subsystems.
+        global_abs_in2conv = self._conn_global_abs_in2conv
+        for subsys in self._subsystems_myproc:
+            global_abs_in2conv.update(subsys._conn_global_abs_in2conv)
+
+        for abs_in, abs_out in iteritems(global_abs_in2out):
+            if abs_in not in global_abs_in2conv:
+                out_units = allprocs_abs2meta_out[abs_out]['units']
+                in_units = allprocs_abs2meta_in[abs_in]['units']
+                if out_units and in_units:
+                    global_abs_in2conv[abs_in] = get_conversion(out_units, in_units)
+
     def _setup_connections(self, recurse=True):
         """
         Compute dict of all implicit and explicit connections owned by this system.
@@ -601,6 +614,18 @@ class Group(System):
         subsystems_var_range = self._subsystems_var_range
         subsystems_var_range_byset = self._subsystems_var_range_byset
 
+        # cumsizes[type_][i] is the total size of the first i variables on this proc.
+        cumsizes = {}
+        cumsizes_byset = {}
+        for type_ in ['input', 'output']:
+            cumsizes[type_] = np.append(self._var_offsets[type_][iproc, :],
+                                        np.sum(self._var_sizes[type_][iproc, :]))
+            cumsizes_byset[type_] = {}
+            for set_name in self._var_set2iset[type_]:
+                cumsizes_byset[type_][set_name] = np.append(
+                    self._var_offsets_byset[type_][set_name][iproc, :],
+                    np.sum(self._var_sizes_byset[type_][set_name][iproc, :]))
+
         for ind, subsys in enumerate(self._subsystems_myproc):
             sub_ext_num_vars = {}
             sub_ext_sizes = {}
@@ -610,8 +635,8 @@ class Group(System):
             for type_ in ['input', 'output']:
                 num = self._num_var[type_]
                 idx1, idx2 = subsystems_var_range[type_][ind]
-                size1 = np.sum(self._var_sizes[type_][iproc, :idx1])
-                size2 = np.sum(self._var_sizes[type_][iproc, idx2:])
+                size1 = cumsizes[type_][idx1]
+                size2 = cumsizes[type_][-1] - cumsizes[type_][idx2]
 
                 sub_ext_num_vars[type_] = (
                     ext_num_vars[type_][0] + idx1,
@@ -627,8 +652,9 @@ class Group(System):
                 for set_name in self._var_set2iset[type_]:
                     num = self._num_var_byset[type_][set_name]
                     idx1, idx2 = subsystems_var_range_byset[type_][set_name][ind]
-                    size1 = np.sum(self._var_sizes_byset[type_][set_name][iproc, :idx1])
-                    size2 = np.sum(self._var_sizes_byset[type_][set_name][iproc, idx2:])
+                    size1 = cumsizes_byset[type_][set_name][idx1]
+                    size2 = cumsizes_byset[type_][set_name][-1] - \
+                        cumsizes_byset[type_][set_name][idx2]
 
                     sub_ext_num_vars_byset[type_][set_name] = (
                         ext_num_vars_byset[type_][set_name][0] + idx1,
@@ -693,9 +719,19 @@ class Group(System):
         allprocs_abs2idx_byset_out = self._var_allprocs_abs2idx_byset['output']
         sizes_byset_in = self._var_sizes_byset['input']
         sizes_byset_out = self._var_sizes_byset['output']
+        offsets_byset_in = self._var_offsets_byset['input']
+        offsets_byset_out = self._var_offsets_byset['output']
         set2iset_in = self._var_set2iset['input']
         set2iset_out = self._var_set2iset['output']
 
+        # Starting index of each proc's part of each var_set, in iproc-then-ivar ordering
+        proc_offsets_byset = {}
+        for type_ in ['input', 'output']:
+            proc_offsets_byset[type_] = {}
+            for set_name, sizes in iteritems(self._var_sizes_byset[type_]):
+                proc_sizes = np.sum(sizes, axis=1)
+                proc_offsets_byset[type_][set_name] = np.cumsum(proc_sizes) - proc_sizes
+
         # Loop through all explicit / implicit connections owned by this system
         for abs_in, abs_out in iteritems(self._conn_abs_in2out):
 
@@ -712,9 +748,13 @@ class Group(System):
                 idx_byset_in = allprocs_abs2idx_byset_in[abs_in]
                 idx_byset_out = allprocs_abs2idx_byset_out[abs_out]
 
-                # Get the sizes (byset) array
+                # Get the sizes and offsets (byset) arrays
                 sizes_in = sizes_byset_in[set_name_in]
                 sizes_out = sizes_byset_out[set_name_out]
+                offsets_in = offsets_byset_in[set_name_in]
+                offsets_out = offsets_byset_out[set_name_out]
+                proc_offsets_in = proc_offsets_byset['input'][set_name_in]
+                proc_offsets_out = proc_offsets_byset['output'][set_name_out]
 
                 # Read in and process src_indices
                 shape_in = meta_in['shape']
@@ -757,17 +797,16 @@ class Group(System):
                     # + np.sum(out_sizes[iproc, :idx_byset_out])
                     # + inds
                     offset = -ind1
-                    offset += np.sum(sizes_out[:iproc, :])
-                    offset += np.sum(sizes_out[iproc, :idx_byset_out])
+                    offset += proc_offsets_out[iproc]
+                    offset += offsets_out[iproc, idx_byset_out]
                     output_inds[on_iproc] = src_indices[on_iproc] + offset
 
                     ind1 += sizes_out[iproc, idx_byset_out]
 
                 # 2. Compute the input indices
                 iproc = self.comm.rank
-                ind1 = ind2 = np.sum(sizes_in[:iproc, :])
-                ind1 += np.sum(sizes_in[iproc, :idx_byset_in])
-                ind2 += np.sum(sizes_in[iproc, :idx_byset_in + 1])
+                ind1 = proc_offsets_in[iproc] + offsets_in[iproc, idx_byset_in]
+                ind2 = ind1 + sizes_in[iproc, idx_byset_in]
                 input_inds = np.arange(ind1, ind2)
 
                 # Now the indices are ready - input_inds, output_inds
@@ -1122,7 +1161,7 @@ class Group(System):
 
         return self._nonlinear_solver.solve()
 
-    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None):
+    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None, rel_systems=None):
         """
         Compute jac-vec product. The model is assumed to be in a scaled state.
 
@@ -1138,6 +1177,9 @@ class Group(System):
         scope_in : set or None
             Set of absolute input names in the scope of this mat-vec product.
             If None, all are in the scope.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
         """
         with self.jacobian_context() as J:
             # Use global Jacobian
@@ -1153,13 +1195,14 @@ class Group(System):
                         self._transfer(vec_name, mode)
 
                 for subsys in self._subsystems_myproc:
-                    subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+                    if rel_systems is None or subsys.pathname in rel_systems:
+                        subsys._apply_linear(vec_names, mode, scope_out, scope_in, rel_systems)
 
                 if mode == 'rev':
                     for vec_name in vec_names:
                         self._transfer(vec_name, mode)
 
-    def _solve_linear(self, vec_names, mode):
+    def _solve_linear(self, vec_names, mode, rel_systems=None):
         """
         Apply inverse jac product. The model is assumed to be in a scaled state.
 
@@ -1169,6 +1212,9 @@ class Group(System):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -1179,7 +1225,7 @@ class Group(System):
         float
             absolute error.
         """
-        return self._linear_solver.solve(vec_names, mode)
+        return self._linear_solver.solve(vec_names, mode, rel_systems)
 
     def _linearize(self, do_nl=True, do_ln=True):
         """
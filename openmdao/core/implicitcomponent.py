@@ -65,7 +65,7 @@ class ImplicitComponent(Component):
             else:
                 return result
 
-    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None):
+    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None, rel_systems=None):
         """
         Compute jac-vec product. The model is assumed to be in a scaled state.
 
@@ -81,6 +81,9 @@ class ImplicitComponent(Component):
         scope_in : set or None
             Set of absolute input names in the scope of this mat-vec product.
             If None, all are in the scope.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
         """
         for vec_name in vec_names:
             with self._matvec_context(vec_name, scope_out, scope_in, mode) as vecs:
@@ -96,7 +99,7 @@ class ImplicitComponent(Component):
                     self.apply_linear(self._inputs, self._outputs,
                                       d_inputs, d_outputs, d_residuals, mode)
 
-    def _solve_linear(self, vec_names, mode):
+    def _solve_linear(self, vec_names, mode, rel_systems=None):
         """
         Apply inverse jac product. The model is assumed to be in a scaled state.
 
@@ -106,6 +109,9 @@ class ImplicitComponent(Component):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -117,7 +123,7 @@ class ImplicitComponent(Component):
             relative error.
         """
         if self._linear_solver is not None:
-            return self._linear_solver.solve(vec_names, mode)
+            return self._linear_solver.solve(vec_names, mode, rel_systems)
         else:
             failed = False
             abs_errors = []
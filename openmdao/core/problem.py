@@ -5,7 +5,7 @@ from collections import OrderedDict, defaultdict, namedtuple
 from itertools import product
 import sys
 
-from six import iteritems, iterkeys
+from six import iteritems, iterkeys, itervalues
 from six.moves import range
 
 import numpy as np
@@ -19,10 +19,15 @@ from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.group import Group
 from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.error_checking.check_config import check_config
+from openmdao.solvers.solver import LinearSolver
 
+from openmdao.utils.class_util import overrides_method
+from openmdao.utils.coloring import get_simul_coloring
 from openmdao.utils.general_utils import warn_deprecation
 from openmdao.utils.mpi import MPI, FakeComm
+from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.graph_utils import all_connected_edges
+from openmdao.utils.instrumentation import Instrumentation
 from openmdao.vectors.default_vector import DefaultVector
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -48,6 +53,11 @@ class Problem(object):
     driver : <Driver>
         Slot for the driver. The default driver is `Driver`, which just runs
         the model once.
+    options : <OptionsDictionary>
+        Dictionary with general options for the problem.
+    instrumentation : <Instrumentation> or None
+        Counters and timers of the systems and solvers, installed during setup
+        when the 'instrument' option is True.
     _mode : 'fwd' or 'rev'
         Derivatives calculation mode, 'fwd' for forward, and 'rev' for
         reverse (adjoint).
@@ -96,6 +106,12 @@ class Problem(object):
         self.comm = comm
         self.driver = Driver()
 
+        self.options = OptionsDictionary()
+        self.options.declare('instrument', type_=bool, default=False,
+                             desc='Whether to count and time the calls to the main methods '
+                                  'of the systems and solvers in the model.')
+        self.instrumentation = None
+
         self._use_ref_vector = use_ref_vector
         self._solver_print_cache = []
 
@@ -276,9 +292,17 @@ class Problem(object):
             msg = "Unsupported mode: '%s'" % mode
             raise ValueError(msg)
 
+        if self.instrumentation is not None:
+            self.instrumentation.remove()
+            self.instrumentation = None
+
         model._setup(comm, vector_class, 'full', force_alloc_complex=force_alloc_complex)
         self.driver._setup_driver(self)
 
+        if self.options['instrument']:
+            self.instrumentation = Instrumentation(comm)
+            self.instrumentation.install(model)
+
         # TODO: fix this so it computes the proper type based on sizes of VOIs
         if mode == 'auto':
             mode = 'rev'
@@ -616,7 +640,7 @@ class Problem(object):
         return totals
 
     def _compute_total_derivs(self, of=None, wrt=None, return_format='flat_dict',
-                              global_names=True):
+                              global_names=True, active_rows=None, linearize=True):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
 
@@ -633,6 +657,13 @@ class Problem(object):
             returns them in a dictionary whose keys are tuples of form (of, wrt).
         global_names : bool
             Set to True when passing in global names to skip some translation steps.
+        active_rows : dict or None
+            Boolean masks of the entries of the 'of' variables whose derivatives are needed,
+            keyed by absolute name. The rows of the other entries are zero, and in rev mode
+            they are not solved for. Ignored under MPI.
+        linearize : bool
+            If False, the model is assumed to be linearized at the current point already, e.g.,
+            by a previous call for other variables of interest.
 
         Returns
         -------
@@ -663,9 +694,6 @@ class Problem(object):
         # TODO: Support parallel adjoint and parallel forward derivatives
         #       Aside: how are they specified, and do we have to pick up any
         #       that are missed?
-        # TODO: Support constraint sparsity (i.e., skip in/out that are not
-        #       relevant for this constraint) (desvars too?)
-        # TODO: Don't calculate for inactive constraints
         # -------------------------------------------------------------------
 
         # Prepare model for calculation by cleaning out the derivatives
@@ -683,7 +711,8 @@ class Problem(object):
             vec_dresid[subname].set_const(0.0)
 
         # Linearize Model
-        model._linearize()
+        if linearize:
+            model._linearize()
 
         # Create data structures (and possibly allocate space) for the total
         # derivatives that we will return.
@@ -711,6 +740,9 @@ class Problem(object):
             wrt = [model._var_allprocs_prom2abs_list['output'][name][0]
                    for name in oldwrt]
 
+        if not active_rows or nproc > 1:
+            active_rows = None
+
         if fwd:
             input_list, output_list = wrt, of
             old_input_list, old_output_list = oldwrt, oldof
@@ -760,6 +792,8 @@ class Problem(object):
                         ikey = old_input_list[icount]
                         totals[okey][ikey] = -approx_jac[output_name, input_name]
 
+            if active_rows is not None:
+                self._zero_inactive_rows(totals, active_rows, of, oldof, return_format)
             return totals
 
         # Solve for derivs using linear solver.
@@ -809,6 +843,22 @@ class Problem(object):
 
         vec_names = sorted(set(inp2rhs_name.values()))
 
+        # Use simultaneous derivatives if the driver has the sparsity of the total jacobian.
+        if nproc == 1 and vec_names == ['linear']:
+            colors = self._get_simul_coloring(input_list, output_list, fwd)
+            if colors is not None:
+                self._compute_colored_totals(colors, totals, return_format, fwd,
+                                             input_list, output_list,
+                                             old_input_list, old_output_list, active_rows)
+                if fwd and active_rows is not None:
+                    self._zero_inactive_rows(totals, active_rows, of, oldof, return_format)
+                return totals
+
+        # Solvers that can handle a block of right-hand sides (e.g., DirectSolver) get all the
+        # columns for a variable of interest in a single call instead of one solve per column.
+        multi_rhs = (nproc == 1 and model._linear_solver is not None and
+                     overrides_method('_solve_multi', model._linear_solver, LinearSolver))
+
         for rhs_name, vois in iteritems(voi_lists):
             voi_info = {}
             max_len = 0
@@ -852,6 +902,35 @@ class Problem(object):
 
                 voi_info[input_name] = (dinputs, doutputs, irange, loc_size, start, end, dup)
 
+            # In rev mode, the entries of the constraints that aren't active are not solved for.
+            inactive = {}
+            if active_rows is not None and not fwd:
+                for input_name, old_input_name in vois:
+                    if input_name in active_rows:
+                        mask = active_rows[input_name]
+                        inactive[input_name] = [not mask[min(i, len(mask) - 1)]
+                                                for i in range(max_len)]
+            if inactive and len(inactive) == len(vois):
+                solve_idxs = [i for i in range(max_len)
+                              if not all(skip[i] for skip in itervalues(inactive))]
+            else:
+                solve_idxs = list(range(max_len))
+
+            # Restrict the linear solves to the systems that lie between the current
+            # variables of interest and the opposite ones.
+            rel_systems = None
+            if not test_mode:
+                rel_systems = set()
+                for input_name, old_input_name in vois:
+                    if '@all' not in relevant[input_name]:
+                        rel_systems = None
+                        break
+                    for path in relevant[input_name]['@all'][2]:
+                        # Include all ancestor groups so the recursion can reach the component.
+                        parts = path.split('.')
+                        for j in range(1, len(parts) + 1):
+                            rel_systems.add('.'.join(parts[:j]))
+
             loc_idxs = defaultdict(lambda: -1)
 
             # at this point, we know that for all vars in the current
@@ -859,25 +938,31 @@ class Problem(object):
             # over the *size* of the indices and use the loop index to look
             # up the actual indices for the current members of the group
             # of interest.
+            vecname = inp2rhs_name[vois[0][0]]
+            sol_cols = {}
+            if multi_rhs and solve_idxs:
+                # Seed all of the columns up front and hand them to the solver as one block.
+                rhs = np.empty((input_vec[vecname]._length, len(solve_idxs)))
+                for col, i in enumerate(solve_idxs):
+                    self._seed_rhs(i, vois, voi_info)
+                    input_vec[vecname].get_data(rhs[:, col])
+                sol = model._linear_solver._solve_multi(vecname, mode, rhs)
+                sol_cols = {i: col for col, i in enumerate(solve_idxs)}
+
+            solve_idxs = set(solve_idxs)
             for i in range(max_len):
-                # this sets dinputs for the current rhs_group to 0
-                voi_info[vois[0][0]][0].set_const(0.0)
-
-                for input_name, old_input_name in vois:
-                    dinputs, doutputs, idxs, loc_size, start, end, dup = voi_info[input_name]
-                    if i >= len(idxs):
-                        idx = idxs[-1]  # reuse the last index
-                    else:
-                        idx = idxs[i]
-
-                    if idx < 0:
-                        idx += end
-                    if start <= idx < end and input_name in dinputs._views_flat:
-                        # Dictionary access returns a scaler for 1d input, and we
-                        # need a vector for clean code, so use _views_flat.
-                        dinputs._views_flat[input_name][idx - start] = 1.0
-
-                model._solve_linear(vec_names, mode)
+                if multi_rhs:
+                    if i in sol_cols:
+                        output_vec[vecname].set_data(sol[:, sol_cols[i]])
+                elif i in solve_idxs:
+                    if rel_systems is not None:
+                        # irrelevant systems are skipped, so clear out any values
+                        # left over from previous solves.
+                        output_vec[vecname].set_const(0.0)
+                        vec_dinput[vecname].set_const(0.0)
+
+                    self._seed_rhs(i, vois, voi_info)
+                    model._solve_linear(vec_names, mode, rel_systems)
 
                 for input_name, old_input_name in vois:
                     dinputs, doutputs, idxs, loc_size, start, end, dup = voi_info[input_name]
@@ -904,8 +989,9 @@ class Problem(object):
                             if 'indices' in out_voi_meta:
                                 out_idxs = out_voi_meta['indices']
 
-                        if not test_mode and input_name not in relevant[output_name]:
-                            # irrelevant output, just give zeros
+                        if (not test_mode and input_name not in relevant[output_name]) or \
+                           (input_name in inactive and inactive[input_name][i]):
+                            # irrelevant output or inactive entry, just give zeros
                             if out_idxs is None:
                                 out_var_idx = model._var_allprocs_abs2idx['output'][output_name]
                                 deriv_val = np.zeros(sizes[iproc, out_var_idx])
@@ -970,8 +1056,239 @@ class Problem(object):
                         else:
                             raise RuntimeError("unsupported return format")
 
+        if fwd and active_rows is not None:
+            self._zero_inactive_rows(totals, active_rows, of, oldof, return_format)
+
         return totals
 
+    def _zero_inactive_rows(self, totals, active_rows, of, oldof, return_format):
+        """
+        Zero the rows of the total derivatives of the entries that aren't active.
+
+        Parameters
+        ----------
+        totals : dict
+            total derivatives, modified in place.
+        active_rows : dict
+            boolean masks of the active entries, keyed by absolute name.
+        of : list of str
+            absolute names of the variables whose derivatives were computed.
+        oldof : list of str
+            names of the same variables, as used for the keys of totals.
+        return_format : str
+            'flat_dict' or 'dict'.
+        """
+        for name, oldname in zip(of, oldof):
+            if name not in active_rows:
+                continue
+
+            if return_format == 'flat_dict':
+                subjacs = [val for key, val in iteritems(totals) if key[0] == oldname]
+            else:
+                subjacs = itervalues(totals[oldname])
+
+            inactive = np.logical_not(active_rows[name])
+            for subjac in subjacs:
+                subjac[inactive] = 0.0
+
+    def _get_simul_coloring(self, input_list, output_list, fwd):
+        """
+        Return the coloring to use for these variables of interest, if any.
+
+        Parameters
+        ----------
+        input_list : list of str
+            absolute names of the variables being seeded.
+        output_list : list of str
+            absolute names of the variables being solved for.
+        fwd : bool
+            True if solving in fwd mode.
+
+        Returns
+        -------
+        list of ndarray or None
+            indices of the seeded variables for each color, or None if the driver has
+            no sparsity that covers these variables.
+        """
+        driver = self.driver
+        sparsity = driver._total_jac_sparsity
+        if sparsity is None:
+            return None
+
+        if fwd:
+            of, wrt = output_list, input_list
+        else:
+            of, wrt = input_list, output_list
+
+        for okey in of:
+            if okey not in sparsity:
+                return None
+            for ikey in wrt:
+                if ikey not in sparsity[okey]:
+                    return None
+
+        key = (self._mode, tuple(of), tuple(wrt))
+        if key not in driver._simul_colorings:
+            driver._simul_colorings[key] = get_simul_coloring(sparsity, of, wrt,
+                                                              'fwd' if fwd else 'rev')
+
+        return driver._simul_colorings[key]
+
+    def _compute_colored_totals(self, colors, totals, return_format, fwd, input_list,
+                                output_list, old_input_list, old_output_list, active_rows=None):
+        """
+        Compute total derivatives with one linear solve per color.
+
+        Every index of a color is seeded at once and the sparsity of the total jacobian is
+        used to scatter the combined solution back to the individual indices.
+
+        Parameters
+        ----------
+        colors : list of ndarray
+            indices of the seeded variables for each color.
+        totals : dict
+            total derivatives, filled in place.
+        return_format : str
+            'flat_dict' or 'dict'.
+        fwd : bool
+            True if solving in fwd mode.
+        input_list : list of str
+            absolute names of the variables being seeded.
+        output_list : list of str
+            absolute names of the variables being solved for.
+        old_input_list : list of str
+            names of the variables being seeded, as used for the keys of totals.
+        old_output_list : list of str
+            names of the variables being solved for, as used for the keys of totals.
+        active_rows : dict or None
+            in rev mode, boolean masks of the indices of the seeded variables to solve for,
+            keyed by absolute name. The other indices are not seeded.
+        """
+        model = self.model
+        mode = self._mode
+        sparsity = self.driver._total_jac_sparsity
+        meta = model._var_allprocs_abs2meta['output']
+
+        if fwd:
+            dinputs = model._vectors['residual']['linear']
+            doutputs = model._vectors['output']['linear']
+            input_vois = self.driver._designvars
+            output_vois = self.driver._responses
+        else:
+            dinputs = model._vectors['output']['linear']
+            doutputs = model._vectors['residual']['linear']
+            input_vois = self.driver._responses
+            output_vois = self.driver._designvars
+
+        def get_idxs(name, vois):
+            idxs = vois[name].get('indices') if name in vois else None
+            if idxs is None:
+                return np.arange(meta[name]['global_size'])
+            idxs = np.array(idxs)
+            return np.where(idxs < 0, idxs + meta[name]['global_size'], idxs)
+
+        out_idxs = [get_idxs(name, output_vois) for name in output_list]
+
+        # map each seed index to its variable and position within it, and allocate the
+        # subjacobians.
+        seed2var = []
+        in_idxs = []
+        for icount, input_name in enumerate(input_list):
+            idxs = get_idxs(input_name, input_vois)
+            in_idxs.append(idxs)
+            seed2var.extend((icount, pos) for pos in range(len(idxs)))
+
+            for ocount, output_name in enumerate(output_list):
+                okey = old_output_list[ocount]
+                ikey = old_input_list[icount]
+                if fwd:
+                    subjac = np.zeros((len(out_idxs[ocount]), len(idxs)))
+                else:
+                    subjac = np.zeros((len(idxs), len(out_idxs[ocount])))
+
+                if return_format == 'flat_dict':
+                    totals[(okey, ikey) if fwd else (ikey, okey)] = subjac
+                elif return_format == 'dict':
+                    if fwd:
+                        totals[okey][ikey] = subjac
+                    else:
+                        totals[ikey][okey] = subjac
+                else:
+                    raise RuntimeError("unsupported return format")
+
+        if active_rows is not None and not fwd:
+            colors = [[seed for seed in color
+                       if input_list[seed2var[seed][0]] not in active_rows or
+                       active_rows[input_list[seed2var[seed][0]]][seed2var[seed][1]]]
+                      for color in colors]
+            colors = [color for color in colors if color]
+
+        for color in colors:
+            dinputs.set_const(0.0)
+            for seed in color:
+                icount, pos = seed2var[seed]
+                dinputs._views_flat[input_list[icount]][in_idxs[icount][pos]] = 1.0
+
+            model._solve_linear(['linear'], mode)
+
+            for seed in color:
+                icount, pos = seed2var[seed]
+                input_name = input_list[icount]
+                ikey = old_input_list[icount]
+
+                for ocount, output_name in enumerate(output_list):
+                    okey = old_output_list[ocount]
+                    deriv_val = doutputs._views_flat[output_name][out_idxs[ocount]]
+
+                    # Only keep the entries this index contributes to; the rest come from
+                    # other indices of the same color.
+                    if fwd:
+                        nonzero = sparsity[output_name][input_name][:, pos]
+                    else:
+                        nonzero = sparsity[input_name][output_name][pos, :]
+
+                    if return_format == 'flat_dict':
+                        subjac = totals[(okey, ikey) if fwd else (ikey, okey)]
+                    elif fwd:
+                        subjac = totals[okey][ikey]
+                    else:
+                        subjac = totals[ikey][okey]
+
+                    if fwd:
+                        subjac[nonzero, pos] = deriv_val[nonzero]
+                    else:
+                        subjac[pos, nonzero] = deriv_val[nonzero]
+
+    def _seed_rhs(self, i, vois, voi_info):
+        """
+        Set the right-hand side for column i of the current group of variables of interest.
+
+        Parameters
+        ----------
+        i : int
+            index of the column being computed.
+        vois : list of (str, str)
+            (absolute name, original name) of the variables of interest in the group.
+        voi_info : dict
+            per-variable tuple of (dinputs, doutputs, idxs, loc_size, start, end, dup).
+        """
+        # this sets dinputs for the current rhs_group to 0
+        voi_info[vois[0][0]][0].set_const(0.0)
+
+        for input_name, old_input_name in vois:
+            dinputs, doutputs, idxs, loc_size, start, end, dup = voi_info[input_name]
+            if i >= len(idxs):
+                idx = idxs[-1]  # reuse the last index
+            else:
+                idx = idxs[i]
+
+            if idx < 0:
+                idx += end
+            if start <= idx < end and input_name in dinputs._views_flat:
+                # Dictionary access returns a scaler for 1d input, and we
+                # need a vector for clean code, so use _views_flat.
+                dinputs._views_flat[input_name][idx - start] = 1.0
+
     def set_solver_print(self, level=2, depth=1e99, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
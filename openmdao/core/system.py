@@ -6,6 +6,7 @@ from contextlib import contextmanager
 from collections import OrderedDict, Iterable
 from fnmatch import fnmatchcase
 from itertools import product
+from numbers import Number
 
 from six import iteritems, string_types
 from six.moves import range
@@ -20,7 +21,6 @@ from openmdao.utils.general_utils import \
     determine_adder_scaler, format_as_float_or_array, warn_deprecation
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
-from openmdao.utils.units import convert_units
 from openmdao.utils.array_utils import convert_neg
 
 
@@ -106,12 +106,20 @@ class System(object):
         owned by this system and num_var is the number of allprocs variables.
     _var_sizes_byset : {'input': dict of ndarray, 'output': dict of ndarray}
         Same as above, but by var_set name.
+    _var_offsets : {'input': ndarray, 'output': ndarray}
+        Array of the local starting index of each of this system's allprocs variables,
+        with the same shape as _var_sizes.
+    _var_offsets_byset : {'input': dict of ndarray, 'output': dict of ndarray}
+        Same as above, but by var_set name.
     #
     _manual_connections : dict
         Dictionary of input_name: (output_name, src_indices) connections.
     _conn_global_abs_in2out : {'abs_in': 'abs_out'}
         Dictionary containing all explicit & implicit connections owned by this system
         or any descendant system. The data is the same across all processors.
+    _conn_global_abs_in2conv : {'abs_in': (float, float)}
+        Unit conversion (factor, offset) from source to target units of each connection in
+        _conn_global_abs_in2out where both variables have units.
     _conn_abs_in2out : {'abs_in': 'abs_out'}
         Dictionary containing all explicit & implicit connections owned
         by this system only. The data is the same across all processors.
@@ -133,6 +141,11 @@ class System(object):
         Set of output variable absolute names not relevant for each vec_name.
     _excluded_vars_in : dict of set
         Set of input variable absolute names not relevant for each vec_name.
+    _scope_cache : dict
+        Cache of (scope_out, scope_in) frozensets keyed by the excluded subsystem or None.
+    _matvec_names_cache : dict
+        Cache of the (in_names, out_names, res_names) frozensets used in mat-vec products,
+        keyed by (vec_name, scope_out, scope_in).
     #
     _inputs : <Vector>
         The inputs vector; points to _vectors['input']['nonlinear'].
@@ -152,6 +165,9 @@ class System(object):
     #
     _scaling_vecs : dict of dict of Vectors
         First key is indicates vector type and coefficient, second key is vec_name.
+    _identity_scaling : set of (str, str)
+        Set of (vector type, vec_name) for which the scaling of this system's variables
+        is the identity, so that scaling and unscaling of those vectors can be skipped.
     #
     _nonlinear_solver : <NonlinearSolver>
         Nonlinear solver to be used for solve_nonlinear.
@@ -241,9 +257,12 @@ class System(object):
 
         self._var_sizes = {'input': None, 'output': None}
         self._var_sizes_byset = {'input': {}, 'output': {}}
+        self._var_offsets = {'input': None, 'output': None}
+        self._var_offsets_byset = {'input': {}, 'output': {}}
 
         self._manual_connections = {}
         self._conn_global_abs_in2out = {}
+        self._conn_global_abs_in2conv = {}
         self._conn_abs_in2out = {}
 
         self._ext_num_vars = {'input': (0, 0), 'output': (0, 0)}
@@ -254,6 +273,8 @@ class System(object):
         self._vectors = {'input': {}, 'output': {}, 'residual': {}}
         self._excluded_vars_out = set()
         self._excluded_vars_in = set()
+        self._scope_cache = {}
+        self._matvec_names_cache = {}
 
         self._inputs = None
         self._outputs = None
@@ -271,6 +292,7 @@ class System(object):
             ('residual', 'phys0'): {}, ('residual', 'phys1'): {},
             ('residual', 'norm0'): {}, ('residual', 'norm1'): {},
         }
+        self._identity_scaling = set()
 
         self._nonlinear_solver = None
         self._linear_solver = None
@@ -779,6 +801,20 @@ class System(object):
         """
         self._var_sizes = {'input': None, 'output': None}
         self._var_sizes_byset = {'input': {}, 'output': {}}
+        self._var_offsets = {'input': None, 'output': None}
+        self._var_offsets_byset = {'input': {}, 'output': {}}
+
+    def _setup_var_offsets(self):
+        """
+        Compute the arrays of local variable offsets from the arrays of variable sizes.
+        """
+        for type_ in ['input', 'output']:
+            sizes = self._var_sizes[type_]
+            self._var_offsets[type_] = np.cumsum(sizes, axis=1) - sizes
+
+            offsets_byset = self._var_offsets_byset[type_] = {}
+            for set_name, sizes in iteritems(self._var_sizes_byset[type_]):
+                offsets_byset[set_name] = np.cumsum(sizes, axis=1) - sizes
 
     def _setup_global_shapes(self):
         """
@@ -834,6 +870,7 @@ class System(object):
             Dictionary of connections passed down from parent group.
         """
         self._conn_global_abs_in2out = {}
+        self._conn_global_abs_in2conv = {}
 
     def _setup_connections(self, recurse=True):
         """
@@ -888,6 +925,8 @@ class System(object):
                                    'residual': OrderedDict()}
         self._excluded_vars_out = excl_out
         self._excluded_vars_in = excl_in
+        self._scope_cache = {}
+        self._matvec_names_cache = {}
 
         # Allocate complex if root vector was allocated complex.
         alloc_complex = root_vectors['output']['nonlinear']._alloc_complex
@@ -982,6 +1021,7 @@ class System(object):
 
         allprocs_abs2meta_out = self._var_allprocs_abs2meta['output']
         abs2meta_in = self._var_abs2meta['input']
+        in2conv = self._conn_global_abs_in2conv
 
         for vec_name in self._vectors['output']:
             vector_class = root_vectors['residual', 'phys0'][vec_name].__class__
@@ -1032,10 +1072,8 @@ class System(object):
                 meta_in = abs2meta_in[abs_in]
 
                 shape_out = meta_out['shape']
-                units_out = meta_out['units']
                 distrib_out = meta_out['distributed']
                 shape_in = meta_in['shape']
-                units_in = meta_in['units']
 
                 ref = meta_out['ref']
                 ref0 = meta_out['ref0']
@@ -1086,9 +1124,13 @@ class System(object):
                 #   b1 = d0 + d1 a1 - d0
                 #   b1 = g(a1) - g(0)
 
-                a0 = convert_units(ref0, units_out, units_in)
-                a1 = convert_units(ref - ref0, units_out, units_in) \
-                    - convert_units(0., units_out, units_in)
+                if abs_in in in2conv:
+                    factor, offset = in2conv[abs_in]
+                    a0 = (ref0 + offset) * factor
+                    a1 = (ref - ref0) * factor
+                else:
+                    a0 = ref0
+                    a1 = ref - ref0
                 vecs['input', 'phys0'][vec_name]._views[abs_in][:] = a0
                 vecs['input', 'phys1'][vec_name]._views[abs_in][:] = a1
                 vecs['input', 'norm0'][vec_name]._views[abs_in][:] = -a0 / a1
@@ -1097,6 +1139,16 @@ class System(object):
         for subsys in self._subsystems_myproc:
             subsys._setup_scaling(root_vectors)
 
+        # The scaling of all variables in this system is now final: the ancestors have set the
+        # entries of inputs connected to sources outside of it, and the subsystems those of
+        # the connections they own.
+        self._identity_scaling = identity = set()
+        for vec_name in self._vectors['output']:
+            for type_ in ('input', 'output', 'residual'):
+                if np.all(vecs[type_, 'phys1'][vec_name].get_data() == 1.0) and \
+                        np.all(vecs[type_, 'phys0'][vec_name].get_data() == 0.0):
+                    identity.add((type_, vec_name))
+
     def _setup_transfers(self, recurse=True):
         """
         Compute all transfers that are owned by this system.
@@ -1218,9 +1270,23 @@ class System(object):
             self._outputs._views[abs_name][:] = meta['value']
 
     def _scale_vec(self, vec, key, scale_to):
-        scal_vecs = self._scaling_vecs
+        """
+        Scale a vector in place, unless the scaling of this system is the identity.
+
+        Parameters
+        ----------
+        vec : <Vector>
+            the vector to scale.
+        key : str
+            'input', 'output', or 'residual'.
+        scale_to : str
+            'phys' or 'norm'.
+        """
         vec_name = vec._name
+        if (key, vec_name) in self._identity_scaling:
+            return
 
+        scal_vecs = self._scaling_vecs
         vec.elem_mult(scal_vecs[key, scale_to + '1'][vec_name])
         if vec_name == 'nonlinear':
             vec += scal_vecs[key, scale_to + '0'][vec_name]
@@ -1366,17 +1432,40 @@ class System(object):
         return maps
 
     def _get_scope(self, excl_sub=None):
+        """
+        Find the input and output variables that are needed for a particular matvec product.
+
+        The result is computed once per excluded subsystem and cached.
+
+        Parameters
+        ----------
+        excl_sub : <System> or None
+            A subsystem whose variables should be excluded from the matvec product.
+            If None, no subsystem is excluded.
+
+        Returns
+        -------
+        frozenset
+            Set of absolute output names in the scope of the matvec product.
+        frozenset
+            Set of absolute input names in the scope of the matvec product.
+        """
+        try:
+            return self._scope_cache[excl_sub]
+        except KeyError:
+            pass
+
         if excl_sub is None:
             # All myproc outputs
-            scope_out = set(self._var_abs_names['output'])
+            scope_out = frozenset(self._var_abs_names['output'])
 
             # All myproc inputs connected to an output in this system
-            scope_in = set(self._conn_global_abs_in2out.keys()) \
-                & set(self._var_abs_names['input'])
+            scope_in = frozenset(self._conn_global_abs_in2out.keys()) \
+                & frozenset(self._var_abs_names['input'])
         else:
             # All myproc outputs not in excl_sub
-            scope_out = set(self._var_abs_names['output']) \
-                - set(excl_sub._var_abs_names['output'])
+            scope_out = frozenset(self._var_abs_names['output']) \
+                - frozenset(excl_sub._var_abs_names['output'])
 
             # All myproc inputs connected to an output in this system but not in excl_sub
             scope_in = []
@@ -1386,8 +1475,9 @@ class System(object):
 
                     if abs_out not in excl_sub._var_allprocs_abs2idx['output']:
                         scope_in.append(abs_in)
-            scope_in = set(scope_in)
+            scope_in = frozenset(scope_in)
 
+        self._scope_cache[excl_sub] = scope_out, scope_in
         return scope_out, scope_in
 
     @property
@@ -1517,16 +1607,27 @@ class System(object):
                 d_inputs.set_const(0.0)
                 d_outputs.set_const(0.0)
 
-        excl_out = self._excluded_vars_out[vec_name]
-        excl_in = self._excluded_vars_in[vec_name]
+        # Scopes from _get_scope are frozensets, so the names can be cached for them.
+        cacheable = (scope_out is None or isinstance(scope_out, frozenset)) and \
+            (scope_in is None or isinstance(scope_in, frozenset))
+        key = (vec_name, scope_out, scope_in)
+
+        if cacheable and key in self._matvec_names_cache:
+            in_names, out_names, res_names = self._matvec_names_cache[key]
+        else:
+            excl_out = self._excluded_vars_out[vec_name]
+            excl_in = self._excluded_vars_in[vec_name]
 
-        res_names = set(self._var_abs_names['output']) - excl_out
-        out_names = set(self._var_abs_names['output']) - excl_out
-        in_names = set(self._var_abs_names['input']) - excl_in
-        if scope_out is not None:
-            out_names = out_names & scope_out
-        if scope_in is not None:
-            in_names = in_names & scope_in
+            res_names = frozenset(self._var_abs_names['output']) - excl_out
+            out_names = res_names
+            in_names = frozenset(self._var_abs_names['input']) - excl_in
+            if scope_out is not None:
+                out_names = out_names & scope_out
+            if scope_in is not None:
+                in_names = in_names & scope_in
+
+            if cacheable:
+                self._matvec_names_cache[key] = in_names, out_names, res_names
 
         d_inputs._names = in_names
         d_outputs._names = out_names
@@ -1847,7 +1948,8 @@ class System(object):
 
     def add_response(self, name, type_, lower=None, upper=None, equals=None,
                      ref=None, ref0=None, indices=None, index=None,
-                     adder=None, scaler=None, linear=False, rhs_group=None):
+                     adder=None, scaler=None, linear=False, rhs_group=None, wrt=None,
+                     active_tol=None):
         r"""
         Add a response variable to this system.
 
@@ -1884,6 +1986,12 @@ class System(object):
         rhs_group : string
             If specified, this design var will be grouped for parallel derivative
             calculations with other variables sharing the same rhs_group.
+        wrt : sequence of str or None
+            Names of the design variables that the constraint depends on, as seen from
+            this system. If None, drivers that need them infer them from the model.
+        active_tol : float or None
+            If specified, drivers that support an active set only compute the derivatives
+            of the constraint entries that are within this distance of a bound.
 
         Notes
         -----
@@ -1936,6 +2044,20 @@ class System(object):
             msg = "If specified, indices must be a sequence of integers."
             raise ValueError(msg)
 
+        if wrt is not None:
+            if isinstance(wrt, string_types):
+                wrt = [wrt]
+            elif not (isinstance(wrt, Iterable) and
+                      all(isinstance(item, string_types) for item in wrt)):
+                msg = "If specified, wrt must be a sequence of design variable names."
+                raise ValueError(msg)
+            wrt = list(wrt)
+
+        if active_tol is not None:
+            if not isinstance(active_tol, Number) or active_tol < 0:
+                msg = "If specified, active_tol must be a nonnegative number."
+                raise ValueError(msg)
+
         # Convert lower to ndarray/float as necessary
         lower = format_as_float_or_array('lower', lower, val_if_none=-sys.float_info.max,
                                          flatten=True)
@@ -1989,6 +2111,8 @@ class System(object):
             resp['upper'] = upper
             resp['equals'] = equals
             resp['linear'] = linear
+            resp['wrt'] = wrt
+            resp['active_tol'] = active_tol
             if indices is not None:
                 resp['size'] = len(indices)
                 indices = np.atleast_1d(indices)
@@ -2002,7 +2126,8 @@ class System(object):
 
     def add_constraint(self, name, lower=None, upper=None, equals=None,
                        ref=None, ref0=None, adder=None, scaler=None,
-                       indices=None, linear=False, rhs_group=None):
+                       indices=None, linear=False, rhs_group=None, wrt=None,
+                       active_tol=None):
         r"""
         Add a constraint variable to this system.
 
@@ -2035,6 +2160,17 @@ class System(object):
         rhs_group : string
             If specified, this design var will be grouped for parallel derivative
             calculations with other variables sharing the same rhs_group.
+        wrt : sequence of str or None
+            Names of the design variables that the constraint depends on, as seen from
+            this system. Drivers that support constraint sparsity, such as pyOptSparseDriver,
+            only compute and pass on the derivatives with respect to these. If None, they
+            are inferred from the connections in the model.
+        active_tol : float or None
+            If specified, drivers that support an active set only compute the derivatives
+            of the entries of the constraint that are within this distance of a bound, in
+            the scaled units seen by the driver, and return zeros for the others. In rev
+            mode this saves one linear solve per inactive entry. Equality constraints are
+            always active.
 
         Notes
         -----
@@ -2045,7 +2181,7 @@ class System(object):
         self.add_response(name=name, type_='con', lower=lower, upper=upper,
                           equals=equals, scaler=scaler, adder=adder, ref=ref,
                           ref0=ref0, indices=indices, linear=linear,
-                          rhs_group=rhs_group)
+                          rhs_group=rhs_group, wrt=wrt, active_tol=active_tol)
 
     def add_objective(self, name, ref=None, ref0=None, index=None,
                       adder=None, scaler=None, rhs_group=None):
@@ -2181,6 +2317,19 @@ class System(object):
             msg = "Output not found for response {0} in system '{1}'."
             raise RuntimeError(msg.format(str(err), self.pathname))
 
+        # Convert the design variables of the constraints to absolute names. The metadata
+        # is copied so that the names given by the user are kept.
+        for name, data in iteritems(out):
+            if data.get('wrt') is not None:
+                try:
+                    wrt = [prom2abs[dv][0] for dv in data['wrt']]
+                except KeyError as err:
+                    msg = "Output not found for design variable {0} of constraint '{1}' " \
+                          "in system '{2}'."
+                    raise RuntimeError(msg.format(str(err), data['name'], self.pathname))
+                out[name] = data = data.copy()
+                data['wrt'] = wrt
+
         # Size them all
         iproc = self.comm.rank
         for name in out:
@@ -2579,7 +2728,7 @@ class System(object):
         """
         pass
 
-    def _apply_linear(self, vec_names, mode, var_inds=None):
+    def _apply_linear(self, vec_names, mode, scope_out=None, scope_in=None, rel_systems=None):
         """
         Compute jac-vec product. The model is assumed to be in a scaled state.
 
@@ -2589,13 +2738,19 @@ class System(object):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
-        var_inds : [int, int, int, int] or None
-            ranges of variable IDs involved in this matrix-vector product.
-            The ordering is [lb1, ub1, lb2, ub2].
+        scope_out : set or None
+            Set of absolute output names in the scope of this mat-vec product.
+            If None, all are in the scope.
+        scope_in : set or None
+            Set of absolute input names in the scope of this mat-vec product.
+            If None, all are in the scope.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
         """
         pass
 
-    def _solve_linear(self, vec_names, mode):
+    def _solve_linear(self, vec_names, mode, rel_systems=None):
         """
         Apply inverse jac product. The model is assumed to be in a scaled state.
 
@@ -2605,6 +2760,9 @@ class System(object):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
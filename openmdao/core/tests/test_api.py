@@ -0,0 +1,58 @@
+""" Unit tests for the lazy imports of openmdao.api."""
+
+import sys
+import unittest
+import subprocess
+
+import openmdao.api
+from openmdao.devtools.import_time import time_import
+
+
+class TestAPI(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        # in a fresh process, so that no other test has imported the modules
+        script = "import sys; import openmdao.api; " \
+                 "from openmdao.utils import units; " \
+                 "print(type(units._UNIT_LIB).__name__); " \
+                 "print(' '.join(sorted(sys.modules)))"
+        out = subprocess.check_output([sys.executable, '-c', script]).decode().splitlines()
+
+        self.assertEqual(out[-2], '_DefaultLibrary')
+        imported = out[-1].split()
+        for module in ('openmdao.components.meta_model',
+                       'openmdao.surrogate_models.kriging',
+                       'openmdao.surrogate_models.multifi_cokriging',
+                       'openmdao.devtools.problem_viewer.problem_viewer',
+                       'openmdao.drivers.scipy_optimizer'):
+            self.assertNotIn(module, imported)
+
+    def test_lazy_access(self):
+        from openmdao.api import MetaModel, KrigingSurrogate, ScipyOptimizer, view_model
+        from openmdao.components.meta_model import MetaModel as MetaModelOrig
+
+        self.assertIs(MetaModel, MetaModelOrig)
+        self.assertIn('KrigingSurrogate', dir(openmdao.api))
+
+        with self.assertRaises(ImportError):
+            from openmdao.api import junk
+
+        self.assertFalse(hasattr(openmdao.api, 'junk'))
+
+    def test_import_star(self):
+        namespace = {}
+        exec('from openmdao.api import *', namespace)
+
+        for name in ('Problem', 'MetaModel', 'KrigingSurrogate', 'ScipyOptimizer', 'view_model'):
+            self.assertIn(name, namespace)
+        for name in ('os', 'sys', 'import_module', 'ModuleType'):
+            self.assertNotIn(name, namespace)
+
+    def test_time_import(self):
+        times = time_import('openmdao.api', num_runs=1)
+        self.assertEqual(len(times), 1)
+        self.assertGreater(times[0], 0.)
+
+
+if __name__ == "__main__":
+    unittest.main()
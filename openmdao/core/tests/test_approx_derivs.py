@@ -181,6 +181,74 @@ class TestGroupFiniteDifference(unittest.TestCase):
         assert_rel_error(self, Jfd['comp.y2', 'p1.x1'], -comp.JJ[2:4, 0:2], 1e-6)
         assert_rel_error(self, Jfd['comp.y2', 'p2.x2'], -comp.JJ[2:4, 2:4], 1e-6)
 
+    def test_arrray_comp_process_backend(self):
+
+        class DoubleArrayFD(DoubleArrayComp):
+
+            def compute_partials(self, inputs, outputs, partials):
+                """
+                Override deriv calculation.
+                """
+                pass
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x1', val=np.ones(2)))
+        model.add_subsystem('p2', IndepVarComp('x2', val=np.ones(2)))
+        comp = model.add_subsystem('comp', DoubleArrayFD())
+        model.connect('p1.x1', 'comp.x1')
+        model.connect('p2.x2', 'comp.x2')
+
+        model.linear_solver = ScipyIterativeSolver()
+        model.approx_total_derivs(backend='process', num_workers=2)
+
+        prob.setup(check=False)
+        prob.run_model()
+        model.run_linearize()
+
+        Jfd = model.jacobian._subjacs
+        assert_rel_error(self, Jfd['comp.y1', 'p1.x1'], -comp.JJ[0:2, 0:2], 1e-6)
+        assert_rel_error(self, Jfd['comp.y1', 'p2.x2'], -comp.JJ[0:2, 2:4], 1e-6)
+        assert_rel_error(self, Jfd['comp.y2', 'p1.x1'], -comp.JJ[2:4, 0:2], 1e-6)
+        assert_rel_error(self, Jfd['comp.y2', 'p2.x2'], -comp.JJ[2:4, 2:4], 1e-6)
+
+        # the parent's copy of the model is unchanged by the workers.
+        assert_rel_error(self, prob['p1.x1'], np.ones(2), 1e-15)
+
+    def test_workspace_reuse(self):
+        prob = Problem()
+        model = prob.model = Group()
+        model.add_subsystem('p1', IndepVarComp('x', val=np.ones(3)))
+        model.add_subsystem('comp', ExecComp('y=x**2', x=np.ones(3), y=np.ones(3)))
+        model.connect('p1.x', 'comp.x')
+
+        model.linear_solver = ScipyIterativeSolver()
+        model.approx_total_derivs(form='central')
+
+        prob.setup(check=False)
+        prob['p1.x'] = np.array([1., 2., 3.])
+        prob.run_model()
+        model.run_linearize()
+
+        scheme = model._approx_schemes['fd']
+        subjac = scheme._approx_subjacs['comp.y', 'p1.x']
+        assert_rel_error(self, model.jacobian._subjacs['comp.y', 'p1.x'],
+                         -np.diag([2., 4., 6.]), 1e-6)
+
+        prob['p1.x'] = np.array([3., 2., 1.])
+        prob.run_model()
+        model.run_linearize()
+
+        assert_rel_error(self, model.jacobian._subjacs['comp.y', 'p1.x'],
+                         -np.diag([6., 4., 2.]), 1e-6)
+
+        # the same workspace array is used again
+        self.assertIs(scheme._approx_subjacs['comp.y', 'p1.x'], subjac)
+
+        # the unperturbed point is restored
+        assert_rel_error(self, prob['comp.y'], [9., 4., 1.], 1e-15)
+
     def test_implicit_component_fd(self):
         # Somehow this wasn't tested in the original fd tests (which are mostly feature tests.)
 
@@ -651,6 +719,52 @@ class TestComponentComplexStep(unittest.TestCase):
         assert_rel_error(self, Jfd['sub.comp.x', 'sub.comp.rhs'], -np.eye(2), 1e-6)
         assert_rel_error(self, Jfd['sub.comp.x', 'sub.comp.x'], comp.mtx, 1e-6)
 
+    def test_process_backend(self):
+
+        for method in ('fd', 'cs'):
+
+            class TestImplCompArrayDense(TestImplCompArray):
+
+                def setup(self):
+                    super(TestImplCompArrayDense, self).setup()
+                    self.approx_partials('*', '*', method=method, backend='process',
+                                         num_workers=2)
+
+            prob = self.prob = Problem()
+            model = prob.model = Group()
+
+            model.add_subsystem('p_rhs', IndepVarComp('rhs', val=np.ones(2)))
+            comp = model.add_subsystem('comp', TestImplCompArrayDense())
+            model.connect('p_rhs.rhs', 'comp.rhs')
+
+            model.linear_solver = ScipyIterativeSolver()
+
+            prob.setup(check=False)
+            prob.run_model()
+            model.run_linearize()
+
+            Jfd = comp.jacobian._subjacs
+            assert_rel_error(self, Jfd['comp.x', 'comp.rhs'], -np.eye(2), 1e-6)
+            assert_rel_error(self, Jfd['comp.x', 'comp.x'], comp.mtx, 1e-6)
+
+    def test_bad_backend(self):
+
+        class TestImplCompArrayDense(TestImplCompArray):
+
+            def setup(self):
+                super(TestImplCompArrayDense, self).setup()
+                self.approx_partials('*', '*', backend='threads')
+
+        prob = self.prob = Problem()
+        prob.model.add_subsystem('comp', TestImplCompArrayDense())
+
+        with self.assertRaises(ValueError) as cm:
+            prob.setup(check=False)
+
+        self.assertEqual(str(cm.exception),
+                         'Backend "threads" is not supported, backend must be one of '
+                         "('serial', 'process', 'mpi')")
+
     def test_reconfigure(self):
         # In this test, we switch to 'cs' when we reconfigure.
 
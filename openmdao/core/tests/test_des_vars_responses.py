@@ -513,6 +513,64 @@ class TestConstraintOnModel(unittest.TestCase):
         prob.model.add_constraint('con1', lower=0.0, upper=5.0,
                                           indices=range(2))
 
+    def test_constraint_wrt(self):
+
+        prob = Problem()
+
+        prob.model = SellarDerivatives()
+        prob.model.nonlinear_solver = NonlinearBlockGS()
+
+        prob.model.add_design_var('x', lower=-100, upper=100)
+        prob.model.add_design_var('z', lower=-100, upper=100)
+        prob.model.add_objective('obj')
+        prob.model.add_constraint('con1', upper=0.0, wrt=['x', 'z'])
+        prob.model.add_constraint('con2', upper=0.0, wrt='z')
+
+        prob.setup(check=False)
+
+        constraints = prob.model.get_constraints()
+
+        self.assertEqual(constraints['con_cmp1.con1']['wrt'], ['px.x', 'pz.z'])
+        self.assertEqual(constraints['con_cmp2.con2']['wrt'], ['pz.z'])
+
+        # the promoted names given by the user are kept
+        self.assertEqual(prob.model._responses['con1']['wrt'], ['x', 'z'])
+
+    def test_constraint_invalid_wrt(self):
+
+        prob = Problem()
+
+        prob.model = SellarDerivatives()
+        prob.model.nonlinear_solver = NonlinearBlockGS()
+
+        with self.assertRaises(ValueError) as context:
+            prob.model.add_constraint('con1', upper=0.0, wrt=['x', 42])
+
+        self.assertEqual(str(context.exception), 'If specified, wrt must be a '
+                                                 'sequence of design variable names.')
+
+        prob.model.add_constraint('con1', upper=0.0, wrt=['junk'])
+
+        with self.assertRaises(RuntimeError) as context:
+            prob.setup(check=False)
+
+        self.assertEqual(str(context.exception), "Output not found for design variable "
+                                                 "'junk' of constraint 'con1' in system ''.")
+
+    def test_constraint_invalid_active_tol(self):
+
+        prob = Problem()
+
+        prob.model = SellarDerivatives()
+        prob.model.nonlinear_solver = NonlinearBlockGS()
+
+        for active_tol in (-1.0, 'foo'):
+            with self.assertRaises(ValueError) as context:
+                prob.model.add_constraint('con1', upper=0.0, active_tol=active_tol)
+
+            self.assertEqual(str(context.exception), 'If specified, active_tol must be a '
+                                                     'nonnegative number.')
+
 
 class TestObjectiveOnModel(unittest.TestCase):
 
@@ -797,6 +797,27 @@ class TestGroup(unittest.TestCase):
 
         # this test passes if it doesn't raise an exception
 
+    def test_var_offsets(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('indeps', IndepVarComp('x', np.ones(3)))
+        sub = model.add_subsystem('sub', Group())
+        sub.add_subsystem('C1', ExecComp('y=2.0*x', x=np.ones(3), y=np.ones(3)))
+        sub.add_subsystem('C2', ExecComp('y=sum(x)', x=np.ones(3), y=np.ones(2)))
+        model.connect('indeps.x', ['sub.C1.x', 'sub.C2.x'])
+        prob.setup(check=False)
+        prob.run_model()
+
+        for system in (model, sub):
+            for type_ in ['input', 'output']:
+                sizes = system._var_sizes[type_]
+                offsets = system._var_offsets[type_]
+                for idx in range(sizes.shape[1]):
+                    self.assertEqual(offsets[0, idx], np.sum(sizes[0, :idx]))
+
+        assert_rel_error(self, prob['sub.C1.y'], 2.0 * np.ones(3))
+        assert_rel_error(self, prob['sub.C2.y'], 3.0 * np.ones(2))
+
 
 class TestConnect(unittest.TestCase):
 
@@ -508,5 +508,44 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(outputs, indep1_outs | indep2_outs)
         self.assertEqual(systems, indep1_sys | indep2_sys)
 
+    def test_relevance_pruned_totals(self):
+        class CountedComp(ExecComp):
+            def _solve_linear(self, vec_names, mode, rel_systems=None):
+                self.nsolves += 1
+                return super(CountedComp, self)._solve_linear(vec_names, mode, rel_systems)
+
+        for mode in ('fwd', 'rev'):
+            p = Problem()
+            model = p.model
+
+            model.add_subsystem('px1', IndepVarComp('x', 3.0))
+            model.add_subsystem('px2', IndepVarComp('x', 5.0))
+            G1 = model.add_subsystem('G1', Group())
+            G1.add_subsystem('C1', ExecComp('y=2.0*x'))
+            G1.add_subsystem('C2', ExecComp('y=3.0*x'))
+            dead = model.add_subsystem('dead', CountedComp('y=7.0*x'))
+            dead.nsolves = 0
+
+            model.connect('px1.x', ['G1.C1.x', 'dead.x'])
+            model.connect('px2.x', 'G1.C2.x')
+
+            model.add_design_var('px1.x')
+            model.add_design_var('px2.x')
+            model.add_constraint('G1.C1.y', upper=0.0)
+            model.add_constraint('G1.C2.y', upper=0.0)
+
+            p.setup(check=False, mode=mode)
+            p.run_model()
+
+            J = p.compute_total_derivs(of=['G1.C1.y', 'G1.C2.y'], wrt=['px1.x', 'px2.x'])
+
+            assert_rel_error(self, J['G1.C1.y', 'px1.x'][0][0], 2.0, 1e-10)
+            assert_rel_error(self, J['G1.C1.y', 'px2.x'][0][0], 0.0, 1e-10)
+            assert_rel_error(self, J['G1.C2.y', 'px1.x'][0][0], 0.0, 1e-10)
+            assert_rel_error(self, J['G1.C2.y', 'px2.x'][0][0], 3.0, 1e-10)
+
+            # 'dead' doesn't feed any response, so it is never touched by the linear solves.
+            self.assertEqual(dead.nsolves, 0)
+
 if __name__ == "__main__":
     unittest.main()
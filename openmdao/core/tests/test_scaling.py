@@ -8,7 +8,7 @@ import numpy as np
 
 from openmdao.api import Problem, Group, ExplicitComponent, ImplicitComponent, IndepVarComp
 from openmdao.api import NewtonSolver, ScipyIterativeSolver, NonlinearBlockGS, DirectSolver
-from openmdao.api import AssembledJacobian
+from openmdao.api import AssembledJacobian, ExecComp
 
 from openmdao.devtools.testutil import assert_rel_error
 from openmdao.test_suite.components.expl_comp_array import TestExplCompArrayDense
@@ -239,6 +239,56 @@ class TestScaling(unittest.TestCase):
         assert_rel_error(self, prob['sys2.new_length'], 3.e-1)
         assert_rel_error(self, prob.model._outputs['sys2.new_length'], 3.e-1)
 
+    def test_identity_scaling(self):
+        group = Group()
+        group.add_subsystem('sys1', IndepVarComp('old_length', 1.0,
+                                                 units='mm', ref=1e5))
+        group.add_subsystem('sys2', PassThroughLength())
+        group.add_subsystem('sys3', IndepVarComp('x', 3.0))
+        group.add_subsystem('sys4', ExecComp('y = 2.0 * x'))
+        group.connect('sys1.old_length', 'sys2.old_length')
+        group.connect('sys3.x', 'sys4.x')
+
+        prob = Problem(group)
+        prob.setup(check=False)
+
+        model = prob.model
+        sys1, sys2, sys4 = [model.get_subsystem(name) for name in ('sys1', 'sys2', 'sys4')]
+        for vec_name in ('nonlinear', 'linear'):
+            for system in (model, sys1, sys2):
+                self.assertNotIn(('output', vec_name), system._identity_scaling)
+            self.assertNotIn(('input', vec_name), model._identity_scaling)
+            self.assertNotIn(('input', vec_name), sys2._identity_scaling)
+            for type_ in ('input', 'output', 'residual'):
+                self.assertIn((type_, vec_name), sys4._identity_scaling)
+
+        prob['sys1.old_length'] = 3.e5
+        prob.run_model()
+        assert_rel_error(self, prob['sys2.new_length'], 3.e-1)
+        assert_rel_error(self, prob['sys4.y'], 6.0)
+
+        totals = prob.compute_total_derivs(of=['sys4.y'], wrt=['sys3.x'])
+        assert_rel_error(self, totals['sys4.y', 'sys3.x'][0][0], 2.0)
+
+    def test_identity_scaling_subgroup(self):
+        # the unit conversion of a connection owned by a subgroup is part of the model's scaling
+        model = Group()
+        sub = model.add_subsystem('sub', Group())
+        sub.add_subsystem('sys1', IndepVarComp('old_length', 1.0, units='mm'))
+        sub.add_subsystem('sys2', PassThroughLength())
+        sub.connect('sys1.old_length', 'sys2.old_length')
+
+        prob = Problem(model)
+        prob.setup(check=False)
+
+        for vec_name in ('nonlinear', 'linear'):
+            for system in (model, sub):
+                self.assertNotIn(('input', vec_name), system._identity_scaling)
+
+        prob['sub.sys1.old_length'] = 3.e5
+        prob.run_model()
+        assert_rel_error(self, prob['sub.sys2.new_length'], 3.e-1)
+
     def test_speed(self):
         comp = IndepVarComp()
         comp.add_output('distance', 1., units='km')
@@ -255,6 +255,31 @@ class TestSystem(unittest.TestCase):
 
         self.assertTrue(isinstance(solver, DummySolver))
 
+    def test_scope_cache(self):
+        prob = Problem(model=Group())
+        model = prob.model
+        model.add_subsystem('p1', IndepVarComp('x', 1.0))
+        model.add_subsystem('C1', ExecComp('y=2.0*x'))
+        model.add_subsystem('C2', ExecComp('y=3.0*x'))
+        model.connect('p1.x', 'C1.x')
+        model.connect('C1.y', 'C2.x')
+        prob.setup(check=False)
+
+        scope_out, scope_in = model._get_scope()
+        self.assertEqual(scope_out, set(['p1.x', 'C1.y', 'C2.y']))
+        self.assertEqual(scope_in, set(['C1.x', 'C2.x']))
+        self.assertIs(model._get_scope()[0], scope_out)
+
+        c1 = model.get_subsystem('C1')
+        scope_out, scope_in = model._get_scope(c1)
+        self.assertEqual(scope_out, set(['p1.x', 'C2.y']))
+        self.assertEqual(scope_in, set(['C1.x']))
+        self.assertIs(model._get_scope(c1)[1], scope_in)
+
+        # the caches are rebuilt on setup
+        prob.setup(check=False)
+        self.assertIsNot(model._get_scope(c1)[1], scope_in)
+
 
 if __name__ == "__main__":
     unittest.main()
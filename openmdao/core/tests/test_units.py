@@ -412,6 +412,12 @@ class TestUnitConversion(unittest.TestCase):
         assert_rel_error(self, J['sub2.tgtC.x3']['x1'][0][0], 1.0, 1e-6)
         assert_rel_error(self, J['sub2.tgtK.x3']['x1'][0][0], 1.0, 1e-6)
 
+        # unit conversions are computed once per connection, at setup
+        in2conv = prob.model._conn_global_abs_in2conv
+        self.assertEqual(sorted(in2conv), ['sub2.tgtC.x2', 'sub2.tgtF.x2', 'sub2.tgtK.x2'])
+        self.assertEqual(sub2._conn_global_abs_in2conv, {})
+        assert_rel_error(self, in2conv['sub2.tgtF.x2'][0], 1.8, 1e-6)
+
     def test_basic_grouped_bug_from_pycycle(self):
 
         prob = Problem()
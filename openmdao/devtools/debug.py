@@ -105,6 +105,51 @@ def tree(system, include_solvers=True, stream=sys.stdout):
             if s.linear_solver is not None:
                 stream.write("%s %s linear_solver\n" % (indent, type(s.linear_solver).__name__))
 
+def solver_workspace(system, stream=sys.stdout):
+    """
+    Dump the memory held by the workspace vectors of each solver in the model tree.
+
+    Parameters
+    ----------
+    system : <System>
+        The top system of the tree.
+    stream : File-like
+        Where dump output will go.
+
+    Returns
+    -------
+    int
+        The total workspace size of all solvers, in bytes.
+    """
+    def _iter_solvers(solver, name):
+        yield solver, name
+        for attr in ('linear_solver', 'linesearch', 'precon'):
+            sub = getattr(solver, attr, None)
+            if sub is not None:
+                for s, n in _iter_solvers(sub, '%s.%s' % (name, attr)):
+                    yield s, n
+
+    seen = set()
+    total = 0
+    for s in system.system_iter(include_self=True, recurse=True):
+        for top, top_name in ((s.nonlinear_solver, 'nonlinear_solver'),
+                              (s.linear_solver, 'linear_solver')):
+            if top is None:
+                continue
+            for solver, name in _iter_solvers(top, top_name):
+                # solvers can be shared, e.g. Newton's default linear solver
+                if id(solver) in seen:
+                    continue
+                seen.add(id(solver))
+                nbytes = solver._get_workspace_size() if hasattr(solver, '_rhs_vecs') else 0
+                if nbytes:
+                    stream.write("%s %s %s: %d bytes\n" % (s.pathname or '<model>', name,
+                                                           type(solver).__name__, nbytes))
+                total += nbytes
+
+    stream.write("Total solver workspace: %d bytes\n" % total)
+    return total
+
 def max_mem_usage():
     """
     Returns
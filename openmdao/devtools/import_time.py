@@ -0,0 +1,58 @@
+"""Benchmark of the time taken to import a module in a fresh python process."""
+from __future__ import print_function
+
+import sys
+import argparse
+import subprocess
+
+
+_TIMER_SCRIPT = """
+from timeit import default_timer
+start = default_timer()
+import %s
+print(default_timer() - start)
+"""
+
+
+def time_import(module='openmdao.api', num_runs=10):
+    """
+    Import a module in separate python processes, timing each import.
+
+    Parameters
+    ----------
+    module : str
+        name of the module to import.
+    num_runs : int
+        number of processes in which the module is imported.
+
+    Returns
+    -------
+    list of float
+        the import time, in seconds, of each process.
+    """
+    times = []
+    for i in range(num_runs):
+        out = subprocess.check_output([sys.executable, '-c', _TIMER_SCRIPT % module])
+        times.append(float(out.decode().strip().splitlines()[-1]))
+    return times
+
+
+def import_time_argv():
+    """
+    Run the import benchmark from the command line.
+    """
+    parser = argparse.ArgumentParser(description='Time the import of a module.')
+    parser.add_argument('-n', '--num_runs', action='store', dest='num_runs', type=int,
+                        default=10, help='Number of processes in which to import the module.')
+    parser.add_argument('module', nargs='?', default='openmdao.api',
+                        help='Module to import (openmdao.api by default).')
+    options = parser.parse_args()
+
+    times = time_import(options.module, options.num_runs)
+
+    print("import %s: min %.4f s, mean %.4f s over %d runs" %
+          (options.module, min(times), sum(times) / len(times), len(times)))
+
+
+if __name__ == '__main__':
+    import_time_argv()
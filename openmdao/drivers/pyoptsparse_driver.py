@@ -75,6 +75,8 @@ class pyOptSparseDriver(Driver):
         Finite difference implementation to use ('snopt_fd' may only be used with SNOPT)
     options['title'] :  str('Optimization using pyOpt_sparse')
         Title of this optimization run
+    options['cache_size'] : int(8)
+        Number of recent design points whose model evaluations and derivatives are cached.
 
     Attributes
     ----------
@@ -95,6 +97,11 @@ class pyOptSparseDriver(Driver):
         Pyopt_sparse solution object.
     _cons : dict
         Contains all constraint info.
+    _con_subjac_coo : dict
+        Row and column indices of the nonzeros of the declared sparse constraint
+        sub-jacobians, keyed by (constraint, design variable).
+    _con_wrt : OrderedDict
+        Design variables that each constraint depends on, keyed by constraint name.
     _designvars : dict
         Contains all design variable info.
     _indep_list : list
@@ -119,9 +126,9 @@ class pyOptSparseDriver(Driver):
         self.supports['multiple_objectives'] = True
         self.supports['two_sided_constraints'] = True
         self.supports['linear_constraints'] = True
+        self.supports['active_set'] = True
 
         # What we don't support yet
-        self.supports['active_set'] = False
         self.supports['integer_design_vars'] = False
 
         # User Options
@@ -134,6 +141,9 @@ class pyOptSparseDriver(Driver):
         self.options.declare('gradient method', default='openmdao',
                              values={'openmdao', 'pyopt_fd', 'snopt_fd'},
                              desc='Finite difference implementation to use')
+        self.options.declare('cache_size', default=8, type_=int, lower=1,
+                             desc='Number of recent design points whose model evaluations '
+                                  'and derivatives are cached.')
 
         # The user places optimizer-specific settings in here.
         self.opt_settings = {}
@@ -150,6 +160,8 @@ class pyOptSparseDriver(Driver):
 
         self._indep_list = []
         self._quantities = []
+        self._con_wrt = OrderedDict()
+        self._con_subjac_coo = {}
         self.fail = False
 
     def _setup_driver(self, problem):
@@ -188,6 +200,7 @@ class pyOptSparseDriver(Driver):
         model = self._problem.model
         self.pyopt_solution = None
         self.iter_count = 0
+        self._reset_eval_cache(self.options['cache_size'])
 
         # Initial Run
         model._solve_nonlinear()
@@ -198,6 +211,7 @@ class pyOptSparseDriver(Driver):
         param_meta = self._designvars
         self._indep_list = indep_list = list(param_meta)
         param_vals = self.get_design_var_values()
+        self._cache_eval(self._get_design_vector(param_vals).tobytes())
 
         for name, meta in iteritems(param_meta):
             opt_prob.addVarGroup(name, meta['size'], type='c',
@@ -207,13 +221,18 @@ class pyOptSparseDriver(Driver):
         opt_prob.finalizeDesignVariables()
 
         # Add all objectives
+        self._quantities = []
         objs = self.get_objective_values()
         for name in objs:
             opt_prob.addObj(name)
             self._quantities.append(name)
 
-        # Calculate and save derivatives for any linear constraints.
+        # Determine the design variables that each constraint depends on, and the
+        # sparsity of those sub-jacobians where it has been declared.
         con_meta = self._cons
+        self._setup_con_sparsity()
+
+        # Calculate and save derivatives for any linear constraints.
         lcons = [key for (key, con) in iteritems(con_meta) if con['linear'] is True]
         if len(lcons) > 0:
             _lin_jacs = problem._compute_total_derivs(of=lcons, wrt=indep_list,
@@ -226,13 +245,15 @@ class pyOptSparseDriver(Driver):
         for name, meta in iteritems(eqcons):
             size = meta['size']
             lower = upper = meta['equals']
+            wrt = self._con_wrt[name]
 
             if meta['linear']:
                 opt_prob.addConGroup(name, size, lower=lower, upper=upper,
-                                     linear=True,
-                                     jac=_lin_jacs[name])
+                                     linear=True, wrt=wrt,
+                                     jac=self._get_con_jac(name, _lin_jacs[name]))
             else:
-                opt_prob.addConGroup(name, size, lower=lower, upper=upper)
+                opt_prob.addConGroup(name, size, lower=lower, upper=upper,
+                                     wrt=wrt, jac=self._get_con_jac(name))
                 self._quantities.append(name)
 
         # Add all inequality constraints
@@ -244,13 +265,15 @@ class pyOptSparseDriver(Driver):
             # Bounds - double sided is supported
             lower = meta['lower']
             upper = meta['upper']
+            wrt = self._con_wrt[name]
 
             if meta['linear']:
                 opt_prob.addConGroup(name, size, upper=upper, lower=lower,
-                                     linear=True,
-                                     jac=_lin_jacs[name])
+                                     linear=True, wrt=wrt,
+                                     jac=self._get_con_jac(name, _lin_jacs[name]))
             else:
-                opt_prob.addConGroup(name, size, upper=upper, lower=lower)
+                opt_prob.addConGroup(name, size, upper=upper, lower=lower,
+                                     wrt=wrt, jac=self._get_con_jac(name))
                 self._quantities.append(name)
 
         # Instantiate the requested optimizer
@@ -305,12 +328,10 @@ class pyOptSparseDriver(Driver):
 
         # Pull optimal parameters back into framework and re-run, so that
         # framework is left in the right final state
-        dv_dict = sol.getDVs()
-        for name in indep_list:
-            val = dv_dict[name]
-            self.set_design_var(name, val)
-
-        model._solve_nonlinear()
+        x = self._get_design_vector(sol.getDVs())
+        key = x.tobytes()
+        if key != self._eval_key:
+            self._run_model_at(x, key)
 
         # Save the most recent solution.
         self.pyopt_solution = sol
@@ -328,6 +349,144 @@ class pyOptSparseDriver(Driver):
 
         return self.fail
 
+    def _setup_con_sparsity(self):
+        """
+        Determine the design variables of each constraint and its sparse sub-jacobians.
+
+        The design variables are those declared in add_constraint or, by default, those
+        that the constraint is connected to in the model. Sub-jacobians are treated as
+        sparse where a total jacobian sparsity has been set on the driver.
+        """
+        problem = self._problem
+        relevant = getattr(problem, '_relevant', None)
+        sparsity = self._total_jac_sparsity
+
+        self._con_wrt = con_wrt = OrderedDict()
+        self._con_subjac_coo = coo = {}
+        for name, meta in iteritems(self._cons):
+            if meta['wrt'] is not None:
+                for dv in meta['wrt']:
+                    if dv not in self._designvars:
+                        msg = "Constraint '{0}' depends on '{1}', which is not a design variable."
+                        raise RuntimeError(msg.format(name, dv))
+                wrt = [dv for dv in self._indep_list if dv in meta['wrt']]
+            elif relevant is not None:
+                rel = relevant.get(name, {})
+                wrt = [dv for dv in self._indep_list if dv in rel or dv == name]
+                if not wrt:
+                    wrt = list(self._indep_list)
+            else:
+                wrt = list(self._indep_list)
+            con_wrt[name] = wrt
+
+            if sparsity is not None and name in sparsity:
+                for dv in wrt:
+                    if dv in sparsity[name]:
+                        coo[name, dv] = np.nonzero(sparsity[name][dv])
+
+    def _get_con_jac(self, name, subjacs=None):
+        """
+        Return the jacobian of a constraint in the form expected by addConGroup.
+
+        Parameters
+        ----------
+        name : str
+            Name of the constraint.
+        subjacs : dict or None
+            Dense sub-jacobians of the constraint keyed by design variable, or None if
+            only the sparsity pattern is wanted (for nonlinear constraints).
+
+        Returns
+        -------
+        dict or None
+            Sub-jacobians keyed by design variable, in COO form where they are sparse.
+            None if there is nothing to declare.
+        """
+        jac = OrderedDict()
+        for dv in self._con_wrt[name]:
+            if (name, dv) in self._con_subjac_coo:
+                shape = [self._cons[name]['size'], self._designvars[dv]['size']]
+                rows, cols = self._con_subjac_coo[name, dv]
+                if subjacs is None:
+                    data = np.zeros(rows.size)
+                else:
+                    data = subjacs[dv][rows, cols]
+                jac[dv] = {'coo': [rows, cols, data], 'shape': shape}
+            elif subjacs is not None:
+                jac[dv] = subjacs[dv]
+
+        return jac if jac else None
+
+    def _compute_sens(self):
+        """
+        Compute the total derivatives of the objectives and nonlinear constraints.
+
+        In rev mode, the constraints are grouped by their design variables and each group
+        only asks for those, so the sub-jacobians wrt the other design variables are never
+        formed. In fwd mode, or when the totals are approximated, each column serves all the
+        responses, so they are all computed at once.
+
+        Returns
+        -------
+        dict
+            Dense sub-jacobians keyed by [response][design variable].
+        """
+        problem = self._problem
+        if problem._mode != 'rev' or problem.model._owns_approx_jac:
+            return self._compute_total_derivs(of=self._quantities, wrt=self._indep_list,
+                                              return_format='dict')
+
+        groups = OrderedDict()
+        for name in self._quantities:
+            wrt = tuple(self._con_wrt.get(name, self._indep_list))
+            groups.setdefault(wrt, []).append(name)
+
+        sens_dict = OrderedDict()
+        for i, (wrt, of) in enumerate(iteritems(groups)):
+            sens_dict.update(self._compute_total_derivs(of=of, wrt=list(wrt),
+                                                        return_format='dict',
+                                                        linearize=(i == 0)))
+
+        return OrderedDict((name, sens_dict[name]) for name in self._quantities)
+
+    def _reduce_sens(self, sens_dict):
+        """
+        Keep only the sub-jacobians of the constraints wrt their design variables.
+
+        Parameters
+        ----------
+        sens_dict : dict
+            Dense sub-jacobians of the objectives and nonlinear constraints, wrt at least
+            the design variables of each constraint.
+
+        Returns
+        -------
+        dict
+            The reduced jacobian, with sparse sub-jacobians in COO form.
+        """
+        for name in self._quantities:
+            if name in self._con_wrt:
+                jac = self._get_con_jac(name, sens_dict[name])
+                sens_dict[name] = jac if jac is not None else OrderedDict()
+        return sens_dict
+
+    def _get_design_vector(self, dv_dict):
+        """
+        Return the design variables as a single vector, in the order of _designvars.
+
+        Parameters
+        ----------
+        dv_dict : dict
+            Dictionary of design variable values.
+
+        Returns
+        -------
+        ndarray
+            Scaled design vector.
+        """
+        return np.concatenate([np.atleast_1d(dv_dict[name]).ravel()
+                               for name in self._designvars]).astype(float)
+
     def _objfunc(self, dv_dict):
         """
         Compute the objective function and constraints.
@@ -349,27 +508,30 @@ class pyOptSparseDriver(Driver):
             0 for successful function evaluation
             1 for unsuccessful function evaluation
         """
-        model = self._problem.model
         fail = 0
 
         try:
-            for name in self._indep_list:
-                self.set_design_var(name, dv_dict[name])
-
-            # print("Setting DV")
-            # print(dv_dict)
-
-            # Execute the model
-            self.iter_count += 1
-            try:
-                model._solve_nonlinear()
-
-            # Let the optimizer try to handle the error
-            except AnalysisError:
-                fail = 1
-
-            func_dict = self.get_objective_values()
-            func_dict.update(self.get_constraint_values(lintype='nonlinear'))
+            x = self._get_design_vector(dv_dict)
+            key, entry = self._get_cached_eval(x)
+
+            # Execute the model, unless it was already evaluated at this point
+            if entry is None:
+                self.iter_count += 1
+                try:
+                    entry = self._run_model_at(x, key)
+
+                # Let the optimizer try to handle the error
+                except AnalysisError:
+                    fail = 1
+
+            if entry is None:
+                func_dict = self.get_objective_values()
+                func_dict.update(self.get_constraint_values(lintype='nonlinear'))
+            else:
+                func_dict = dict(entry['objs'])
+                for name, val in iteritems(entry['cons']):
+                    if not self._cons[name]['linear']:
+                        func_dict[name] = val
 
         except Exception as msg:
             tb = traceback.format_exc()
@@ -410,15 +572,24 @@ class pyOptSparseDriver(Driver):
             0 for successful function evaluation
             1 for unsuccessful function evaluation
         """
-        prob = self._problem
         fail = 0
 
         try:
 
             try:
-                sens_dict = self._compute_total_derivs(of=self._quantities,
-                                                       wrt=self._indep_list,
-                                                       return_format='dict')
+                x = self._get_design_vector(dv_dict)
+                key, entry = self._get_cached_eval(x)
+                if entry is not None and 'jac' in entry:
+                    sens_dict = entry['jac']
+                else:
+                    # The derivatives must be computed with the model at this point.
+                    if key != self._eval_key:
+                        self.iter_count += 1
+                        entry = self._run_model_at(x, key)
+
+                    sens_dict = self._reduce_sens(self._compute_sens())
+                    if entry is not None:
+                        entry['jac'] = sens_dict
 
             # Let the optimizer try to handle the error
             except AnalysisError:
@@ -434,6 +605,7 @@ class pyOptSparseDriver(Driver):
                     for ikey, ival in iteritems(dv_dict):
                         isize = len(ival)
                         sens_dict[okey][ikey] = np.zeros((osize, isize))
+                sens_dict = self._reduce_sens(sens_dict)
 
         except Exception as msg:
             tb = traceback.format_exc()
@@ -52,6 +52,8 @@ class ScipyOptimizer(Driver):
         Name of optimizer to use
     options['tol'] :  float(1e-06)
         Tolerance for termination. For detailed control, use solver-specific options.
+    options['cache_size'] : int(8)
+        Number of recent design points whose model evaluations and derivatives are cached.
 
     Attributes
     ----------
@@ -87,10 +89,10 @@ class ScipyOptimizer(Driver):
         self.supports['inequality_constraints'] = True
         self.supports['equality_constraints'] = True
         self.supports['two_sided_constraints'] = True
+        self.supports['active_set'] = True
 
         # What we don't support
         self.supports['multiple_objectives'] = False
-        self.supports['active_set'] = False
         self.supports['integer_design_vars'] = False
         self.supports['linear_constraints'] = False
 
@@ -104,6 +106,9 @@ class ScipyOptimizer(Driver):
                              desc='Maximum number of iterations.')
         self.options.declare('disp', True,
                              desc='Set to False to prevent printing of Scipy convergence messages')
+        self.options.declare('cache_size', 8, type_=int, lower=1,
+                             desc='Number of recent design points whose model evaluations '
+                                  'and derivatives are cached.')
 
         # The user places optimizer-specific settings in here.
         self.opt_settings = OrderedDict()
@@ -149,6 +154,7 @@ class ScipyOptimizer(Driver):
         problem = self._problem
         model = self._problem.model
         self.iter_count = 0
+        self._reset_eval_cache(self.options['cache_size'])
 
         # Initial Run
         model._solve_nonlinear()
@@ -198,6 +204,9 @@ class ScipyOptimizer(Driver):
 
                     bounds.append((p_low, p_high))
 
+        # The optimizer usually starts by evaluating the initial point, which was just run.
+        self._cache_eval(x_init.tobytes())
+
         # Constraints
         constraints = []
         i = 0
@@ -253,6 +262,11 @@ class ScipyOptimizer(Driver):
         self.result = result
         self.fail = False if self.result.success else True
 
+        # Leave the model at the optimum, which the cache may have kept it from revisiting.
+        if self._eval_key != result.x.tobytes():
+            self.iter_count += 1
+            self._run_model_at(result.x, result.x.tobytes())
+
         if self.options['disp']:
             print('Optimization Complete')
             print('-' * 35)
@@ -273,26 +287,18 @@ class ScipyOptimizer(Driver):
         float
             Value of the objective function evaluated at the new design point.
         """
-        model = self._problem.model
-
         try:
-
-            # Pass in new parameters
-            i = 0
-            for name, meta in iteritems(self._designvars):
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
-
-            self.iter_count += 1
-            model._solve_nonlinear()
+            key, entry = self._get_cached_eval(x_new)
+            if entry is None:
+                self.iter_count += 1
+                entry = self._run_model_at(x_new, key)
 
             # Get the objective function evaluations
-            for name, obj in iteritems(self.get_objective_values()):
+            for name, obj in iteritems(entry['objs']):
                 f_new = obj
                 break
 
-            self._con_cache = self.get_constraint_values()
+            self._con_cache = entry['cons']
 
         except Exception as msg:
             tb = traceback.format_exc()
@@ -375,9 +381,21 @@ class ScipyOptimizer(Driver):
             Gradient of objective with respect to parameter array.
         """
         try:
-            quantities = list(self._objs) + list(self._cons)
-            grad = self._compute_total_derivs(of=quantities, wrt=list(self._designvars),
-                                              return_format='array')
+            key, entry = self._get_cached_eval(x_new)
+            if entry is not None and 'jac' in entry:
+                grad = entry['jac']
+            else:
+                # The derivatives must be computed with the model at x_new.
+                if key != self._eval_key:
+                    self.iter_count += 1
+                    entry = self._run_model_at(x_new, key)
+
+                quantities = list(self._objs) + list(self._cons)
+                grad = self._compute_total_derivs(of=quantities, wrt=list(self._designvars),
+                                                  return_format='array')
+                if entry is not None:
+                    entry['jac'] = grad
+
             self._grad_cache = grad
 
         except Exception as msg:
@@ -9,6 +9,7 @@ from openmdao.devtools.testutil import assert_rel_error
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.expl_comp_array import TestExplCompArrayDense
 from openmdao.test_suite.components.sellar import SellarDerivativesGrouped
+from openmdao.utils.coloring import get_total_jac_sparsity
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 
 
@@ -393,7 +394,6 @@ class TestPyoptSparse(unittest.TestCase):
     def test_fan_out(self):
         # This tests sparse-response specification.
         # This is a slightly modified FanOut
-        raise unittest.SkipTest("We don't compute sparsity for pyoptsparse just yet.")
 
         prob = Problem()
         model = prob.model = Group()
@@ -440,6 +440,47 @@ class TestPyoptSparse(unittest.TestCase):
         con2 = prob.driver.pyopt_solution.constraints['con2.c']
         self.assertEqual(con2.wrt, ['p2.x'])
 
+    def test_sparse_con_jac(self):
+        # Declared constraint wrt and sparsity of the constraint jacobian.
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x', 2.0 * np.ones(3)))
+        model.add_subsystem('p2', IndepVarComp('z', 2.0))
+
+        model.add_subsystem('obj', ExecComp('o = sum(x) + z**2', x=np.ones(3)))
+        model.add_subsystem('con', ExecComp('c = x**2', x=np.ones(3), c=np.ones(3)))
+
+        model.connect('p1.x', ['obj.x', 'con.x'])
+        model.connect('p2.z', 'obj.z')
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = pyOptSparseDriver()
+        prob.driver.options['optimizer'] = OPTIMIZER
+        prob.driver.options['print_results'] = False
+
+        model.add_design_var('p1.x', lower=0.0, upper=50.0)
+        model.add_design_var('p2.z', lower=-50.0, upper=50.0)
+        model.add_objective('obj.o')
+        model.add_constraint('con.c', lower=1.0, wrt=['p1.x'])
+
+        prob.setup(check=False)
+        prob.run_model()
+        prob.driver.set_total_jac_sparsity(get_total_jac_sparsity(prob))
+        prob.run_driver()
+
+        assert_rel_error(self, prob['p1.x'], np.ones(3), 1e-6)
+        assert_rel_error(self, prob['obj.o'], 3.0, 1e-6)
+
+        con = prob.driver.pyopt_solution.constraints['con.c']
+        self.assertEqual(con.wrt, ['p1.x'])
+
+        # only the diagonal of the constraint jacobian is passed to the optimizer
+        rows, cols = prob.driver._con_subjac_coo['con.c', 'p1.x']
+        np.testing.assert_array_equal(rows, np.arange(3))
+        np.testing.assert_array_equal(cols, np.arange(3))
+
     def test_inf_as_desvar_bounds(self):
 
         # User may use np.inf as a bound. It is unneccessary, but the user
@@ -497,6 +497,138 @@ class TestScipyOptimizer(unittest.TestCase):
         assert_rel_error(self, prob['z'][1], 0.0, 1e-3)
         assert_rel_error(self, prob['x'], 0.0, 1e-3)
 
+    def test_eval_cache(self):
+
+        class CountingParaboloid(Paraboloid):
+            def initialize(self):
+                self.num_computes = 0
+
+            def compute(self, inputs, outputs):
+                self.num_computes += 1
+                super(CountingParaboloid, self).compute(inputs, outputs)
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x', 50.0), promotes=['*'])
+        model.add_subsystem('p2', IndepVarComp('y', 50.0), promotes=['*'])
+        comp = model.add_subsystem('comp', CountingParaboloid(), promotes=['*'])
+        model.add_subsystem('con', ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = driver = ScipyOptimizer()
+        driver.options['optimizer'] = 'SLSQP'
+        driver.options['tol'] = 1e-9
+        driver.options['disp'] = False
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup(check=False)
+        prob.run_driver()
+
+        assert_rel_error(self, prob['x'], 7.16667, 1e-6)
+        assert_rel_error(self, prob['y'], -7.833334, 1e-6)
+
+        # the model only runs at new points, plus the initial run
+        self.assertEqual(comp.num_computes, driver.iter_count + 1)
+        self.assertLessEqual(len(driver._eval_cache), driver.options['cache_size'])
+
+        # revisiting the optimum requires no model evaluation
+        num_computes = comp.num_computes
+        x_opt = driver.result.x.copy()
+        driver._objfunc(x_opt)
+        driver._gradfunc(x_opt)
+        self.assertEqual(comp.num_computes, num_computes)
+
+        # the gradient at a cached point is computed with the model moved back to that point
+        driver._objfunc(np.array([0.0, 0.0]))
+        driver._objfunc(np.array([1.0, 1.0]))
+        self.assertEqual(comp.num_computes, num_computes + 2)
+
+        grad = driver._gradfunc(np.array([0.0, 0.0]))
+        self.assertEqual(comp.num_computes, num_computes + 3)
+        assert_rel_error(self, grad, np.array([-6.0, 8.0]), 1e-6)
+        assert_rel_error(self, prob['x'], 0.0, 1e-12)
+
+        grad = driver._gradfunc(np.array([0.0, 0.0]))
+        self.assertEqual(comp.num_computes, num_computes + 3)
+        assert_rel_error(self, grad, np.array([-6.0, 8.0]), 1e-6)
+
+    def test_compute_total_derivs_active_set(self):
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p', IndepVarComp('x', np.array([0.5, 0.99, 1.0, 0.2, 1.5])))
+        model.add_subsystem('obj', ExecComp('o = sum(x**2)', x=np.zeros(5)))
+        model.add_subsystem('con', ExecComp('c = 2.0*x', x=np.zeros(5), c=np.zeros(5)))
+        model.connect('p.x', ['obj.x', 'con.x'])
+
+        model.add_design_var('p.x', lower=-10.0, upper=10.0)
+        model.add_objective('obj.o')
+        model.add_constraint('con.c', lower=0.0, upper=2.0, active_tol=0.1)
+
+        prob.driver = ScipyOptimizer()
+        prob.options['instrument'] = True
+        prob.setup(check=False, mode='rev')
+        prob.run_model()
+
+        derivs = prob.driver._compute_total_derivs(of=['obj.o', 'con.c'], wrt=['p.x'],
+                                                   return_format='dict')
+
+        # only the entries near a bound, or past it, are active
+        active = np.array([False, True, True, False, True])
+        np.testing.assert_array_equal(prob.driver._active_rows['con.c'], active)
+
+        assert_rel_error(self, derivs['con.c']['p.x'], np.diag(2.0 * active), 1e-6)
+        assert_rel_error(self, derivs['obj.o']['p.x'], 2.0 * prob['p.x'][np.newaxis], 1e-6)
+
+        # one solve for the objective and one per active entry
+        stats = prob.instrumentation.get_stats()
+        self.assertEqual(stats['systems']['']['_solve_linear']['calls'], 4)
+
+        # the full jacobian is still available from the problem
+        derivs = prob.compute_total_derivs(of=['con.c'], wrt=['p.x'], return_format='dict')
+        assert_rel_error(self, derivs['con.c']['p.x'], 2.0 * np.eye(5), 1e-6)
+
+    def test_active_set(self):
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('p1', IndepVarComp('x', 50.0), promotes=['*'])
+        model.add_subsystem('p2', IndepVarComp('y', 50.0), promotes=['*'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', ExecComp('c = - x + y'), promotes=['*'])
+        model.add_subsystem('con2', ExecComp('c2 = x + y'), promotes=['*'])
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = ScipyOptimizer()
+        prob.driver.options['optimizer'] = 'SLSQP'
+        prob.driver.options['tol'] = 1e-9
+        prob.driver.options['disp'] = False
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0, active_tol=1.0)
+        model.add_constraint('c2', upper=200.0, active_tol=1.0)
+
+        prob.setup(check=False, mode='rev')
+        prob.run_driver()
+
+        # Minimum should be at (7.166667, -7.833334)
+        assert_rel_error(self, prob['x'], 7.16667, 1e-6)
+        assert_rel_error(self, prob['y'], -7.833334, 1e-6)
+
+        self.assertEqual(prob.driver._active_rows['con.c'], [True])
+        self.assertEqual(prob.driver._active_rows['con2.c2'], [False])
+
 
 class TestScipyOptimizerFeatures(unittest.TestCase):
 
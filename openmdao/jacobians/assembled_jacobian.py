@@ -9,7 +9,6 @@ from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
-from openmdao.utils.units import get_conversion
 
 SUBJAC_META_DEFAULTS = {
     'rows': None,
@@ -79,12 +78,11 @@ class AssembledJacobian(Jacobian):
         """
         system = self._system
 
-        sizes = system._var_sizes[type_]
         iproc = system.comm.rank
         idx = system._var_allprocs_abs2idx[type_][abs_name]
 
-        ind1 = np.sum(sizes[iproc, :idx])
-        ind2 = np.sum(sizes[iproc, :idx + 1])
+        ind1 = system._var_offsets[type_][iproc, idx]
+        ind2 = ind1 + system._var_sizes[type_][iproc, idx]
 
         return ind1, ind2
 
@@ -97,6 +95,7 @@ class AssembledJacobian(Jacobian):
 
         abs2meta_in = system._var_abs2meta['input']
         abs2meta_out = system._var_abs2meta['output']
+        in2conv = system._conn_global_abs_in2conv
 
         self._int_mtx = int_mtx = self.options['matrix_class'](system.comm)
         ext_mtx = self.options['matrix_class'](system.comm)
@@ -172,11 +171,9 @@ class AssembledJacobian(Jacobian):
                         out_offset, _ = out_ranges[out_abs_name]
                         src_indices = src_indices_dict[in_abs_name]
 
-                        # calculate unit conversion
-                        in_units = abs2meta_in[in_abs_name]['units']
-                        out_units = abs2meta_out[out_abs_name]['units']
-                        if in_units and out_units:
-                            factor, _ = get_conversion(out_units, in_units)
+                        # unit conversion, computed once for each connection during setup
+                        if in_abs_name in in2conv:
+                            factor, _ = in2conv[in_abs_name]
                         else:
                             factor = None
 
@@ -327,11 +324,12 @@ class AssembledJacobian(Jacobian):
         with system._unscaled_context(
                 outputs=[d_outputs], residuals=[d_residuals]):
             if mode == 'fwd':
-                d_residuals.iadd_data(int_mtx._prod(d_outputs.get_data(), mode, int_ranges))
+                d_residuals.iadd_data(int_mtx._prod(d_outputs._get_data_view(), mode,
+                                                    int_ranges))
                 if ext_mtx is not None:
-                    d_residuals.iadd_data(ext_mtx._prod(d_inputs.get_data(), mode, None))
+                    d_residuals.iadd_data(ext_mtx._prod(d_inputs._get_data_view(), mode, None))
             elif mode == 'rev':
-                dresids = d_residuals.get_data()
+                dresids = d_residuals._get_data_view()
                 d_outputs.iadd_data(int_mtx._prod(dresids, mode, int_ranges))
                 if ext_mtx is not None:
                     d_inputs.iadd_data(ext_mtx._prod(dresids, mode, None))
@@ -7,12 +7,14 @@ from six.moves import range
 import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
+from scipy.sparse import issparse
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
 from openmdao.matrices.dense_matrix import DenseMatrix
+from openmdao.utils.coloring import color_columns
 
 
 class DirectSolver(LinearSolver):
@@ -23,6 +25,20 @@ class DirectSolver(LinearSolver):
     ----------
     _print_name : str ('Direct')
         print name.
+    _lu_mtx : ndarray or None
+        Copy of the matrix (dense) or matrix data (sparse) that was last factored.
+    _lu_src : object or None
+        Sparse matrix object that was last factored, used to detect a rebuilt matrix.
+    _perm_c : ndarray or None
+        Column ordering reused across sparse refactorizations.
+    _lu_perm : ndarray or None
+        Column ordering applied to the matrix before the current sparse factorization.
+    _reuse_count : int
+        Number of linearizations since the last factorization.
+    _probe_pattern : csc_matrix or None
+        Sparsity of the matrix when it is assembled by probing.
+    _probe_colors : list of (ndarray, ndarray)
+        For each color, the columns and the pattern entries in those columns.
     """
 
     SOLVER = 'LN: Direct'
@@ -39,13 +55,69 @@ class DirectSolver(LinearSolver):
         super(DirectSolver, self).__init__(**kwargs)
 
         self._print_name = 'Direct'
+        self._lu_mtx = None
+        self._lu_src = None
+        self._perm_c = None
+        self._lu_perm = None
+        self._reuse_count = 0
+        self._probe_pattern = None
+        self._probe_colors = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('permc_spec', default='COLAMD',
+                             values=['NATURAL', 'MMD_ATA', 'MMD_AT_PLUS_A', 'COLAMD'],
+                             desc='Column ordering used by the sparse LU factorization. '
+                                  'The ordering found by the first factorization is kept for '
+                                  'later refactorizations of a CSC matrix.')
+        self.options.declare('probe_sparsity', type_=bool, default=False,
+                             desc='When there is no AssembledJacobian, find the sparsity of the '
+                                  'matrix from the declared partials and assemble it as a sparse '
+                                  'matrix using colored matrix-vector products, instead of a dense '
+                                  'matrix using one product per column.')
+        self.options.declare('max_reuse', type_=int, default=0, lower=0,
+                             desc='Number of linearizations that keep using the current '
+                                  'factorization, even if the matrix has changed, before it is '
+                                  'recomputed (modified Newton). Derivatives computed with a '
+                                  'reused factorization are approximate.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(DirectSolver, self)._setup_solvers(system, depth)
+
+        self._lu_mtx = None
+        self._lu_src = None
+        self._perm_c = None
+        self._lu_perm = None
+        self._reuse_count = 0
+        self._probe_pattern = None
+        self._probe_colors = None
 
     def _linearize(self):
         """
         Perform factorization.
+
+        The factorization is skipped if the matrix hasn't changed since the last one, or if
+        it is being reused under the 'max_reuse' option.
         """
         system = self._system
 
+        if self._lu_mtx is not None and self._reuse_count < self.options['max_reuse']:
+            self._reuse_count += 1
+            return
+        self._reuse_count = 0
+
         if system._owns_assembled_jac or system._views_assembled_jac:
             ranges = system._jacobian._view_ranges[system.pathname]
             mtx = system._jacobian._int_mtx
@@ -53,10 +125,20 @@ class DirectSolver(LinearSolver):
             if isinstance(mtx, DenseMatrix):
                 matrix = mtx._matrix[ranges[0]:ranges[1], ranges[0]:ranges[1]]
                 np.set_printoptions(precision=3)
-                self._lup = scipy.linalg.lu_factor(matrix)
+                if self._lu_mtx is None or not np.array_equal(matrix, self._lu_mtx):
+                    self._lu_mtx = matrix.copy()
+                    self._lup = scipy.linalg.lu_factor(matrix)
             elif isinstance(mtx, (CSRMatrix, CSCMatrix)):
                 np.set_printoptions(precision=3)
-                self._lu = scipy.sparse.linalg.splu(mtx._matrix)
+                matrix = mtx._matrix
+                if matrix is not self._lu_src:
+                    # the matrix was rebuilt, so its structure may have changed.
+                    self._lu_src = matrix
+                    self._lu_mtx = None
+                    self._perm_c = None
+                if self._lu_mtx is None or not np.array_equal(matrix.data, self._lu_mtx):
+                    self._lu_mtx = matrix.data.copy()
+                    self._factor_sparse(matrix)
             elif isinstance(mtx, COOMatrix):
                 # calling scipy.sparse.linalg.splu on a COO actually transposes
                 # the matrix during conversion to csc prior to LU decomp
@@ -71,18 +153,211 @@ class DirectSolver(LinearSolver):
             b_data = system._vectors['residual']['linear'].get_data()
             x_data = system._vectors['output']['linear'].get_data()
 
-            # Assemble the Jacobian by running the identity matrix through apply_linear
-            nmtx = x_data.size
-            eye = np.eye(nmtx)
-            mtx = np.empty((nmtx, nmtx))
-            for i in range(nmtx):
-                self._mat_vec(eye[:, i], mtx[:, i])
+            # The matrix is always assembled in fwd mode, since solve() handles the transpose
+            # for rev.
+            self._mode = 'fwd'
+
+            if self.options['probe_sparsity']:
+                mtx = self._probe_mtx()
+            else:
+                # Assemble the Jacobian by running the identity matrix through apply_linear
+                nmtx = x_data.size
+                eye = np.eye(nmtx)
+                mtx = np.empty((nmtx, nmtx))
+                for i in range(nmtx):
+                    self._mat_vec(eye[:, i], mtx[:, i])
 
             # Restore the backed-up vectors
             system._vectors['residual']['linear'].set_data(b_data)
             system._vectors['output']['linear'].set_data(x_data)
 
-            self._lup = scipy.linalg.lu_factor(mtx)
+            if self.options['probe_sparsity']:
+                if self._lu_mtx is None or not np.array_equal(mtx.data, self._lu_mtx):
+                    self._lu_mtx = mtx.data
+                    self._factor_sparse(mtx)
+            elif self._lu_mtx is None or not np.array_equal(mtx, self._lu_mtx):
+                self._lu_mtx = mtx
+                self._lup = scipy.linalg.lu_factor(mtx)
+
+    def _probe_mtx(self):
+        """
+        Assemble a sparse matrix with one matrix-vector product per color of its columns.
+
+        The sparsity is determined on the first call from the declared partials and the
+        connections.
+
+        Returns
+        -------
+        csc_matrix
+            the assembled matrix.
+        """
+        if self._probe_pattern is None:
+            self._probe_pattern = pattern = self._get_mtx_free_sparsity()
+
+            # for each color, its columns and the entries of the pattern in those columns
+            entry_cols = np.repeat(np.arange(pattern.shape[1]), np.diff(pattern.indptr))
+            self._probe_colors = [(cols, np.nonzero(np.in1d(entry_cols, cols))[0])
+                                  for cols in color_columns(pattern)]
+
+        pattern = self._probe_pattern
+        nmtx = pattern.shape[0]
+
+        data = np.zeros(pattern.indices.size)
+        seed = np.zeros(nmtx)
+        prod = np.empty(nmtx)
+        for cols, entries in self._probe_colors:
+            seed[cols] = 1.0
+            self._mat_vec(seed, prod)
+            seed[cols] = 0.0
+            data[entries] = prod[pattern.indices[entries]]
+
+        return scipy.sparse.csc_matrix((data, pattern.indices, pattern.indptr),
+                                       shape=pattern.shape)
+
+    def _get_mtx_free_sparsity(self):
+        """
+        Determine the sparsity of the matrix from the declared partials and the connections.
+
+        Partials that weren't declared, matrix-free components and groups that approximate
+        their jacobian are treated as dense.
+
+        Returns
+        -------
+        csc_matrix
+            matrix with ones at the possibly nonzero entries.
+        """
+        system = self._system
+        iproc = system.comm.rank
+        in2out = system._conn_global_abs_in2out
+        abs2meta_in = system._var_abs2meta['input']
+
+        var_sizes = {}
+        for type_ in ('input', 'output'):
+            sizes = system._var_sizes[type_][iproc, :]
+            abs2idx = system._var_allprocs_abs2idx[type_]
+            for abs_name in system._var_abs_names[type_]:
+                var_sizes[abs_name] = sizes[abs2idx[abs_name]]
+
+        sizes = system._var_sizes['output'][iproc, :]
+        starts = np.cumsum(sizes) - sizes
+        abs2idx = system._var_allprocs_abs2idx['output']
+        offsets = {abs_name: starts[abs2idx[abs_name]]
+                   for abs_name in system._var_abs_names['output']}
+        nmtx = np.sum(sizes)
+
+        # always keep the diagonal
+        rows = [np.arange(nmtx)]
+        cols = [np.arange(nmtx)]
+
+        stack = [system]
+        while stack:
+            sub = stack.pop()
+
+            if sub._owns_approx_jac:
+                for res_name in sub._var_abs_names['output']:
+                    nres = var_sizes[res_name]
+                    rows.append(np.repeat(np.arange(nres) + offsets[res_name], nmtx))
+                    cols.append(np.tile(np.arange(nmtx), nres))
+                continue
+
+            if sub._subsystems_myproc:
+                stack.extend(sub._subsystems_myproc)
+                continue
+
+            wrts = [(name, offsets[name], None) for name in sub._var_abs_names['output']]
+            for in_name in sub._var_abs_names['input']:
+                # inputs connected outside of this system aren't part of the matrix.
+                if in_name in in2out and in2out[in_name] in offsets:
+                    src = in2out[in_name]
+                    wrts.append((in_name, offsets[src], abs2meta_in[in_name]['src_indices']))
+
+            for res_name in sub._var_abs_names['output']:
+                nres = var_sizes[res_name]
+
+                for wrt_name, col_offset, src_indices in wrts:
+                    nwrt = var_sizes[wrt_name]
+                    meta = None
+                    if not sub.matrix_free:
+                        meta = sub._subjacs_info.get((res_name, wrt_name))
+
+                    if meta is None:
+                        r = np.repeat(np.arange(nres), nwrt)
+                        c = np.tile(np.arange(nwrt), nres)
+                    elif not meta['dependent']:
+                        continue
+                    elif meta['rows'] is not None:
+                        r = meta['rows']
+                        c = meta['cols']
+                    elif issparse(meta['value']):
+                        coo = meta['value'].tocoo()
+                        r = coo.row
+                        c = coo.col
+                    else:
+                        r = np.repeat(np.arange(nres), nwrt)
+                        c = np.tile(np.arange(nwrt), nres)
+
+                    if src_indices is not None:
+                        c = np.asarray(src_indices).ravel()[c]
+
+                    rows.append(offsets[res_name] + r)
+                    cols.append(col_offset + c)
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        pattern = scipy.sparse.csc_matrix((np.ones(rows.size), (rows, cols)),
+                                          shape=(nmtx, nmtx))
+        pattern.sum_duplicates()
+        pattern.sort_indices()
+        pattern.data[:] = 1.0
+
+        return pattern
+
+    def _factor_sparse(self, matrix):
+        """
+        Perform the sparse LU factorization, reusing the column ordering for CSC matrices.
+
+        Parameters
+        ----------
+        matrix : csc_matrix or csr_matrix
+            the matrix to factor.
+        """
+        if self._perm_c is None:
+            self._lu = scipy.sparse.linalg.splu(matrix, permc_spec=self.options['permc_spec'])
+            self._lu_perm = None
+            if isinstance(matrix, scipy.sparse.csc_matrix):
+                # L U = Pr A Pc, so later refactorizations can use A[:, argsort(perm_c)]
+                # with the natural ordering.
+                self._perm_c = np.argsort(self._lu.perm_c)
+        else:
+            self._lu = scipy.sparse.linalg.splu(matrix[:, self._perm_c], permc_spec='NATURAL')
+            self._lu_perm = self._perm_c
+
+    def _sparse_solve(self, b_data, trans):
+        """
+        Solve using the sparse LU factorization.
+
+        Parameters
+        ----------
+        b_data : ndarray
+            right-hand side(s).
+        trans : str
+            'N' to solve with the matrix or 'T' to solve with its transpose.
+
+        Returns
+        -------
+        ndarray
+            solution(s).
+        """
+        perm_c = self._lu_perm
+        if perm_c is None:
+            return self._lu.solve(b_data, trans)
+
+        if trans == 'N':
+            x_data = np.empty(b_data.shape)
+            x_data[perm_c] = self._lu.solve(b_data, trans)
+            return x_data
+        else:
+            return self._lu.solve(b_data[perm_c], trans)
 
     def _mat_vec(self, in_vec, out_vec):
         """
@@ -113,7 +388,7 @@ class DirectSolver(LinearSolver):
         # put new value in out_vec
         b_vec.get_data(out_vec)
 
-    def solve(self, vec_names, mode):
+    def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
 
@@ -123,6 +398,9 @@ class DirectSolver(LinearSolver):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -135,6 +413,7 @@ class DirectSolver(LinearSolver):
         """
         self._vec_names = vec_names
         self._mode = mode
+        self._rel_systems = rel_systems
 
         system = self._system
 
@@ -158,17 +437,87 @@ class DirectSolver(LinearSolver):
             # AssembledJacobians are unscaled.
             if system._owns_assembled_jac or system._views_assembled_jac:
                 with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
-                    b_data = b_vec.get_data()
+                    b_data = b_vec._get_data_view()
                     if (isinstance(system._jacobian._int_mtx, (COOMatrix, CSRMatrix, CSCMatrix))):
-                        x_data = self._lu.solve(b_data, trans_splu)
+                        x_data = self._sparse_solve(b_data, trans_splu)
                     else:
                         x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
                     x_vec.set_data(x_data)
 
             # MVP-generated jacobians are scaled.
             else:
-                b_data = b_vec.get_data()
-                x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
+                b_data = b_vec._get_data_view()
+                if self.options['probe_sparsity']:
+                    x_data = self._sparse_solve(b_data, trans_splu)
+                else:
+                    x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
                 x_vec.set_data(x_data)
 
         return False, 0., 0.
+
+    def _solve_multi(self, vec_name, mode, rhs):
+        """
+        Solve the linear system for a block of right-hand sides with a single LU solve.
+
+        Parameters
+        ----------
+        vec_name : str
+            name of the right-hand-side vector.
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            array whose columns are the scaled right-hand sides (combines all varsets).
+
+        Returns
+        -------
+        ndarray
+            array whose columns are the scaled solutions (combines all varsets).
+        """
+        self._vec_names = [vec_name]
+        self._mode = mode
+        self._rel_systems = None
+
+        system = self._system
+        d_residuals = system._vectors['residual'][vec_name]
+        d_outputs = system._vectors['output'][vec_name]
+
+        # assign x and b vectors based on mode
+        if mode == 'fwd':
+            x_vec = d_outputs
+            b_vec = d_residuals
+            trans_lu = 0
+            trans_splu = 'N'
+        elif mode == 'rev':
+            x_vec = d_residuals
+            b_vec = d_outputs
+            trans_lu = 1
+            trans_splu = 'T'
+
+        ncols = rhs.shape[1]
+
+        # AssembledJacobians are unscaled.
+        if system._owns_assembled_jac or system._views_assembled_jac:
+            b_data = np.empty(rhs.shape)
+            for i in range(ncols):
+                b_vec.set_data(rhs[:, i])
+                with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                    b_vec.get_data(b_data[:, i])
+
+            if (isinstance(system._jacobian._int_mtx, (COOMatrix, CSRMatrix, CSCMatrix))):
+                x_data = self._sparse_solve(b_data, trans_splu)
+            else:
+                x_data = scipy.linalg.lu_solve(self._lup, b_data, trans=trans_lu)
+
+            sol = np.empty(rhs.shape)
+            for i in range(ncols):
+                with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                    x_vec.set_data(x_data[:, i])
+                x_vec.get_data(sol[:, i])
+
+            return sol
+
+        # MVP-generated jacobians are scaled.
+        elif self.options['probe_sparsity']:
+            return self._sparse_solve(rhs, trans_splu)
+        else:
+            return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
@@ -19,19 +19,22 @@ class LinearBlockGS(BlockLinearSolver):
         system = self._system
         mode = self._mode
         vec_names = self._vec_names
+        rel_systems = self._rel_systems
 
         if mode == 'fwd':
             for ind, subsys in enumerate(system._subsystems_myproc):
+                if rel_systems is not None and subsys.pathname not in rel_systems:
+                    continue
                 isub = system._subsystems_myproc_inds[ind]
                 for vec_name in vec_names:
                     system._transfer(vec_name, mode, isub)
                 scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+                subsys._apply_linear(vec_names, mode, scope_out, scope_in, rel_systems)
                 for vec_name in vec_names:
                     b_vec = system._vectors['residual'][vec_name]
                     b_vec *= -1.0
                     b_vec += self._rhs_vecs[vec_name]
-                subsys._solve_linear(vec_names, mode)
+                subsys._solve_linear(vec_names, mode, rel_systems)
 
         elif mode == 'rev':
             subsystems = system._subsystems_allprocs
@@ -39,12 +42,14 @@ class LinearBlockGS(BlockLinearSolver):
             for revidx in range(len(system._subsystems_myproc) - 1, -1, -1):
                 isub = subinds[revidx]
                 subsys = subsystems[isub]
+                if rel_systems is not None and subsys.pathname not in rel_systems:
+                    continue
                 for vec_name in vec_names:
                     b_vec = system._vectors['output'][vec_name]
                     b_vec.set_const(0.0)
                     system._transfer(vec_name, mode, isub)
                     b_vec *= -1.0
                     b_vec += self._rhs_vecs[vec_name]
-                subsys._solve_linear(vec_names, mode)
+                subsys._solve_linear(vec_names, mode, rel_systems)
                 scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+                subsys._apply_linear(vec_names, mode, scope_out, scope_in, rel_systems)
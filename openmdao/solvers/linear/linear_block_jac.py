@@ -16,28 +16,32 @@ class LinearBlockJac(BlockLinearSolver):
         system = self._system
         mode = self._mode
         vec_names = self._vec_names
+        rel_systems = self._rel_systems
+
+        subsystems = [subsys for subsys in system._subsystems_myproc
+                      if rel_systems is None or subsys.pathname in rel_systems]
 
         if mode == 'fwd':
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
-            for subsys in system._subsystems_myproc:
+            for subsys in subsystems:
                 scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+                subsys._apply_linear(vec_names, mode, scope_out, scope_in, rel_systems)
             for vec_name in vec_names:
                 b_vec = system._vectors['residual'][vec_name]
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
-            for subsys in system._subsystems_myproc:
-                subsys._solve_linear(vec_names, mode)
+            for subsys in subsystems:
+                subsys._solve_linear(vec_names, mode, rel_systems)
         elif mode == 'rev':
-            for subsys in system._subsystems_myproc:
+            for subsys in subsystems:
                 scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+                subsys._apply_linear(vec_names, mode, scope_out, scope_in, rel_systems)
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
 
                 b_vec = system._vectors['output'][vec_name]
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
-            for subsys in system._subsystems_myproc:
-                subsys._solve_linear(vec_names, mode)
+            for subsys in subsystems:
+                subsys._solve_linear(vec_names, mode, rel_systems)
@@ -12,7 +12,7 @@ class LinearRunOnce(LinearBlockGS):
 
     SOLVER = 'LN: RUNONCE'
 
-    def solve(self, vec_names, mode):
+    def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
 
@@ -22,6 +22,9 @@ class LinearRunOnce(LinearBlockGS):
             List of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -32,17 +35,16 @@ class LinearRunOnce(LinearBlockGS):
         """
         self._vec_names = vec_names
         self._mode = mode
+        self._rel_systems = rel_systems
         system = self._system
 
         # Preprocessing
-        self._rhs_vecs = {}
         if self._mode == 'fwd':
             b_vecs = system._vectors['residual']
         else:  # rev
             b_vecs = system._vectors['output']
 
-        for vec_name in self._vec_names:
-            self._rhs_vecs[vec_name] = b_vecs[vec_name]._clone()
+        self._set_rhs_vecs(b_vecs)
 
         # Single iteration of GS
         self._iter_execute()
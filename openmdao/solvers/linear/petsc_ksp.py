@@ -293,7 +293,8 @@ class PetscKSP(LinearSolver):
 
         # apply linear
         scope_out, scope_in = system._get_scope()
-        system._apply_linear([vec_name], self._mode, scope_out, scope_in)
+        system._apply_linear([vec_name], self._mode, scope_out, scope_in,
+                             self._rel_systems)
 
         # stuff resulting value of b vector into result for KSP
         b_vec.get_data(result.array)
@@ -317,7 +318,7 @@ class PetscKSP(LinearSolver):
         if self.precon is not None:
             self.precon._linearize()
 
-    def solve(self, vec_names, mode):
+    def solve(self, vec_names, mode, rel_systems=None):
         """
         Solve the linear system for the problem in self._system.
 
@@ -329,6 +330,9 @@ class PetscKSP(LinearSolver):
             list of vector names.
         mode : string
             Derivative mode, can be 'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -341,6 +345,7 @@ class PetscKSP(LinearSolver):
         """
         self._vec_names = vec_names
         self._mode = mode
+        self._rel_systems = rel_systems
 
         system = self._system
         options = self.options
@@ -415,7 +420,7 @@ class PetscKSP(LinearSolver):
 
             # call the preconditioner
             self._solver_info.prefix += '| precon:'
-            self.precon.solve([vec_name], mode)
+            self.precon.solve([vec_name], mode, self._rel_systems)
             self._solver_info.prefix = self._solver_info.prefix[:-9]
 
             # stuff resulting value of x vector into result for KSP
@@ -129,7 +129,8 @@ class ScipyIterativeSolver(LinearSolver):
 
         x_vec.set_data(in_vec)
         scope_out, scope_in = system._get_scope()
-        system._apply_linear([vec_name], self._mode, scope_out, scope_in)
+        system._apply_linear([vec_name], self._mode, scope_out, scope_in,
+                             self._rel_systems)
 
         # print('in', in_vec)
         # print('out', b_vec.get_data())
@@ -153,7 +154,7 @@ class ScipyIterativeSolver(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
-    def solve(self, vec_names, mode):
+    def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
 
@@ -163,6 +164,9 @@ class ScipyIterativeSolver(LinearSolver):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -175,6 +179,7 @@ class ScipyIterativeSolver(LinearSolver):
         """
         self._vec_names = vec_names
         self._mode = mode
+        self._rel_systems = rel_systems
 
         system = self._system
         solver = self.options['solver']
@@ -251,7 +256,7 @@ class ScipyIterativeSolver(LinearSolver):
 
         # call the preconditioner
         self._solver_info.prefix += '| precon:'
-        self.precon.solve([vec_name], mode)
+        self.precon.solve([vec_name], mode, self._rel_systems)
         self._solver_info.prefix = self._solver_info.prefix[:-9]
 
         # return resulting value of x vector
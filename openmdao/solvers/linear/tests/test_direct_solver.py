@@ -3,15 +3,37 @@
 from __future__ import division, print_function
 
 import unittest
+from itertools import product
 
+import numpy as np
 
-from openmdao.api import Problem, Group, IndepVarComp, DirectSolver
+from openmdao.api import Problem, Group, IndepVarComp, DirectSolver, ScipyIterativeSolver, \
+     DenseJacobian, CSCJacobian, NewtonSolver, ExplicitComponent
 from openmdao.devtools.testutil import assert_rel_error
 from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 
 
+class DiagScale(ExplicitComponent):
+    """y = a * x, with a diagonal partial."""
+
+    def initialize(self):
+        self.metadata.declare('n', type_=int, default=1)
+        self.metadata.declare('a', type_=float, default=1.)
+
+    def setup(self):
+        n = self.metadata['n']
+        self.add_input('x', np.ones(n))
+        self.add_output('y', np.ones(n))
+
+        arange = np.arange(n)
+        self.declare_partials('y', 'x', rows=arange, cols=arange, val=self.metadata['a'])
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = self.metadata['a'] * inputs['x']
+
+
 class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_class = DirectSolver
@@ -62,6 +84,133 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
         assert_rel_error(self, output[1], g1.expected_solution[0], 3e-15)
         assert_rel_error(self, output[5], g1.expected_solution[1], 3e-15)
 
+    def test_multi_rhs_totals(self):
+        """all the columns for a design variable are solved in a single pass"""
+
+        class CountedDirectSolver(DirectSolver):
+            def solve(self, vec_names, mode, rel_systems=None):
+                self.nsolves += 1
+                return super(CountedDirectSolver, self).solve(vec_names, mode, rel_systems)
+
+            def _solve_multi(self, vec_name, mode, rhs):
+                self.nmulti += 1
+                return super(CountedDirectSolver, self)._solve_multi(vec_name, mode, rhs)
+
+        wrt = ['z', 'x']
+        of = ['obj', 'con1', 'con2']
+
+        for mode in ('fwd', 'rev'):
+            prob = Problem(model=SellarDerivatives(linear_solver=ScipyIterativeSolver()))
+            prob.setup(check=False, mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+            expected = prob.compute_total_derivs(of=of, wrt=wrt)
+
+            for jac_class in (None, DenseJacobian, CSCJacobian):
+                solver = CountedDirectSolver()
+                prob = Problem(model=SellarDerivatives(linear_solver=solver))
+                if jac_class is not None:
+                    prob.model.jacobian = jac_class()
+                prob.setup(check=False, mode=mode)
+                prob.set_solver_print(level=0)
+                prob.run_model()
+
+                solver.nsolves = solver.nmulti = 0
+                J = prob.compute_total_derivs(of=of, wrt=wrt)
+
+                # one block solve per variable of interest, and no column-by-column solves
+                self.assertEqual(solver.nsolves, 0)
+                self.assertEqual(solver.nmulti, len(wrt) if mode == 'fwd' else len(of))
+                for key, val in J.items():
+                    assert_rel_error(self, val, expected[key], 1e-8)
+
+    def test_factorization_reuse(self):
+        """the factorization is only recomputed when the matrix changes"""
+
+        for mode, jac_class in product(('fwd', 'rev'), (None, DenseJacobian, CSCJacobian)):
+            solver = DirectSolver()
+            prob = Problem(model=SellarDerivatives(linear_solver=solver))
+            if jac_class is not None:
+                prob.model.jacobian = jac_class()
+            prob.setup(check=False, mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            prob.compute_total_derivs(of=['obj', 'con1'], wrt=['x', 'z'])
+            lu = solver._lu if jac_class is CSCJacobian else solver._lup
+
+            prob.model._linearize()
+            self.assertIs(solver._lu if jac_class is CSCJacobian else solver._lup, lu)
+
+            # move to a new point; the CSC refactorization reuses the column ordering.
+            prob['x'] = 2.0
+            prob['z'] = [3.0, 1.0]
+            prob.run_model()
+            J = prob.compute_total_derivs(of=['obj', 'con1'], wrt=['x', 'z'])
+            self.assertIsNot(solver._lu if jac_class is CSCJacobian else solver._lup, lu)
+            if jac_class is CSCJacobian:
+                self.assertIsNotNone(solver._lu_perm)
+
+            fresh = Problem(model=SellarDerivatives(linear_solver=ScipyIterativeSolver()))
+            fresh.setup(check=False)
+            fresh.set_solver_print(level=0)
+            fresh['x'] = 2.0
+            fresh['z'] = [3.0, 1.0]
+            fresh.run_model()
+            expected = fresh.compute_total_derivs(of=['obj', 'con1'], wrt=['x', 'z'])
+
+            for key, val in J.items():
+                assert_rel_error(self, val, expected[key], 1e-8)
+
+    def test_max_reuse(self):
+        """modified Newton still converges to the same answer"""
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=NewtonSolver(),
+                                               linear_solver=DirectSolver(max_reuse=3)))
+        prob.model.jacobian = CSCJacobian()
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def test_probe_sparsity(self):
+        """the probed sparse matrix gives the same totals as the dense one"""
+
+        for mode in ('fwd', 'rev'):
+            prob = Problem(model=SellarDerivatives(
+                linear_solver=DirectSolver(probe_sparsity=True)))
+            prob.setup(check=False, mode=mode)
+            prob.run_model()
+
+            J = prob.compute_total_derivs(of=['obj', 'con1'], wrt=['x', 'z'],
+                                          return_format='flat_dict')
+            assert_rel_error(self, J['obj', 'z'][0], [9.61001056, 1.78448534], .00001)
+            assert_rel_error(self, J['obj', 'x'][0], [2.98061391], .00001)
+            assert_rel_error(self, J['con1', 'z'][0], [-9.61002186, -0.78449158], .00001)
+            assert_rel_error(self, J['con1', 'x'][0], [-0.98061448], .00001)
+
+        n = 8
+        for mode in ('fwd', 'rev'):
+            prob = Problem()
+            model = prob.model
+            model.add_subsystem('px', IndepVarComp('x', np.arange(n) + 1.0))
+            model.add_subsystem('c1', DiagScale(n=n, a=2.))
+            model.add_subsystem('c2', DiagScale(n=n, a=3.))
+            model.connect('px.x', 'c1.x')
+            model.connect('c1.y', 'c2.x')
+            model.linear_solver = DirectSolver(probe_sparsity=True)
+
+            prob.setup(check=False, mode=mode)
+            prob.run_model()
+
+            J = prob.compute_total_derivs(of=['c2.y'], wrt=['px.x'])
+            assert_rel_error(self, J['c2.y', 'px.x'], 6. * np.eye(n), 1e-12)
+
+            # the columns of each block are diagonal, so two products are enough.
+            self.assertEqual(len(model.linear_solver._probe_colors), 2)
+
 
 class TestDirectSolverFeature(unittest.TestCase):
 
@@ -4,9 +4,11 @@ from __future__ import division, print_function
 import unittest
 
 import numpy as np
+from six.moves import cStringIO as StringIO
 
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
 from openmdao.devtools.testutil import assert_rel_error
+from openmdao.devtools.debug import solver_workspace
 from openmdao.api import LinearBlockGS, Problem, Group, ImplicitComponent, IndepVarComp, \
     DirectSolver, NewtonSolver, ScipyIterativeSolver, AssembledJacobian, ExecComp, NonlinearBlockGS
 from openmdao.test_suite.components.sellar import SellarImplicitDis1, SellarImplicitDis2, \
@@ -123,6 +125,39 @@ class TestBGSSolver(LinearSolverTests.LinearSolverTestCase):
         # Newton is kinda slow on this for some reason, this is how far it gets with directsolver too.
         self.assertLess(res, 2.0e-2)
 
+    def test_rhs_workspace(self):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.nonlinear_solver = NonlinearBlockGS()
+        model.linear_solver = self.linear_solver_class()
+        model.linear_solver.options['maxiter'] = 20
+
+        prob.setup(check=False, mode='rev')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        # the workspace is allocated during setup and reused by every solve
+        rhs_vec = model.linear_solver._rhs_vecs['linear']
+        self.assertEqual(len(rhs_vec), len(model._vectors['output']['linear']))
+
+        for i in range(2):
+            J = prob.compute_total_derivs(of=['y1', 'y2'], wrt=['x', 'z'])
+            assert_rel_error(self, J['y1', 'x'][0][0], 0.98061448, 1e-6)
+            assert_rel_error(self, J['y2', 'z'][0][0], 1.94989072, 1e-6)
+            self.assertIs(model.linear_solver._rhs_vecs['linear'], rhs_vec)
+
+        stream = StringIO()
+        total = solver_workspace(model, stream)
+        self.assertEqual(total, len(rhs_vec) * 8)
+        self.assertIn('<model> linear_solver %s: %d bytes' %
+                      (self.linear_solver_class.__name__, total), stream.getvalue())
+
     def test_error_under_assembled_jac(self):
         prob = Problem()
         model = prob.model = Group()
@@ -5,7 +5,7 @@ from __future__ import division, print_function
 import os
 
 import numpy as np
-
+from six import iteritems, itervalues
 
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian
@@ -46,6 +46,9 @@ class Solver(object):
         List of right-hand-side (RHS) vector names.
     _mode : str
         'fwd' or 'rev', applicable to linear solvers only.
+    _rel_systems : set or None
+        Set of pathnames of the systems relevant to the current right-hand side,
+        applicable to linear solvers only. If None, all systems are relevant.
     _iter_count : int
         Number of iterations for the current invocation of the solver.
     _solver_info : <SolverInfo>
@@ -73,6 +76,7 @@ class Solver(object):
         self._depth = 0
         self._vec_names = None
         self._mode = 'fwd'
+        self._rel_systems = None
         self._iter_count = 0
 
         self.options = OptionsDictionary()
@@ -343,9 +347,88 @@ class NonlinearSolver(Solver):
 class LinearSolver(Solver):
     """
     Base class for linear solvers.
+
+    Attributes
+    ----------
+    _rhs_vecs : {str: <Vector>, ...}
+        Workspace vectors, keyed by vec_name, that hold a copy of the right-hand side
+        during iteration. They are allocated once and reused by every solve.
     """
 
-    def solve(self, vec_names, mode):
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(LinearSolver, self).__init__(**kwargs)
+        self._rhs_vecs = {}
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(LinearSolver, self)._setup_solvers(system, depth)
+        self._rhs_vecs = {}
+
+    def _setup_rhs_vecs(self):
+        """
+        Allocate a right-hand-side workspace vector for each linear vec_name.
+
+        The residual and output vectors share the same layout, so a single workspace
+        serves both the fwd and rev modes.
+        """
+        for vec_name, vec in iteritems(self._system._vectors['output']):
+            if vec_name != 'nonlinear':
+                self._rhs_vecs[vec_name] = vec._clone()
+
+    def _set_rhs_vecs(self, b_vecs):
+        """
+        Copy the current right-hand sides into the workspace vectors.
+
+        Parameters
+        ----------
+        b_vecs : {str: <Vector>, ...}
+            right-hand-side vectors, keyed by vec_name.
+        """
+        rhs_vecs = self._rhs_vecs
+        for vec_name in self._vec_names:
+            b_vec = b_vecs[vec_name]
+            rhs_vec = rhs_vecs.get(vec_name)
+            if rhs_vec is None or len(rhs_vec) != len(b_vec):
+                rhs_vecs[vec_name] = b_vec._clone()
+            else:
+                rhs_vec.set_vec(b_vec)
+
+    def _get_workspace_size(self):
+        """
+        Return the memory held by the workspace vectors of this solver.
+
+        Returns
+        -------
+        int
+            size of the workspace, in bytes.
+        """
+        nbytes = 0
+        for vec in itervalues(self._rhs_vecs):
+            for data in itervalues(vec._data):
+                nbytes += data.nbytes
+            if vec._alloc_complex:
+                for data in itervalues(vec._imag_data):
+                    nbytes += data.nbytes
+        return nbytes
+
+    def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
 
@@ -355,6 +438,9 @@ class LinearSolver(Solver):
             list of names of the right-hand-side vectors.
         mode : str
             'fwd' or 'rev'.
+        rel_systems : set or None
+            Set of pathnames of the systems relevant to the current right-hand side.
+            If None, all systems are relevant.
 
         Returns
         -------
@@ -367,8 +453,46 @@ class LinearSolver(Solver):
         """
         self._vec_names = vec_names
         self._mode = mode
+        self._rel_systems = rel_systems
         return self._run_iterator()
 
+    def _solve_multi(self, vec_name, mode, rhs):
+        """
+        Solve the linear system for a block of right-hand sides.
+
+        This version solves one column at a time; solvers that can handle all the
+        columns in a single pass should override it.
+
+        Parameters
+        ----------
+        vec_name : str
+            name of the right-hand-side vector.
+        mode : str
+            'fwd' or 'rev'.
+        rhs : ndarray
+            array whose columns are the scaled right-hand sides (combines all varsets).
+
+        Returns
+        -------
+        ndarray
+            array whose columns are the scaled solutions (combines all varsets).
+        """
+        system = self._system
+        if mode == 'fwd':
+            x_vec = system._vectors['output'][vec_name]
+            b_vec = system._vectors['residual'][vec_name]
+        else:  # rev
+            x_vec = system._vectors['residual'][vec_name]
+            b_vec = system._vectors['output'][vec_name]
+
+        sol = np.empty(rhs.shape)
+        for i in range(rhs.shape[1]):
+            b_vec.set_data(rhs[:, i])
+            self.solve([vec_name], mode)
+            x_vec.get_data(sol[:, i])
+
+        return sol
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -382,14 +506,12 @@ class LinearSolver(Solver):
         """
         system = self._system
 
-        self._rhs_vecs = {}
         if self._mode == 'fwd':
             b_vecs = system._vectors['residual']
         else:  # rev
             b_vecs = system._vectors['output']
 
-        for vec_name in self._vec_names:
-            self._rhs_vecs[vec_name] = b_vecs[vec_name]._clone()
+        self._set_rhs_vecs(b_vecs)
 
         if self.options['maxiter'] > 1:
             norm = self._iter_get_norm()
@@ -409,7 +531,7 @@ class LinearSolver(Solver):
         """
         system = self._system
         scope_out, scope_in = system._get_scope()
-        system._apply_linear(self._vec_names, self._mode, scope_out, scope_in)
+        system._apply_linear(self._vec_names, self._mode, scope_out, scope_in, self._rel_systems)
 
         if self._mode == 'fwd':
             b_vecs = system._vectors['residual']
@@ -430,6 +552,20 @@ class BlockLinearSolver(LinearSolver):
     A base class for LinearBlockGS and LinearBlockJac.
     """
 
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(BlockLinearSolver, self)._setup_solvers(system, depth)
+        self._setup_rhs_vecs()
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -1,4 +1,5 @@
 """Surrogate model based on Kriging."""
+import multiprocessing
 
 import numpy as np
 import scipy.linalg as linalg
@@ -9,6 +10,289 @@ from openmdao.surrogate_models.surrogate_model import SurrogateModel
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# Bounds on the log of the correlation coefficients during training.
+LOG_THETA_BOUNDS = (np.log(1e-5), np.log(1e5))
+
+# Below this reciprocal condition number, the correlation matrix isn't factored with Cholesky
+# during training, and the original objective using the SVD-regularized matrix is used instead.
+CHOLESKY_RCOND = 1e-5
+
+# Maximum number of entries in the block of correlations between evaluation and training points
+# that is formed at once during prediction.
+CHUNK_ENTRIES = 2 ** 20
+
+
+def _pairwise_sq_distances(X):
+    """
+    Compute the squared distances between all pairs of points, one column per dimension.
+
+    Parameters
+    ----------
+    X : ndarray
+        points, of shape (n_samples, n_dims).
+
+    Returns
+    -------
+    ndarray
+        squared distances, of shape (n_samples * (n_samples - 1) / 2, n_dims).
+    tuple of ndarray
+        row and column indices of the pairs in the upper triangle of the correlation matrix.
+    """
+    ij = np.triu_indices(X.shape[0], 1)
+    return np.square(X[ij[0]] - X[ij[1]]), ij
+
+
+def _correlation_matrix(thetas, sq_dist, ij, n_samples, nugget):
+    """
+    Build the correlation matrix from the pairwise squared distances.
+
+    Parameters
+    ----------
+    thetas : ndarray
+        correlation coefficients.
+    sq_dist : ndarray
+        squared distances from _pairwise_sq_distances.
+    ij : tuple of ndarray
+        pair indices from _pairwise_sq_distances.
+    n_samples : int
+        number of training points.
+    nugget : double or ndarray
+        nugget smoothing parameter.
+
+    Returns
+    -------
+    ndarray
+        the correlation matrix.
+    ndarray
+        the correlations of the pairs.
+    """
+    r = np.exp(-sq_dist.dot(thetas))
+
+    R = np.empty((n_samples, n_samples))
+    R[ij] = r
+    R[ij[1], ij[0]] = r
+    R[np.diag_indices(n_samples)] = 1. + nugget
+
+    return R, r
+
+
+def _correlation_vectors(x_n, X, thetas):
+    """
+    Compute the correlations between evaluation points and training points.
+
+    Parameters
+    ----------
+    x_n : ndarray
+        normalized evaluation points, of shape (n_eval, n_dims).
+    X : ndarray
+        normalized training points, of shape (n_samples, n_dims).
+    thetas : ndarray
+        correlation coefficients.
+
+    Returns
+    -------
+    ndarray
+        correlations, of shape (n_eval, n_samples).
+    """
+    dist = np.zeros((x_n.shape[0], X.shape[0]), dtype=x_n.dtype)
+    for k, theta in enumerate(thetas):
+        dist += theta * np.square(x_n[:, k, np.newaxis] - X[:, k])
+    return np.exp(-dist)
+
+
+def _chunks(n_eval, n_samples):
+    """
+    Yield slices of evaluation points small enough to keep prediction memory bounded.
+
+    Parameters
+    ----------
+    n_eval : int
+        number of evaluation points.
+    n_samples : int
+        number of training points.
+
+    Yields
+    ------
+    slice
+        the evaluation points in the chunk.
+    """
+    size = max(1, CHUNK_ENTRIES // max(1, n_samples))
+    for start in range(0, n_eval, size):
+        yield slice(start, start + size)
+
+
+class _SingularCorrelation(Exception):
+    """
+    Raised when the correlation matrix is too ill-conditioned for a Cholesky factorization.
+    """
+
+    pass
+
+
+def _svd_likelihood_params(thetas, sq_dist, ij, Y, nugget):
+    """
+    Compute the reduced likelihood and the model parameters with the SVD of the correlation matrix.
+
+    Parameters
+    ----------
+    thetas : ndarray
+        correlation coefficients.
+    sq_dist : ndarray
+        squared distances from _pairwise_sq_distances.
+    ij : tuple of ndarray
+        pair indices from _pairwise_sq_distances.
+    Y : ndarray
+        normalized training outputs.
+    nugget : double or ndarray
+        nugget smoothing parameter.
+
+    Returns
+    -------
+    float
+        the reduced likelihood.
+    dict
+        the parameters of the model, with sigma2 for the normalized outputs.
+    """
+    n_samples = Y.shape[0]
+    R, _ = _correlation_matrix(thetas, sq_dist, ij, n_samples, nugget)
+
+    [U, S, Vh] = linalg.svd(R)
+
+    # Penrose-Moore Pseudo-Inverse:
+    # Given A = USV^* and Ax=b, the least-squares solution is
+    # x = V S^-1 U^* b.
+    # Tikhonov regularization is used to make the solution significantly
+    # more robust.
+    h = 1e-8 * S[0]
+    inv_factors = S / (S ** 2. + h ** 2.)
+
+    alpha = Vh.T.dot(np.einsum('j,kj,kl->jl', inv_factors, U, Y))
+    logdet = -np.sum(np.log(inv_factors))
+    sigma2 = np.dot(Y.T, alpha).sum(axis=0) / n_samples
+    reduced_likelihood = -(np.log(np.sum(sigma2)) +
+                           logdet / n_samples)
+
+    params = {'alpha': alpha, 'sigma2': sigma2, 'S_inv': inv_factors, 'U': U, 'Vh': Vh}
+
+    return reduced_likelihood, params
+
+
+def _neg_svd_likelihood(log_thetas, sq_dist, ij, Y, nugget):
+    """
+    Compute the negative reduced log-likelihood with the SVD-regularized correlation matrix.
+
+    Parameters
+    ----------
+    log_thetas : ndarray
+        log of the correlation coefficients.
+    sq_dist : ndarray
+        squared distances from _pairwise_sq_distances.
+    ij : tuple of ndarray
+        pair indices from _pairwise_sq_distances.
+    Y : ndarray
+        normalized training outputs.
+    nugget : double or ndarray
+        nugget smoothing parameter.
+
+    Returns
+    -------
+    float
+        negative reduced log-likelihood.
+    """
+    return -_svd_likelihood_params(np.exp(log_thetas), sq_dist, ij, Y, nugget)[0]
+
+
+def _neg_reduced_likelihood(log_thetas, sq_dist, ij, Y, nugget):
+    """
+    Compute the negative reduced log-likelihood and its gradient wrt the log-thetas.
+
+    The correlation matrix is factored with Cholesky.
+
+    Parameters
+    ----------
+    log_thetas : ndarray
+        log of the correlation coefficients.
+    sq_dist : ndarray
+        squared distances from _pairwise_sq_distances.
+    ij : tuple of ndarray
+        pair indices from _pairwise_sq_distances.
+    Y : ndarray
+        normalized training outputs.
+    nugget : double or ndarray
+        nugget smoothing parameter.
+
+    Returns
+    -------
+    float
+        negative reduced log-likelihood.
+    ndarray
+        its gradient wrt the log-thetas.
+
+    Raises
+    ------
+    _SingularCorrelation
+        If the correlation matrix is too ill-conditioned for a Cholesky factorization.
+    """
+    n_samples = Y.shape[0]
+    thetas = np.exp(log_thetas)
+    R, r = _correlation_matrix(thetas, sq_dist, ij, n_samples, nugget)
+
+    # Like in _svd_likelihood_params, sigma2 is summed over all pairs of outputs,
+    # which is the same as using the sum of the outputs.
+    y = np.sum(Y, axis=1)
+
+    try:
+        factor = linalg.cho_factor(R, lower=True)
+        rcond = linalg.lapack.dpocon(factor[0], np.abs(R).sum(axis=0).max(), uplo='L')[0]
+    except linalg.LinAlgError:
+        rcond = 0.
+
+    if rcond <= CHOLESKY_RCOND:
+        raise _SingularCorrelation()
+
+    alpha = linalg.cho_solve(factor, y)
+    sq_norm = y.dot(alpha)
+    logdet = 2. * np.sum(np.log(np.diag(factor[0])))
+
+    # Derivative of the likelihood wrt the entries of R.
+    dR = linalg.cho_solve(factor, np.eye(n_samples)) / n_samples
+    dR -= np.outer(alpha / sq_norm, alpha)
+
+    neg_likelihood = np.log(sq_norm / n_samples) + logdet / n_samples
+
+    # dR/dlog(theta_k) = -theta_k * sq_dist[:, k] * r on the pairs and their transposes.
+    grad = -2. * thetas * sq_dist.T.dot(r * dR[ij])
+
+    return neg_likelihood, grad
+
+
+def _train_start(args):
+    """
+    Maximize the reduced likelihood from one starting point.
+
+    If the correlation matrix gets too ill-conditioned for the analytic gradient, e.g., with
+    repeated training points, the optimization is restarted with the original objective and
+    finite differences.
+
+    Parameters
+    ----------
+    args : tuple
+        starting log-thetas, squared distances, pair indices, normalized outputs and nugget.
+
+    Returns
+    -------
+    OptimizeResult
+        the result of the optimization.
+    """
+    x0, sq_dist, ij, Y, nugget = args
+    bounds = [LOG_THETA_BOUNDS] * x0.size
+    try:
+        return minimize(_neg_reduced_likelihood, x0, args=(sq_dist, ij, Y, nugget),
+                        jac=True, method='slsqp', bounds=bounds)
+    except _SingularCorrelation:
+        return minimize(_neg_svd_likelihood, x0, args=(sq_dist, ij, Y, nugget),
+                        method='slsqp', options={'eps': 1e-3}, bounds=bounds)
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -18,7 +302,8 @@ class KrigingSurrogate(SurrogateModel):
     for Machine Learning (GPML) by Rasmussen and Williams. (see also: scikit-learn).
     """
 
-    def __init__(self, nugget=10. * MACHINE_EPSILON, eval_rmse=False):
+    def __init__(self, nugget=10. * MACHINE_EPSILON, eval_rmse=False, n_start=1,
+                 num_workers=1):
         """
         Initialize all attributes.
 
@@ -32,6 +317,13 @@ class KrigingSurrogate(SurrogateModel):
         eval_rmse : bool
             Flag indicating whether the Root Mean Squared Error (RMSE) should be computed.
             Set to False by default.
+
+        n_start : int
+            Number of starting points for the hyper-parameter optimization. The first one is
+            always the default starting point and the others are random. Default is 1.
+
+        num_workers : int
+            Number of processes used to run the starting points concurrently. Default is 1.
         """
         super(KrigingSurrogate, self).__init__()
 
@@ -44,6 +336,7 @@ class KrigingSurrogate(SurrogateModel):
 
         self.alpha = np.zeros(0)
         self.L = np.zeros(0)
+        self.R_inv = np.zeros(0)
         self.sigma2 = np.zeros(0)
 
         # Normalized Training Values
@@ -56,6 +349,9 @@ class KrigingSurrogate(SurrogateModel):
 
         self.eval_rmse = eval_rmse
 
+        self.n_start = n_start
+        self.num_workers = num_workers
+
     def train(self, x, y):
         """
         Train the surrogate model with the given set of inputs and outputs.
@@ -94,75 +390,130 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
-
-        bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
-
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options={'eps': 1e-3},
-                             bounds=bounds)
-
-        if not optResult.success:
+        # The distances don't depend on the thetas, so they are only computed once.
+        sq_dist, ij = _pairwise_sq_distances(X)
+
+        starts = [1e-1 * np.ones(self.n_dims)]
+        starts.extend(np.random.uniform(LOG_THETA_BOUNDS[0], LOG_THETA_BOUNDS[1], self.n_dims)
+                      for i in range(self.n_start - 1))
+        args = [(x0, sq_dist, ij, Y, self.nugget) for x0 in starts]
+
+        if self.num_workers > 1 and len(starts) > 1:
+            pool = multiprocessing.Pool(min(self.num_workers, len(starts)))
+            try:
+                results = pool.map(_train_start, args)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_train_start(arg) for arg in args]
+
+        successful = [result for result in results if result.success]
+        if not successful:
             raise ValueError(
-                'Kriging Hyper-parameter optimization failed: {0}'.format(optResult.message))
+                'Kriging Hyper-parameter optimization failed: {0}'.format(results[0].message))
+
+        optResult = min(successful, key=lambda result: result.fun)
 
         self.thetas = np.exp(optResult.x)
-        _, params = self._calculate_reduced_likelihood_params()
+        _, params = self._calculate_reduced_likelihood_params(sq_dist=(sq_dist, ij))
         self.alpha = params['alpha']
         self.U = params['U']
         self.S_inv = params['S_inv']
         self.Vh = params['Vh']
         self.sigma2 = params['sigma2']
 
-    def _calculate_reduced_likelihood_params(self, thetas=None):
+        # only needed by update, which forms it from the SVD
+        self.R_inv = np.zeros(0)
+
+    def update(self, x, y):
         """
-        Calculate quantity with same maximum location as the log-likelihood for a given theta.
+        Add training points to the model, keeping the hyper-parameters and normalization.
+
+        The inverse of the correlation matrix is extended with its Schur complement, so the
+        cost is O(n^2 k) for k new points instead of a full retraining.
 
         Parameters
         ----------
-        thetas : ndarray, optional
-            Given input correlation coefficients. If none given, uses self.thetas
-            from training.
+        x : array-like
+            New training input locations
+
+        y : array-like
+            Model responses at the new inputs.
         """
-        if thetas is None:
-            thetas = self.thetas
+        if not self.trained:
+            self.train(x, y)
+            return
 
-        X, Y = self.X, self.Y
-        params = {}
+        if np.ndim(self.nugget) > 0:
+            raise ValueError('KrigingSurrogate can not be updated when nugget is an array.')
 
-        # Correlation Matrix
-        distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
-        for i in range(self.n_samples):
-            distances[i, :, i + 1:] = np.abs(X[i, ...] - X[i + 1:, ...]).T
-            distances[i + 1:, :, i] = distances[i, :, i + 1:].T
+        x, y = np.atleast_2d(x, y)
+        n_new = x.shape[0]
+
+        X_new = (x - self.X_mean) / self.X_std
+        Y_new = (y - self.Y_mean) / self.Y_std
+
+        # correlations of the new points with the old ones and with each other
+        B = _correlation_vectors(X_new, self.X, self.thetas).T
+        sq_dist, ij = _pairwise_sq_distances(X_new)
+        C, _ = _correlation_matrix(self.thetas, sq_dist, ij, n_new, self.nugget)
+
+        # the regularized inverse of the correlation matrix, extended at each update
+        if self.Vh is not None:
+            self.R_inv = self.Vh.T.dot(np.einsum('j,kj->jk', self.S_inv, self.U))
 
-        R = np.exp(-thetas.dot(np.square(distances)))
-        R[np.diag_indices_from(R)] = 1. + self.nugget
+        n = self.n_samples
+        R_inv_B = self.R_inv.dot(B)
+        schur_inv = linalg.pinvh(C - B.T.dot(R_inv_B))
+        off_diag = -R_inv_B.dot(schur_inv)
 
-        [U, S, Vh] = linalg.svd(R)
+        R_inv = np.empty((n + n_new, n + n_new))
+        R_inv[:n, :n] = self.R_inv - off_diag.dot(R_inv_B.T)
+        R_inv[:n, n:] = off_diag
+        R_inv[n:, :n] = off_diag.T
+        R_inv[n:, n:] = schur_inv
+        self.R_inv = R_inv
 
-        # Penrose-Moore Pseudo-Inverse:
-        # Given A = USV^* and Ax=b, the least-squares solution is
-        # x = V S^-1 U^* b.
-        # Tikhonov regularization is used to make the solution significantly
-        # more robust.
-        h = 1e-8 * S[0]
-        inv_factors = S / (S ** 2. + h ** 2.)
+        self.X = np.vstack((self.X, X_new))
+        self.Y = np.vstack((self.Y, Y_new))
+        self.n_samples = n + n_new
 
-        alpha = Vh.T.dot(np.einsum('j,kj,kl->jl', inv_factors, U, Y))
-        logdet = -np.sum(np.log(inv_factors))
-        sigma2 = np.dot(Y.T, alpha).sum(axis=0) / self.n_samples
-        reduced_likelihood = -(np.log(np.sum(sigma2)) +
-                               logdet / self.n_samples)
+        self.alpha = self.R_inv.dot(self.Y)
+        self.sigma2 = np.dot(self.Y.T, self.alpha).sum(axis=0) / self.n_samples * \
+            np.square(self.Y_std)
 
-        params['alpha'] = alpha
-        params['sigma2'] = sigma2 * np.square(self.Y_std)
-        params['S_inv'] = inv_factors
-        params['U'] = U
-        params['Vh'] = Vh
+        # the SVD of the correlation matrix is not updated
+        self.U = self.S_inv = self.Vh = None
+
+    def _calculate_reduced_likelihood_params(self, thetas=None, sq_dist=None):
+        """
+        Calculate quantity with same maximum location as the log-likelihood for a given theta.
+
+        Parameters
+        ----------
+        thetas : ndarray, optional
+            Given input correlation coefficients. If none given, uses self.thetas
+            from training.
+        sq_dist : (ndarray, tuple of ndarray), optional
+            Pairwise squared distances and pair indices of the training inputs. If none given,
+            they are computed.
+
+        Returns
+        -------
+        float
+            the reduced likelihood.
+        dict
+            the parameters of the model.
+        """
+        if thetas is None:
+            thetas = self.thetas
+        if sq_dist is None:
+            sq_dist = _pairwise_sq_distances(self.X)
+
+        reduced_likelihood, params = _svd_likelihood_params(thetas, sq_dist[0], sq_dist[1],
+                                                            self.Y, self.nugget)
+        params['sigma2'] = params['sigma2'] * np.square(self.Y_std)
 
         return reduced_likelihood, params
 
@@ -176,30 +527,74 @@ class KrigingSurrogate(SurrogateModel):
             Point at which the surrogate is evaluated.
         """
         super(KrigingSurrogate, self).predict(x)
+        return self._predict(x)
 
-        thetas = self.thetas
-        if isinstance(x, list):
-            x = np.array(x)
-        x = np.atleast_2d(x)
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, of shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            predicted values, of shape (n_eval, n_outputs).
+        ndarray
+            RMSE of the predictions, of shape (n_eval, n_outputs). Only returned if eval_rmse
+            is True.
+        """
+        super(KrigingSurrogate, self).predict(x)
+        return self._predict(x)
+
+    def _predict(self, x):
+        """
+        Calculate predicted values of the response, and optionally their RMSE.
+
+        The points are processed in chunks, so the memory use doesn't grow with their number.
+
+        Parameters
+        ----------
+        x : array-like
+            Point(s) at which the surrogate is evaluated.
+
+        Returns
+        -------
+        ndarray
+            predicted values, of shape (n_eval, n_outputs).
+        ndarray
+            RMSE of the predictions, of shape (n_eval, n_outputs). Only returned if eval_rmse
+            is True.
+        """
+        x = np.atleast_2d(np.asarray(x))
         n_eval = x.shape[0]
 
         # Normalize input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        y = np.empty((n_eval, self.alpha.shape[1]), dtype=x_n.dtype)
+        if self.eval_rmse:
+            mse = np.empty((n_eval, self.sigma2.size), dtype=x_n.dtype)
 
-        # Scaled Predictor
-        y_t = np.dot(r, self.alpha)
+        for chunk in _chunks(n_eval, self.n_samples):
+            r = _correlation_vectors(x_n[chunk], self.X, self.thetas)
 
-        # Predictor
-        y = self.Y_mean + self.Y_std * y_t
+            # Predictor
+            y[chunk] = self.Y_mean + self.Y_std * r.dot(self.alpha)
 
-        if self.eval_rmse:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
+            if self.eval_rmse:
+                if self.Vh is not None:
+                    # same order of operations as the SVD, which keeps the cancellation in
+                    # 1 - r R^-1 r^T accurate at the training points.
+                    quad = np.einsum('ij,ji->i', r.dot(self.Vh.T),
+                                     self.S_inv[:, np.newaxis] * self.U.T.dot(r.T))
+                else:
+                    quad = np.einsum('ij,ij->i', r.dot(self.R_inv), r)
+                mse[chunk] = np.outer(1. - quad, self.sigma2)
 
+        if self.eval_rmse:
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
             return y, np.sqrt(mse)
@@ -215,19 +610,41 @@ class KrigingSurrogate(SurrogateModel):
         x : array-like
             Point at which the surrogate Jacobian is evaluated.
         """
+        return self.vectorized_linearize(x)[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the Kriging surface at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, of shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            jacobians, of shape (n_eval, n_outputs, n_dims).
+        """
         thetas = self.thetas
 
+        x = np.atleast_2d(np.asarray(x))
+        n_eval = x.shape[0]
+
         # Normalize Input
         x_n = (x - self.X_mean) / self.X_std
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+        jac = np.empty((n_eval, self.alpha.shape[1], self.n_dims), dtype=x_n.dtype)
+
+        for chunk in _chunks(n_eval, self.n_samples):
+            r = _correlation_vectors(x_n[chunk], self.X, thetas)
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # I.e. Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
+            # d r / d x_n[k] = -2 * theta_k * (x_n[k] - X[:, k]) * r
+            for k, theta in enumerate(thetas):
+                gradr = -2. * theta * (x_n[chunk, k, np.newaxis] - self.X[:, k]) * r
+                jac[chunk, :, k] = gradr.dot(self.alpha)
+
+        jac *= self.Y_std[:, np.newaxis] / self.X_std
         return jac
 
 
@@ -249,3 +666,22 @@ class FloatKrigingSurrogate(KrigingSurrogate):
         """
         dist = super(FloatKrigingSurrogate, self).predict(x)
         return dist[0]  # mean value
+
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, of shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            mean of the predicted values, of shape (n_eval, n_outputs).
+        """
+        dist = super(FloatKrigingSurrogate, self).vectorized_predict(x)
+        if self.eval_rmse:
+            return dist[0]  # mean value
+        return dist
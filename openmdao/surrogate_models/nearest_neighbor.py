@@ -65,6 +65,24 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.interpolant_type](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x, y):
+        """
+        Add training points to the interpolant without rebuilding it from scratch.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations
+
+        y : array-like
+            Model responses at the new inputs.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        self.interpolant.update(x, y)
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -96,3 +114,61 @@ class NearestNeighbor(SurrogateModel):
         if jac.shape[0] == 1 and len(jac.shape) > 2:
             return jac[0, ...]
         return jac
+
+    def predict_and_linearize(self, x, **kwargs):
+        """
+        Calculate the predicted value and the jacobian with a single nearest neighbor search.
+
+        Parameters
+        ----------
+        x : array-like
+            Point at which the surrogate is evaluated.
+
+        kwargs :
+            Additional keyword arguments passed to the interpolant.
+
+        Returns
+        -------
+        ndarray
+            predicted value.
+        ndarray
+            jacobian.
+        """
+        super(NearestNeighbor, self).predict(x)
+        value, jac = self.interpolant.predict_and_linearize(x, **kwargs)
+        if jac.shape[0] == 1 and len(jac.shape) > 2:
+            jac = jac[0, ...]
+        return value, jac
+
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at a set of points.
+
+        Parameters
+        ----------
+        x : ndarray
+            points at which the surrogate is evaluated, of shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            predicted values, of shape (n_eval, n_out).
+        """
+        super(NearestNeighbor, self).predict(x)
+        return self.interpolant(x)
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the interpolant at a set of points.
+
+        Parameters
+        ----------
+        x : ndarray
+            points at which the jacobians are evaluated, of shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            jacobians, of shape (n_eval, n_out, n_dims).
+        """
+        return self.interpolant.gradient(x)
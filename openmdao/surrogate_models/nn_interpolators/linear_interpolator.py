@@ -64,9 +64,8 @@ class LinearInterpolator(NNBase):
         ----------
         prediction_points : array
         """
-        if len(prediction_points.shape) == 1:
-            # Reshape vector to n x 1 array
-            prediction_points.shape = (1, prediction_points.shape[0])
+        # Reshape vector to n x 1 array
+        prediction_points = np.atleast_2d(prediction_points)
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
 
@@ -75,7 +74,7 @@ class LinearInterpolator(NNBase):
 
         # KData query takes (data, #ofneighbors) to determine closest
         # training points to predicted data
-        ndist, nloc = self._KData.query(normalized_pts.real, points_needed)
+        ndist, nloc = self._query(normalized_pts, points_needed)
 
         normal, pc = self._find_hyperplane(nloc)
 
@@ -94,8 +93,6 @@ class LinearInterpolator(NNBase):
         # Rescale to original units
         predictions = (predictions * self._tvr) + self._tvm
 
-        self._pt_cache = (normalized_pts, ndist, nloc)
-
         return predictions
 
     def gradient(self, PredPoints):
@@ -106,9 +103,8 @@ class LinearInterpolator(NNBase):
         ----------
         PredPoints : ndarray
         """
-        if len(PredPoints.shape) == 1:
-            # Reshape vector to n x 1 array
-            PredPoints.shape = (1, PredPoints.shape[0])
+        # Reshape vector to n x 1 array
+        PredPoints = np.atleast_2d(PredPoints)
 
         normPredPts = (PredPoints - self._tpm) / self._tpr
         nppts = normPredPts.shape[0]
@@ -118,16 +114,12 @@ class LinearInterpolator(NNBase):
         dims = self._indep_dims + 1
 
         # Find the neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normPredPts):
-            ndist, nloc = self._pt_cache[1:]
-        else:
-            ndist, nloc = self._KData.query(normPredPts.real, dims)
+        ndist, nloc = self._query(normPredPts, dims)
 
         normal, pc = self._find_hyperplane(nloc)
         if np.any(normal[:, -1, :]) == 0:
             return gradient
-        gradient[:] = (-normal[:, :-1, :] / normal[:, -1, :]).squeeze().T
+        gradient[:] = (-normal[:, :-1, :] / normal[:, -1:, :]).transpose((0, 2, 1))
 
         grad = gradient * (self._tvr[:, np.newaxis] / self._tpr)
 
@@ -2,16 +2,21 @@
 
 import numpy as np
 
+from collections import OrderedDict
 from math import ceil
 from scipy.spatial import cKDTree
 
+# Largest fraction of the training points that can be added by update before the tree is rebuilt.
+MAX_DELTA_FRACTION = 0.1
+
 
 class NNBase(object):
     """
     Base class for common functionality between nearest neighbor interpolants.
     """
 
-    def __init__(self, training_points, training_values, num_leaves=2):
+    def __init__(self, training_points, training_values, num_leaves=2, cache_size=16,
+                 workers=1):
         """
         Initialize nearest neighbor interpolant by scaling input to the unit hypercube.
 
@@ -25,6 +30,15 @@ class NNBase(object):
             ndarray of shape (num_points x dependent dims) containing
             training output values.
 
+        num_leaves : int
+            number of leaves of the KD-tree.
+
+        cache_size : int
+            number of recent neighbor queries that are kept, so that predicting and then
+            computing the gradient at the same points only searches the tree once.
+
+        workers : int
+            number of threads used to search the tree.
         """
         # training_points and training_values are the known points and their
         # respective values which will be interpolated against.
@@ -48,8 +62,214 @@ class NNBase(object):
         self._ntpts = training_points.shape[0]
 
         # Make training data into a Tree
+        self._num_leaves = num_leaves
         leavesz = ceil(self._ntpts / float(num_leaves))
         self._KData = cKDTree(self._tp, leafsize=leavesz)
 
-        # Cache for gradients
-        self._pt_cache = None
+        # Cache of the most recent neighbor queries, least recent first
+        self._cache_size = cache_size
+        self._query_cache = OrderedDict()
+        self._workers = workers
+
+    def _query(self, normalized_pts, k):
+        """
+        Find the k nearest training points, reusing the result of a recent identical query.
+
+        Parameters
+        ----------
+        normalized_pts : ndarray
+            normalized prediction points, of shape (num_points x independent dims). Only
+            their real part is used.
+        k : int
+            number of neighbors.
+
+        Returns
+        -------
+        ndarray
+            distances to the neighbors.
+        ndarray
+            indices of the neighbors.
+        """
+        pts = np.ascontiguousarray(normalized_pts.real)
+        key = (k, pts.shape, pts.tobytes())
+
+        cache = self._query_cache
+        if key in cache:
+            result = cache.pop(key)
+        else:
+            result = _query_tree(self._KData, pts, k, self._workers)
+            if cache and len(cache) >= self._cache_size:
+                cache.popitem(last=False)
+
+        if self._cache_size > 0:
+            cache[key] = result
+
+        return result
+
+    def predict_and_linearize(self, prediction_points, **kwargs):
+        """
+        Do interpolation and find the gradient at a set of points with one tree search.
+
+        Parameters
+        ----------
+        prediction_points : ndarray
+            points of shape (num_points x independent dims).
+
+        **kwargs : dict
+            keyword arguments of the interpolant.
+
+        Returns
+        -------
+        ndarray
+            predicted values.
+        ndarray
+            gradients.
+        """
+        if self._cache_size > 0:
+            return self(prediction_points, **kwargs), self.gradient(prediction_points, **kwargs)
+
+        # The query cache is what lets the gradient reuse the neighbors, so turn it on.
+        self._cache_size = 1
+        try:
+            return self(prediction_points, **kwargs), self.gradient(prediction_points, **kwargs)
+        finally:
+            self._cache_size = 0
+            self._query_cache.clear()
+
+    def update(self, training_points, training_values):
+        """
+        Add training points, keeping the normalization of the original ones.
+
+        Only the new points are put into a new tree, which is searched along with the
+        original one, until they make up more than MAX_DELTA_FRACTION of all points.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            ndarray of shape (num_new_points x independent dims) containing
+            new training input locations.
+
+        training_values : ndarray
+            ndarray of shape (num_new_points x dependent dims) containing
+            new training output values.
+        """
+        self._tp = np.vstack((self._tp, (training_points - self._tpm) / self._tpr))
+        self._tv = np.vstack((self._tv, (training_values - self._tvm) / self._tvr))
+        self._ntpts = self._tp.shape[0]
+
+        if isinstance(self._KData, _SplitTree):
+            tree, num_tree = self._KData.tree, self._KData.num_tree
+        else:
+            tree, num_tree = self._KData, self._KData.n
+
+        if self._ntpts - num_tree > MAX_DELTA_FRACTION * self._ntpts:
+            leavesz = ceil(self._ntpts / float(self._num_leaves))
+            self._KData = cKDTree(self._tp, leafsize=leavesz)
+        else:
+            self._KData = _SplitTree(tree, cKDTree(self._tp[num_tree:]))
+
+        self._query_cache.clear()
+
+
+def _query_tree(tree, pts, k, workers):
+    """
+    Find the k nearest neighbors of the given points, optionally with several threads.
+
+    Parameters
+    ----------
+    tree : cKDTree or _SplitTree
+        the tree to search.
+    pts : ndarray
+        points to query.
+    k : int
+        number of neighbors.
+    workers : int
+        number of threads.
+
+    Returns
+    -------
+    ndarray
+        distances to the neighbors.
+    ndarray
+        indices of the neighbors.
+    """
+    if workers == 1:
+        return tree.query(pts, k)
+
+    try:
+        return tree.query(pts, k, workers=workers)
+    except TypeError:
+        # older versions of scipy call it n_jobs
+        return tree.query(pts, k, n_jobs=workers)
+
+
+class _SplitTree(object):
+    """
+    A pair of trees, queried like a single cKDTree of all their points.
+
+    Attributes
+    ----------
+    tree : cKDTree
+        tree of the first points.
+    num_tree : int
+        number of points in tree.
+    delta : cKDTree
+        tree of the remaining points.
+    n : int
+        total number of points.
+    """
+
+    def __init__(self, tree, delta):
+        """
+        Store the trees.
+
+        Parameters
+        ----------
+        tree : cKDTree
+            tree of the first points.
+        delta : cKDTree
+            tree of the remaining points.
+        """
+        self.tree = tree
+        self.num_tree = tree.n
+        self.delta = delta
+        self.n = tree.n + delta.n
+
+    def query(self, x, k=1, **kwargs):
+        """
+        Find the k nearest neighbors of the given points among the points of both trees.
+
+        Parameters
+        ----------
+        x : ndarray
+            points to query, of shape (num_points x dims).
+        k : int
+            number of neighbors.
+        **kwargs : dict
+            other keyword arguments of cKDTree.query.
+
+        Returns
+        -------
+        ndarray
+            distances to the neighbors.
+        ndarray
+            indices of the neighbors, or n where there are fewer than k points.
+        """
+        dist, loc = self.tree.query(x, k, **kwargs)
+        delta_dist, delta_loc = self.delta.query(x, k, **kwargs)
+
+        if k == 1:
+            dist, loc = dist[:, np.newaxis], loc[:, np.newaxis]
+            delta_dist, delta_loc = delta_dist[:, np.newaxis], delta_loc[:, np.newaxis]
+
+        dist = np.hstack((dist, delta_dist))
+        loc = np.hstack((loc, delta_loc + self.num_tree))
+        loc[np.isinf(dist)] = self.n
+
+        order = np.argsort(dist, axis=1, kind='mergesort')[:, :k]
+        rows = np.arange(dist.shape[0])[:, np.newaxis]
+        dist, loc = dist[rows, order], loc[rows, order]
+
+        if k == 1:
+            return dist[:, 0], loc[:, 0]
+        return dist, loc
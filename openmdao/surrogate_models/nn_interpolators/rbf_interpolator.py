@@ -2,8 +2,7 @@
 
 import numpy as np
 
-from openmdao.surrogate_models.nn_interpolators.nn_base import NNBase
-from six.moves import range
+from openmdao.surrogate_models.nn_interpolators.nn_base import NNBase, _query_tree
 from scipy.sparse import csc_matrix
 from scipy.sparse.linalg import spsolve
 
@@ -25,7 +24,8 @@ class RBFInterpolator(NNBase):
 
         loc : int
         """
-        R = np.zeros((npp, self._ntpts), dtype="float")
+        # complex T (during complex step) must give a complex R
+        R = np.zeros((npp, self._ntpts), dtype=T.dtype)
 
         # Choose type of CRBF R matrix
         if self.comp == -1:
@@ -148,8 +148,7 @@ class RBFInterpolator(NNBase):
 
         Cb = np.polyval(cb_poly, T)
 
-        for i in range(npp):
-            R[i, loc[i, :-1]] = Cf[i, :] * Cb[i, :]
+        R[np.arange(npp)[:, np.newaxis], loc[:, :-1]] = Cf * Cb
 
         return R
 
@@ -297,7 +296,8 @@ class RBFInterpolator(NNBase):
 
         return grad.reshape((PrdPts.shape[0], self._dep_dims, self._indep_dims))
 
-    def __init__(self, training_points, training_values, num_leaves=2, n=5, comp=2):
+    def __init__(self, training_points, training_values, num_leaves=2, n=5, comp=2,
+                 **kwargs):
         """
         Initialize all attributes.
 
@@ -312,8 +312,12 @@ class RBFInterpolator(NNBase):
         n : int
 
         comp : int
+
+        **kwargs : dict
+            other keyword arguments of NNBase.
         """
-        super(RBFInterpolator, self).__init__(training_points, training_values, num_leaves)
+        super(RBFInterpolator, self).__init__(training_points, training_values, num_leaves,
+                                              **kwargs)
 
         if self._ntpts < n:
             raise ValueError('RBFInterpolator only given {0} training points, but requested n={1}.'
@@ -322,15 +326,38 @@ class RBFInterpolator(NNBase):
         # Comp is an arbitrary value that picks a function to use
         self.comp = comp
 
+        self.N = n
+        self._compute_weights()
+
+    def _compute_weights(self):
+        """
+        Compute the weights of the radial basis functions of all training points.
+        """
         # For weights, first find the training points radial neighbors
-        tdist, tloc = self._KData.query(self._tp, n)
+        tdist, tloc = _query_tree(self._KData, self._tp, self.N, self._workers)
         Tt = tdist[:, :-1] / tdist[:, -1:]
         # Next determine weight matrix
         Rt = self._find_R(self._ntpts, Tt, tloc)
-        weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
+        self.weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
 
-        self.N = n
-        self.weights = weights
+    def update(self, training_points, training_values):
+        """
+        Add training points.
+
+        The weights depend on all the training points, so they are recomputed.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            ndarray of shape (num_new_points x independent dims) containing
+            new training input locations.
+
+        training_values : ndarray
+            ndarray of shape (num_new_points x dependent dims) containing
+            new training output values.
+        """
+        super(RBFInterpolator, self).update(training_points, training_values)
+        self._compute_weights()
 
     def __call__(self, prediction_points):
         """
@@ -340,16 +367,15 @@ class RBFInterpolator(NNBase):
         ----------
         prediction_points : ndarray
         """
-        if len(prediction_points.shape) == 1:
-            # Reshape vector to n x 1 array
-            prediction_points.shape = (1, prediction_points.shape[0])
+        # Reshape vector to n x 1 array
+        prediction_points = np.atleast_2d(prediction_points)
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         nppts = normalized_pts.shape[0]
         # Setup prediction points and find their radial neighbors
-        ndist, nloc = self._KData.query(normalized_pts, self.N)
+        ndist, nloc = self._query(normalized_pts, self.N)
         # Check if complex step is being run
-        if np.any(np.abs(normalized_pts[0, :].imag)) > 0:
+        if np.any(normalized_pts.imag != 0.):
             dimdiff = np.subtract(normalized_pts.reshape((nppts, 1, self._indep_dims)),
                                   self._tp[nloc, :])
             # KD Tree ignores imaginary part, muse redo ndist if complex
@@ -362,8 +388,6 @@ class RBFInterpolator(NNBase):
         predz = ((np.dot(Rp, self.weights[..., 0]) * self._tvr) +
                  self._tvm).reshape(nppts, self._dep_dims)
 
-        self._pt_cache = (normalized_pts, ndist, nloc)
-
         return predz
 
     def gradient(self, prediction_points):
@@ -374,17 +398,12 @@ class RBFInterpolator(NNBase):
         ----------
         prediction_points : ndarray
         """
-        if len(prediction_points.shape) == 1:
-            # Reshape vector to n x 1 array
-            prediction_points.shape = (1, prediction_points.shape[0])
+        # Reshape vector to n x 1 array
+        prediction_points = np.atleast_2d(prediction_points)
 
         normalized_pts = (prediction_points - self._tpm) / self._tpr
         # Setup prediction points and find their radial neighbors
-        if self._pt_cache is not None and \
-                np.allclose(self._pt_cache[0], normalized_pts):
-            pdist, ploc = self._pt_cache[1:]
-        else:
-            pdist, ploc = self._KData.query(normalized_pts, self.N)
+        pdist, ploc = self._query(normalized_pts, self.N)
 
         # Find Gradient
         grad = self._find_dR(normalized_pts[:, np.newaxis, :], ploc,
@@ -3,10 +3,43 @@
 Surrogate Model based on second order response surface equations.
 """
 
-from numpy import zeros, einsum
+from numpy import zeros, einsum, hstack, vstack, reshape, triu_indices
 from numpy.dual import lstsq
+from scipy.linalg import qr
 from openmdao.surrogate_models.surrogate_model import SurrogateModel
-from six.moves import range
+
+
+def _quadratic_terms(x):
+    """
+    Compute the constant, linear, squared and cross terms of the given points.
+
+    Parameters
+    ----------
+    x : ndarray
+        points, of shape (m, n).
+
+    Returns
+    -------
+    ndarray
+        terms of the response surface equation, of shape (m, (n + 1) * (n + 2) / 2).
+    """
+    m, n = x.shape
+
+    X = zeros((m, ((n + 1) * (n + 2)) // 2))
+
+    # Modify X to include constant, squared terms and cross terms
+
+    # Constant Terms
+    X[:, 0] = 1.0
+
+    # Linear Terms
+    X[:, 1:n + 1] = x
+
+    # Quadratic Terms, x[i] * x[j] for j >= i in row-major order
+    rows, cols = triu_indices(n)
+    X[:, n + 1:] = x[:, rows] * x[:, cols]
+
+    return X
 
 
 class ResponseSurface(SurrogateModel):
@@ -24,6 +57,8 @@ class ResponseSurface(SurrogateModel):
         self.n = 0  # number of independents
         # vector of response surface equation coefficients
         self.betas = zeros(0)
+        # triangular factor of the least squares problem
+        self._triu = zeros(0)
 
     def train(self, x, y):
         """
@@ -42,28 +77,48 @@ class ResponseSurface(SurrogateModel):
         m = self.m = x.shape[0]
         n = self.n = x.shape[1]
 
-        X = zeros((m, ((n + 1) * (n + 2)) // 2))
+        X = _quadratic_terms(x)
 
-        # Modify X to include constant, squared terms and cross terms
+        # Keep the triangular factor of [X y] so that points can be added with update.
+        triu = qr(hstack((X, y)), mode='r')[0]
+        self._triu = triu[:min(m, triu.shape[1])]
 
-        # Constant Terms
-        X[:, 0] = 1.0
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas = self._solve()
 
-        # Linear Terms
-        X[:, 1:n + 1] = x
+    def update(self, x, y):
+        """
+        Add training points by updating the QR factorization of the least squares problem.
 
-        # Quadratic Terms
-        X_offset = X[:, n + 1:]
-        for i in range(n):
-            # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-            # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-            # I.e. Z[i,j] = X[i]*Y[i,j]
-            X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
-            X_offset = X_offset[:, n - i:]
+        Parameters
+        ----------
+        x : array-like
+            New training input locations
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        y : array-like
+            Model responses at the new inputs.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        triu = qr(vstack((self._triu, hstack((_quadratic_terms(x), y)))), mode='r')[0]
+        self._triu = triu[:min(triu.shape)]
+        self.m += x.shape[0]
+        self.betas = self._solve()
+
+    def _solve(self):
+        """
+        Solve the least squares problem from its triangular factor.
+
+        Returns
+        -------
+        ndarray
+            response surface equation coefficients.
+        """
+        nterms = ((self.n + 1) * (self.n + 2)) // 2
+        return lstsq(self._triu[:, :nterms], self._triu[:, nterms:])[0]
 
     def predict(self, x):
         """
@@ -76,46 +131,62 @@ class ResponseSurface(SurrogateModel):
         """
         super(ResponseSurface, self).predict(x)
 
-        n = x.size
-
-        X = zeros(((self.n + 1) * (self.n + 2)) // 2)
-
-        # Modify X to include constant, squared terms and cross terms
+        # Predict new_y using X and betas
+        return _quadratic_terms(reshape(x, (1, -1))).dot(self.betas)[0]
 
-        # Constant Terms
-        X[0] = 1.0
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at many points.
 
-        # Linear Terms
-        X[1:n + 1] = x
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, of shape (n_pts, n).
 
-        # Quadratic Terms
-        X_offset = X[n + 1:]
-        for i in range(n):
-            X_offset[:n - i] = x[i] * x[i:]
-            X_offset = X_offset[n - i:]
+        Returns
+        -------
+        ndarray
+            predicted values, of shape (n_pts, n_out).
+        """
+        super(ResponseSurface, self).predict(x)
 
-        # Predict new_y using X and betas
-        return X.dot(self.betas)
+        return _quadratic_terms(reshape(x, (-1, self.n))).dot(self.betas)
 
     def linearize(self, x):
         """
-        Calculate the jacobian of the Kriging surface at the requested point.
+        Calculate the jacobian of the response surface at the requested point.
 
         Parameters
         ----------
         x : array-like
             Point at which the surrogate Jacobian is evaluated.
         """
+        return self.vectorized_linearize(reshape(x, (1, -1)))[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the response surface at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, of shape (n_pts, n).
+
+        Returns
+        -------
+        ndarray
+            jacobians, of shape (n_pts, n_out, n).
+        """
         n = self.n
         betas = self.betas
 
-        x = x.flat
+        x = reshape(x, (-1, n))
 
-        jac = betas[1:n + 1, :].copy()
-        beta_offset = betas[n + 1:, :]
-        for i in range(n):
-            jac[i, :] += x[i:].dot(beta_offset[:n - i, :])
-            jac[i:, :] += x[i] * beta_offset[:n - i, :]
-            beta_offset = beta_offset[n - i:, :]
+        # Coefficients of the quadratic terms as a symmetric (n, n, n_out) array, with the
+        # squared terms doubled, so that the gradient of the quadratic part is x.dot(quad).
+        rows, cols = triu_indices(n)
+        quad = zeros((n, n, betas.shape[1]))
+        quad[rows, cols] = betas[n + 1:]
+        quad += quad.transpose((1, 0, 2))
 
-        return jac.T
+        return betas[1:n + 1].T + einsum('pi,ijk->pkj', x, quad)
@@ -0,0 +1,132 @@
+"""Surrogate model based on Kriging with a reduced set of inducing points."""
+import numpy as np
+import scipy.linalg as linalg
+
+from openmdao.surrogate_models.kriging import KrigingSurrogate, _chunks, _correlation_vectors
+
+
+class SparseKrigingSurrogate(KrigingSurrogate):
+    """
+    Approximate Kriging surrogate for large training sets.
+
+    A random subset of the training points is used as inducing points. The hyper-parameters
+    are those of the exact Kriging model of the inducing points, and the weights of their
+    correlation functions are then fit to all the training points by regularized least
+    squares (Nystrom approximation). Training is O(n * m^2) and each prediction is O(m),
+    where n is the number of training points and m the number of inducing points.
+
+    The RMSE, if requested, is the one of the exact Kriging model of the inducing points, so
+    it is conservative.
+    """
+
+    def __init__(self, n_inducing=500, regularization=1e-10, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        n_inducing : int
+            Maximum number of inducing points. If there are no more training points than this,
+            the model is the exact Kriging model. Default is 500.
+
+        regularization : float
+            Tikhonov regularization of the least squares fit of the weights, relative to the
+            number of training points. Default is 1e-10.
+
+        **kwargs : dict
+            keyword arguments passed to KrigingSurrogate.
+        """
+        super(SparseKrigingSurrogate, self).__init__(**kwargs)
+
+        self.n_inducing = n_inducing
+        self.regularization = regularization
+
+        # triangular factor of the least squares problem, or None for the exact model
+        self._triu = None
+
+    def train(self, x, y):
+        """
+        Train the surrogate model with the given set of inputs and outputs.
+
+        Parameters
+        ----------
+        x : array-like
+            Training input locations
+
+        y : array-like
+            Model responses at given inputs.
+        """
+        x, y = np.atleast_2d(x, y)
+        n_samples = x.shape[0]
+
+        if n_samples <= self.n_inducing:
+            super(SparseKrigingSurrogate, self).train(x, y)
+            self._triu = None
+            return
+
+        inducing = np.sort(np.random.choice(n_samples, self.n_inducing, replace=False))
+        super(SparseKrigingSurrogate, self).train(x[inducing], y[inducing])
+
+        # the factorization starts from the Tikhonov regularization
+        m = self.n_samples
+        self._triu = np.zeros((m, m + self.Y.shape[1]))
+        self._triu[:, :m] = np.sqrt(self.regularization * n_samples) * np.eye(m)
+        self._fit(x, y)
+
+    def update(self, x, y):
+        """
+        Add training points to the model, keeping the inducing points and hyper-parameters.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations
+
+        y : array-like
+            Model responses at the new inputs.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        x, y = np.atleast_2d(x, y)
+
+        if self._triu is None:
+            if self.n_samples + x.shape[0] <= self.n_inducing:
+                super(SparseKrigingSurrogate, self).update(x, y)
+            else:
+                # the exact model has all the training points, so switch to the approximation
+                x_old = self.X * self.X_std + self.X_mean
+                y_old = self.Y * self.Y_std + self.Y_mean
+                self.train(np.vstack((x_old, x)), np.vstack((y_old, y)))
+            return
+
+        self._fit(x, y)
+
+    def _fit(self, x, y):
+        """
+        Add training points to the least squares fit of the weights of the inducing points.
+
+        The QR factorization is updated one chunk of training points at a time, so the (n, m)
+        matrix of correlations with the inducing points is never formed and the normal
+        equations are avoided.
+
+        Parameters
+        ----------
+        x : ndarray
+            training input locations.
+
+        y : ndarray
+            model responses at the given inputs.
+        """
+        X = (x - self.X_mean) / self.X_std
+        Y = (y - self.Y_mean) / self.Y_std
+
+        m = self.n_samples
+        triu = self._triu
+        for chunk in _chunks(X.shape[0], m):
+            r = _correlation_vectors(X[chunk], self.X, self.thetas)
+            triu = linalg.qr(np.vstack((triu, np.hstack((r, Y[chunk])))), mode='r')[0][:m]
+
+        self._triu = triu
+        self.alpha = linalg.solve_triangular(triu[:, :m], triu[:, m:])
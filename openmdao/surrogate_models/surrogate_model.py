@@ -1,6 +1,7 @@
 """
 Class definition for SurrogateModel, the base class for all surrogate models.
 """
+import numpy as np
 
 
 class SurrogateModel(object):
@@ -28,6 +29,21 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x, y):
+        """
+        Add training points to the trained model without retraining it from scratch.
+
+        Parameters
+        ----------
+        x : array-like
+            New training input locations
+
+        y : array-like
+            Model responses at the new inputs.
+        """
+        msg = "{0} does not support incremental updates.".format(type(self).__name__)
+        raise RuntimeError(msg)
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -49,7 +65,7 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Points at which the surrogate is evaluated, of shape (n_eval, n_inputs).
         """
         pass
 
@@ -65,6 +81,22 @@ class SurrogateModel(object):
         msg = "{0} has not defined a jacobian method.".format(type(self).__name__)
         raise RuntimeError(msg)
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the interpolant at many points.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, of shape (n_eval, n_inputs).
+
+        Returns
+        -------
+        ndarray
+            jacobians, of shape (n_eval, n_outputs, n_inputs).
+        """
+        return np.array([self.linearize(x_i) for x_i in x])
+
 
 class MultiFiSurrogateModel(SurrogateModel):
     """
@@ -6,6 +6,9 @@ import itertools
 import numpy as np
 
 from openmdao.api import KrigingSurrogate
+from openmdao.surrogate_models import kriging
+from openmdao.surrogate_models.kriging import _neg_reduced_likelihood, \
+    _pairwise_sq_distances
 from openmdao.devtools.testutil import assert_rel_error
 from six.moves import zip
 
@@ -34,6 +37,19 @@ class TestKrigingSurrogate(unittest.TestCase):
             assert_rel_error(self, mu, [y0], 1e-9)
             assert_rel_error(self, sigma, [[0]], 1e-5)
 
+    def test_1d_rmse_complex_step(self):
+        x = np.array([[0.0], [2.0], [3.0], [4.0], [6.0]])
+        y = np.array([[branin_1d(case)] for case in x])
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        surrogate.train(x, y)
+
+        x0 = np.array([1.3])
+        h = 1e-6
+        fd = (surrogate.predict(x0 + h)[1] - surrogate.predict(x0 - h)[1]) / (2 * h)
+
+        mu, sigma = surrogate.predict(x0 + 1e-30j)
+        assert_rel_error(self, sigma.imag / 1e-30, fd, 1e-5)
+
     def test_1d_predictor(self):
         x = np.array([[0.0], [2.0], [3.0], [4.0], [6.0]])
         y = np.array([[branin_1d(case)] for case in x])
@@ -149,5 +165,123 @@ class TestKrigingSurrogate(unittest.TestCase):
         jac = surrogate.linearize(np.array([[0.5, 0.5]]))
         assert_rel_error(self, jac, np.array([[1, 1], [1, -1], [1, 2]]), 5e-4)
 
+    def test_vectorized(self):
+        np.random.seed(5)
+        x = np.random.random((30, 2))
+        y = np.column_stack((np.sin(4 * x[:, 0]) * x[:, 1], x[:, 0] - x[:, 1] ** 2))
+
+        surrogate = KrigingSurrogate(eval_rmse=True)
+        surrogate.train(x, y)
+
+        new_x = np.random.random((25, 2))
+        expected_mu = np.zeros((25, 2))
+        expected_sigma = np.zeros((25, 2))
+        expected_jac = np.zeros((25, 2, 2))
+        for i, x0 in enumerate(new_x):
+            expected_mu[i], expected_sigma[i] = surrogate.predict(x0)
+            expected_jac[i] = surrogate.linearize(x0)
+
+        # make the points span several chunks
+        chunk_entries = kriging.CHUNK_ENTRIES
+        kriging.CHUNK_ENTRIES = 200
+        try:
+            mu, sigma = surrogate.vectorized_predict(new_x)
+            jac = surrogate.vectorized_linearize(new_x)
+        finally:
+            kriging.CHUNK_ENTRIES = chunk_entries
+
+        assert_rel_error(self, mu, expected_mu, 1e-12)
+        # the RMSE comes from a difference of nearly equal numbers, so it is less exact
+        assert_rel_error(self, sigma, expected_sigma, 1e-4)
+        assert_rel_error(self, jac, expected_jac, 1e-12)
+
+        # check the jacobian with finite differences at one point
+        h = 1e-6
+        x0 = new_x[0]
+        for k in range(2):
+            step = np.zeros(2)
+            step[k] = h
+            fd = (surrogate.predict(x0 + step)[0] - surrogate.predict(x0 - step)[0]) / (2 * h)
+            assert_rel_error(self, jac[0, :, k], fd[0], 1e-6)
+
+    def test_update(self):
+        np.random.seed(9)
+        x = np.random.random((30, 2))
+        y = np.column_stack((np.sin(4 * x[:, 0]) * x[:, 1], x[:, 0] - x[:, 1] ** 2))
+
+        surrogate = KrigingSurrogate(nugget=1e-4, eval_rmse=True)
+        surrogate.train(x[:20], y[:20])
+        surrogate.update(x[20:25], y[20:25])
+        surrogate.update(x[25:], y[25:])
+
+        self.assertEqual(surrogate.n_samples, 30)
+
+        # same as the exact model of all the points with the same hyper-parameters
+        X = (x - surrogate.X_mean) / surrogate.X_std
+        Y = (y - surrogate.Y_mean) / surrogate.Y_std
+        sq_dist, ij = _pairwise_sq_distances(X)
+        R, _ = kriging._correlation_matrix(surrogate.thetas, sq_dist, ij, 30, 1e-4)
+        assert_rel_error(self, surrogate.alpha, np.linalg.solve(R, Y), 1e-6)
+
+        mu, sigma = surrogate.vectorized_predict(x)
+        assert_rel_error(self, mu, y, 1e-2)
+        self.assertTrue(np.all(sigma < 1e-2))
+
+    def test_likelihood_gradient(self):
+        np.random.seed(11)
+        x = np.random.random((12, 3))
+        y = np.random.random((12, 2))
+        sq_dist, ij = _pairwise_sq_distances(x)
+        log_thetas = np.array([0.3, -0.5, 1.2])
+
+        _, grad = _neg_reduced_likelihood(log_thetas, sq_dist, ij, y, 1e-10)
+
+        h = 1e-6
+        fd = np.zeros(3)
+        for i, step in enumerate(np.eye(3) * h):
+            fd[i] = (_neg_reduced_likelihood(log_thetas + step, sq_dist, ij, y, 1e-10)[0] -
+                     _neg_reduced_likelihood(log_thetas - step, sq_dist, ij, y, 1e-10)[0]) / (2 * h)
+
+        assert_rel_error(self, grad, fd, 1e-6)
+
+    def test_repeated_points(self):
+        # the correlation matrix is singular, so training uses the SVD-regularized objective
+        x = np.array([[1., 1.], [2., 3.], [3., 4.]] * 2)
+        y = np.array([[3.], [2.], [1.]] * 2)
+
+        X = (x - x.mean(axis=0)) / x.std(axis=0)
+        sq_dist, ij = _pairwise_sq_distances(X)
+        with self.assertRaises(kriging._SingularCorrelation):
+            _neg_reduced_likelihood(0.1 * np.ones(2), sq_dist, ij, y, 1e-15)
+
+        surrogate = KrigingSurrogate()
+        surrogate.train(x, y)
+
+        assert_rel_error(self, surrogate.thetas, np.array([1.12, 1.12]), 1e-2)
+        assert_rel_error(self, surrogate.predict(np.array([2.5, 3.5]))[0], 1.5, 1e-2)
+
+    def test_multistart(self):
+        np.random.seed(3)
+        x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                      [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                      [10., 12.], [7., 13.5], [2.5, 15.]])
+        y = np.array([[branin(case)] for case in x])
+
+        single = KrigingSurrogate(nugget=0.)
+        single.train(x, y)
+        likelihood = single._calculate_reduced_likelihood_params()[0]
+
+        for num_workers in (1, 2):
+            surrogate = KrigingSurrogate(nugget=0., n_start=3, num_workers=num_workers)
+            surrogate.train(x, y)
+
+            # the default starting point is always one of the starts
+            self.assertTrue(surrogate._calculate_reduced_likelihood_params()[0] >=
+                            likelihood - 1e-8)
+
+            for x0, y0 in zip(x, y):
+                assert_rel_error(self, surrogate.predict(x0), [y0], 1e-9)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -420,3 +420,118 @@ class TestRBFInterpolatorND(unittest.TestCase):
         for x0, y0 in zip(test_x, expected_deriv):
             mu = self.surrogate.linearize(x0)
             assert_rel_error(self, mu, y0, 1e-6)
+
+
+class TestUpdate(unittest.TestCase):
+
+    def test_update(self):
+        np.random.seed(4)
+        x = np.random.random((60, 2))
+        # keep the bounding box of the training data the same
+        x[:4] = [[0., 0.], [0., 1.], [1., 0.], [1., 1.]]
+        y = np.column_stack((np.sin(3. * x[:, 0]) * x[:, 1], x[:, 0] - x[:, 1]))
+        y[:2] = [[-1., -1.], [1., 1.]]
+
+        test_x = np.random.random((10, 2))
+
+        for interpolant_type in ('linear', 'weighted', 'rbf'):
+            expected = NearestNeighbor(interpolant_type=interpolant_type)
+            expected.train(x, y)
+
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(x[:50], y[:50])
+
+            # few enough points to be kept in a separate tree
+            surrogate.update(x[50:53], y[50:53])
+            self.assertEqual(surrogate.interpolant._KData.n, 53)
+            self.assertEqual(surrogate.interpolant._KData.num_tree, 50)
+
+            # the tree is rebuilt once the new points are too many
+            surrogate.update(x[53:], y[53:])
+            self.assertFalse(hasattr(surrogate.interpolant._KData, 'num_tree'))
+
+            assert_rel_error(self, surrogate.predict(test_x), expected.predict(test_x), 1e-10)
+
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(x[:50], y[:50])
+            surrogate.update(x[50:53], y[50:53])
+
+            expected = NearestNeighbor(interpolant_type=interpolant_type)
+            expected.train(x[:53], y[:53])
+
+            assert_rel_error(self, surrogate.predict(test_x), expected.predict(test_x), 1e-10)
+            assert_rel_error(self, surrogate.linearize(test_x[:1]),
+                             expected.linearize(test_x[:1]), 1e-10)
+
+
+class TestPredictAndLinearize(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(4)
+        self.x = np.random.random((40, 2))
+        self.y = np.column_stack((np.sin(3. * self.x[:, 0]) * self.x[:, 1],
+                                  self.x[:, 0] ** 2))
+        self.test_x = np.random.random((5, 2))
+
+    def test_predict_and_linearize(self):
+        for interpolant_type in ('linear', 'weighted', 'rbf'):
+            expected = NearestNeighbor(interpolant_type=interpolant_type)
+            expected.train(self.x, self.y)
+
+            for kwargs in ({}, {'cache_size': 0}, {'workers': 2}):
+                surrogate = NearestNeighbor(interpolant_type=interpolant_type, **kwargs)
+                surrogate.train(self.x, self.y)
+
+                test_x = self.test_x.copy()
+                value, jac = surrogate.predict_and_linearize(test_x[:1])
+
+                assert_rel_error(self, value, expected.predict(self.test_x[:1]), 1e-12)
+                assert_rel_error(self, jac, expected.linearize(self.test_x[:1]), 1e-12)
+
+                value = surrogate.vectorized_predict(test_x)
+                jac = surrogate.vectorized_linearize(test_x)
+                self.assertEqual(jac.shape, (5, 2, 2))
+                for i in range(5):
+                    assert_rel_error(self, value[i], expected.predict(self.test_x[i])[0], 1e-12)
+                    assert_rel_error(self, jac[i], expected.linearize(self.test_x[i]), 1e-12)
+
+                # the caller's array is left alone
+                assert_rel_error(self, test_x, self.test_x, 0.)
+
+    def test_query_cache(self):
+        surrogate = NearestNeighbor(interpolant_type='weighted', cache_size=2)
+        surrogate.train(self.x, self.y)
+        interpolant = surrogate.interpolant
+
+        for x0 in self.test_x[:3]:
+            surrogate.predict(x0)
+        self.assertEqual(len(interpolant._query_cache), 2)
+
+        # the oldest query has been dropped, the newest ones are found without the tree
+        tree = interpolant._KData
+        interpolant._KData = None
+        surrogate.linearize(self.test_x[2])
+        surrogate.linearize(self.test_x[1])
+        with self.assertRaises(AttributeError):
+            surrogate.linearize(self.test_x[0])
+        interpolant._KData = tree
+
+        surrogate.update(self.x[:1] * 0.5, self.y[:1])
+        self.assertEqual(len(interpolant._query_cache), 0)
+
+    def test_complex_step(self):
+        for interpolant_type in ('weighted', 'rbf'):
+            surrogate = NearestNeighbor(interpolant_type=interpolant_type)
+            surrogate.train(self.x, self.y)
+
+            x0 = self.test_x[0]
+            jac = surrogate.linearize(x0)
+            for j in range(2):
+                x_cs = x0.astype(complex)
+                x_cs[j] += 1e-30j
+                deriv = surrogate.predict(x_cs)[0].imag / 1e-30
+                assert_rel_error(self, deriv, jac[:, j], 1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
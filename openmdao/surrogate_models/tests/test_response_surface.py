@@ -137,6 +137,46 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_rel_error(self, jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_vectorized(self):
+        x = array([[a, b, c] for a, b, c in
+                   itertools.product(linspace(0, 1, 4), repeat=3)])
+        y = array([[a * b + c ** 2, sin(a) - b * c] for a, b, c in x])
+
+        surrogate = ResponseSurface()
+        surrogate.train(x, y)
+
+        new_x = array([[0.2, 0.7, 0.4], [0.9, 0.1, 0.5], [0.3, 0.3, 0.8]])
+        mu = surrogate.vectorized_predict(new_x)
+        jac = surrogate.vectorized_linearize(new_x)
+
+        self.assertEqual(mu.shape, (3, 2))
+        self.assertEqual(jac.shape, (3, 2, 3))
+
+        for i, x0 in enumerate(new_x):
+            assert_rel_error(self, mu[i], surrogate.predict(x0), 1e-12)
+            assert_rel_error(self, jac[i], surrogate.linearize(x0), 1e-12)
+
+            # a * b + c ** 2 is in the model, so its derivatives are exact
+            a, b, c = x0
+            assert_rel_error(self, jac[i, 0], array([b, a, 2 * c]), 1e-10)
+
+    def test_update(self):
+        x = array([[a, b] for a, b in
+                   itertools.product(linspace(0, 1, 5), repeat=2)])
+        y = array([[sin(a) * b, cos(a + b)] for a, b in x])
+
+        expected = ResponseSurface()
+        expected.train(x, y)
+
+        # start with too few points to determine the coefficients
+        surrogate = ResponseSurface()
+        surrogate.train(x[:3], y[:3])
+        surrogate.update(x[3:10], y[3:10])
+        surrogate.update(x[10:], y[10:])
+
+        self.assertEqual(surrogate.m, 25)
+        assert_rel_error(self, surrogate.betas, expected.betas, 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
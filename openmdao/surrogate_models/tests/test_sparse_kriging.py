@@ -0,0 +1,123 @@
+import copy
+import unittest
+
+import numpy as np
+
+from openmdao.api import SparseKrigingSurrogate, KrigingSurrogate
+from openmdao.surrogate_models.kriging import _correlation_vectors
+from openmdao.devtools.testutil import assert_rel_error
+
+
+def func(x):
+    return np.column_stack((np.sin(3. * x[:, 0]) + x[:, 1] ** 2, x[:, 0] * x[:, 1]))
+
+
+class TestSparseKrigingSurrogate(unittest.TestCase):
+
+    def test_exact_when_small(self):
+        np.random.seed(2)
+        x = np.random.random((20, 2))
+        y = func(x)
+
+        exact = KrigingSurrogate()
+        exact.train(x, y)
+
+        np.random.seed(2)
+        surrogate = SparseKrigingSurrogate(n_inducing=20)
+        surrogate.train(x, y)
+
+        new_x = np.random.random((5, 2))
+        assert_rel_error(self, surrogate.vectorized_predict(new_x),
+                         exact.vectorized_predict(new_x), 1e-12)
+
+    def test_inducing_points(self):
+        np.random.seed(7)
+        x = np.random.random((2000, 2))
+        y = func(x)
+
+        surrogate = SparseKrigingSurrogate(n_inducing=100)
+        surrogate.train(x, y)
+
+        self.assertEqual(surrogate.X.shape, (100, 2))
+        self.assertEqual(surrogate.alpha.shape, (100, 2))
+
+        new_x = np.random.random((50, 2))
+        assert_rel_error(self, surrogate.vectorized_predict(new_x), func(new_x), 1e-2)
+
+        mu = surrogate.predict(new_x[0])
+        assert_rel_error(self, mu, func(new_x[:1]), 1e-2)
+
+        x0 = new_x[0]
+        jac = surrogate.linearize(x0)
+        expected = np.array([[3. * np.cos(3. * x0[0]), 2. * x0[1]],
+                             [x0[1], x0[0]]])
+        assert_rel_error(self, jac, expected, 1e-2)
+
+    def test_update_keeps_inducing_points(self):
+        np.random.seed(8)
+        x = np.random.random((600, 2))
+        y = func(x)
+
+        # the exact model switches to the approximation when it gets too many points
+        surrogate = SparseKrigingSurrogate(n_inducing=100)
+        surrogate.train(x[:80], y[:80])
+        surrogate.update(x[80:90], y[80:90])
+        self.assertEqual(surrogate.n_samples, 90)
+        surrogate.update(x[90:300], y[90:300])
+        self.assertEqual(surrogate.n_samples, 100)
+
+        inducing = surrogate.X.copy()
+        surrogate.update(x[300:], y[300:])
+
+        # the inducing points are kept
+        assert_rel_error(self, surrogate.X, inducing, 1e-15)
+
+        new_x = np.random.random((50, 2))
+        assert_rel_error(self, surrogate.vectorized_predict(new_x), func(new_x), 1e-2)
+
+        # the updated weights are the least squares fit of all the points, with the
+        # regularization set when the approximation was trained on 300 points
+        X = (x - surrogate.X_mean) / surrogate.X_std
+        Y = (y - surrogate.Y_mean) / surrogate.Y_std
+        A = np.vstack((np.sqrt(surrogate.regularization * 300) * np.eye(100),
+                       _correlation_vectors(X, surrogate.X, surrogate.thetas)))
+        b = np.vstack((np.zeros((100, 2)), Y))
+        expected = copy.deepcopy(surrogate)
+        expected.alpha = np.linalg.lstsq(A, b, rcond=None)[0]
+
+        x0 = new_x[0]
+        assert_rel_error(self, surrogate.predict(x0), expected.predict(x0), 1e-8)
+        assert_rel_error(self, surrogate.linearize(x0), expected.linearize(x0), 1e-8)
+
+    def test_update(self):
+        np.random.seed(8)
+        x = np.random.random((600, 2))
+        y = func(x)
+
+        # the exact model switches to the approximation when it gets too many points
+        surrogate = SparseKrigingSurrogate(n_inducing=100)
+        surrogate.train(x[:80], y[:80])
+        surrogate.update(x[80:90], y[80:90])
+        self.assertEqual(surrogate.n_samples, 90)
+        surrogate.update(x[90:300], y[90:300])
+        self.assertEqual(surrogate.n_samples, 100)
+
+        expected = SparseKrigingSurrogate(n_inducing=100)
+        expected.X_mean, expected.X_std = surrogate.X_mean, surrogate.X_std
+        expected.Y_mean, expected.Y_std = surrogate.Y_mean, surrogate.Y_std
+        expected.X, expected.Y = surrogate.X, surrogate.Y
+        expected.n_samples, expected.thetas = surrogate.n_samples, surrogate.thetas
+        expected._triu = surrogate._triu.copy()
+
+        surrogate.update(x[300:], y[300:])
+        expected._fit(x[300:450], y[300:450])
+        expected._fit(x[450:], y[450:])
+
+        assert_rel_error(self, surrogate.alpha, expected.alpha, 1e-8)
+
+        new_x = np.random.random((50, 2))
+        assert_rel_error(self, surrogate.vectorized_predict(new_x), func(new_x), 1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()
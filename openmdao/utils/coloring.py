@@ -0,0 +1,150 @@
+"""
+Routines to compute jacobian sparsity and colorings for simultaneous derivatives.
+"""
+from __future__ import division
+
+from six import iteritems
+from six.moves import range
+
+import numpy as np
+from scipy.sparse import csc_matrix
+
+
+def get_total_jac_sparsity(problem, of=None, wrt=None, num_full_jacs=1, perturb=1e-3,
+                           tol=1e-25):
+    """
+    Compute the boolean sparsity structure of the total jacobian.
+
+    The first total jacobian is computed at the current design point and any others at
+    randomly perturbed design points, so that entries that happen to be zero at one
+    point aren't mistaken for structural zeros. The design point is restored afterward.
+
+    Parameters
+    ----------
+    problem : <Problem>
+        The Problem, which must already be set up.
+    of : list of str or None
+        Absolute names of the responses. Default is None, which uses the driver's responses.
+    wrt : list of str or None
+        Absolute names of the design variables. Default is None, which uses the driver's
+        design variables.
+    num_full_jacs : int
+        Number of times to compute the full total jacobian.
+    perturb : float
+        Relative size of the random design variable perturbations.
+    tol : float
+        Entries with a magnitude at or below this are treated as zero.
+
+    Returns
+    -------
+    dict
+        Nested dict of boolean arrays keyed by [of][wrt].
+    """
+    driver = problem.driver
+    if of is None:
+        of = list(driver._responses)
+    if wrt is None:
+        wrt = list(driver._designvars)
+
+    outputs = problem.model._outputs._views_flat
+    orig = {name: outputs[name].copy() for name in wrt}
+
+    sparsity = None
+    saved = driver._total_jac_sparsity
+    driver._total_jac_sparsity = None
+    try:
+        for i in range(num_full_jacs):
+            if i > 0:
+                for name, val in iteritems(orig):
+                    outputs[name][:] = val + perturb * (np.abs(val) + 1.0) * \
+                        (2.0 * np.random.random(val.shape) - 1.0)
+                problem.run_model()
+
+            J = problem._compute_total_derivs(of=of, wrt=wrt, return_format='dict',
+                                              global_names=True)
+            if sparsity is None:
+                sparsity = {o: {w: np.abs(J[o][w]) > tol for w in wrt} for o in of}
+            else:
+                for o in of:
+                    for w in wrt:
+                        sparsity[o][w] |= np.abs(J[o][w]) > tol
+    finally:
+        driver._total_jac_sparsity = saved
+        if num_full_jacs > 1:
+            for name, val in iteritems(orig):
+                outputs[name][:] = val
+            problem.run_model()
+
+    return sparsity
+
+
+def get_simul_coloring(sparsity, of, wrt, mode='fwd'):
+    """
+    Compute a coloring of the columns (fwd) or rows (rev) of the total jacobian.
+
+    Columns (or rows) that share a color have no nonzero entries in common, so they can be
+    seeded together and solved for with a single linear solve. A greedy, largest-first
+    heuristic is used.
+
+    Parameters
+    ----------
+    sparsity : dict
+        Nested dict of boolean arrays keyed by [of][wrt].
+    of : list of str
+        Names of the responses, in order.
+    wrt : list of str
+        Names of the design variables, in order.
+    mode : str
+        'fwd' to color columns or 'rev' to color rows.
+
+    Returns
+    -------
+    list of ndarray
+        For each color, the indices of the columns (fwd) or rows (rev) of that color, where
+        the indices run over the concatenated design variables (fwd) or responses (rev).
+    """
+    if mode == 'fwd':
+        J = np.vstack([np.hstack([sparsity[o][w] for w in wrt]) for o in of])
+    else:
+        J = np.vstack([np.hstack([sparsity[o][w].T for o in of]) for w in wrt])
+
+    return color_columns(J)
+
+
+def color_columns(J):
+    """
+    Compute a coloring of the columns of a matrix from its sparsity.
+
+    Columns that share a color have no nonzero rows in common. A greedy, largest-first
+    heuristic is used.
+
+    Parameters
+    ----------
+    J : ndarray or scipy.sparse matrix
+        matrix whose nonzero entries define the sparsity.
+
+    Returns
+    -------
+    list of ndarray
+        For each color, the indices of the columns of that color.
+    """
+    J = csc_matrix(J)
+    J.eliminate_zeros()
+    Jrows = J.tocsr()
+    ncols = J.shape[1]
+
+    col_colors = np.full(ncols, -1, dtype=int)
+    ncolors = 0
+    for col in np.argsort(-np.diff(J.indptr), kind='mergesort'):
+        # all the columns that share a nonzero row with this one
+        neighbors = [Jrows.indices[Jrows.indptr[row]:Jrows.indptr[row + 1]]
+                     for row in J.indices[J.indptr[col]:J.indptr[col + 1]]]
+        used = set(col_colors[np.concatenate(neighbors)]) if neighbors else set()
+
+        color = 0
+        while color in used:
+            color += 1
+        col_colors[col] = color
+        ncolors = max(ncolors, color + 1)
+
+    return [np.nonzero(col_colors == color)[0] for color in range(ncolors)]
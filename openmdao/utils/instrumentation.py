@@ -0,0 +1,305 @@
+"""Lightweight counters and timers for the execution of systems and solvers."""
+
+from __future__ import division
+
+import csv
+import json
+from collections import OrderedDict, deque
+from timeit import default_timer
+
+from six import iteritems
+
+
+SYSTEM_METHODS = ('_solve_nonlinear', '_apply_nonlinear', '_linearize',
+                  '_apply_linear', '_solve_linear', '_transfer')
+
+_SUBSOLVER_ATTRS = ('linear_solver', 'linesearch', 'precon')
+
+
+class Instrumentation(object):
+    """
+    Counters and timers for the methods of the systems and solvers in a model.
+
+    The methods are wrapped on the instances, so there is no cost at all when the
+    instrumentation is not installed, and the cost of a pair of timer calls per
+    call when it is. Times are inclusive, i.e., the time of a group's method includes
+    the time of the same methods in its subsystems.
+
+    Attributes
+    ----------
+    _comm : MPI.Comm or <FakeComm>
+        The communicator across which the stats are aggregated.
+    _history_size : int
+        Number of residual histories kept per solver; older ones are discarded.
+    _system_stats : OrderedDict
+        Stats of the systems; pathname: {method name: [calls, time]}.
+    _solver_stats : OrderedDict
+        Stats of the solvers; name: [type, calls, time, iterations, histories].
+    _wrapped : list of (object, str)
+        The instances and names of the wrapped methods.
+    """
+
+    def __init__(self, comm, history_size=100):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            The communicator across which the stats are aggregated.
+        history_size : int
+            Number of residual histories kept per solver; older ones are discarded.
+        """
+        self._comm = comm
+        self._history_size = history_size
+        self._system_stats = OrderedDict()
+        self._solver_stats = OrderedDict()
+        self._wrapped = []
+
+    def install(self, model):
+        """
+        Wrap the methods of all the systems and solvers in the model.
+
+        Parameters
+        ----------
+        model : <System>
+            The top system of the model.
+        """
+        seen = set()
+        for system in model.system_iter(include_self=True, recurse=True):
+            self._system_stats[system.pathname] = stats = OrderedDict()
+            for name in SYSTEM_METHODS:
+                stats[name] = stat = [0, 0.]
+                self._wrap_system_method(system, name, stat)
+
+            prefix = system.pathname + '.' if system.pathname else ''
+            for attr in ('nonlinear_solver', 'linear_solver'):
+                solver = getattr(system, attr)
+                if solver is not None:
+                    self._install_solver(solver, prefix + attr, seen)
+
+    def _install_solver(self, solver, name, seen):
+        """
+        Wrap the methods of a solver and of its subsolvers.
+
+        Parameters
+        ----------
+        solver : <Solver>
+            The solver to instrument.
+        name : str
+            Name under which the stats of the solver are stored.
+        seen : set
+            Ids of the solvers that are already instrumented, since solvers can be shared.
+        """
+        if id(solver) in seen:
+            return
+        seen.add(id(solver))
+
+        stat = [type(solver).__name__, 0, 0., 0, deque(maxlen=self._history_size)]
+        self._solver_stats[name] = stat
+        self._wrap_solver(solver, stat)
+
+        for attr in _SUBSOLVER_ATTRS:
+            sub = getattr(solver, attr, None)
+            if sub is not None:
+                self._install_solver(sub, name + '.' + attr, seen)
+
+    def _wrap_system_method(self, system, name, stat):
+        """
+        Replace a method of a system instance with a counting and timing wrapper.
+
+        Parameters
+        ----------
+        system : <System>
+            The system that owns the method.
+        name : str
+            Name of the method.
+        stat : list
+            [calls, time] list that is updated by the wrapper.
+        """
+        method = getattr(system, name)
+
+        def wrapper(*args, **kwargs):
+            start = default_timer()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stat[0] += 1
+                stat[1] += default_timer() - start
+
+        setattr(system, name, wrapper)
+        self._wrapped.append((system, name))
+
+    def _wrap_solver(self, solver, stat):
+        """
+        Replace the solve and _mpi_print methods of a solver instance with wrappers.
+
+        Every solver reports its residual norms through _mpi_print, whether or not
+        it actually prints them, so that is where the residual history is recorded.
+
+        Parameters
+        ----------
+        solver : <Solver>
+            The solver to instrument.
+        stat : list
+            [type, calls, time, iterations, histories] list that is updated by the wrappers.
+        """
+        solve = solver.solve
+        mpi_print = solver._mpi_print
+        histories = stat[4]
+
+        def solve_wrapper(*args, **kwargs):
+            histories.append([])
+            start = default_timer()
+            try:
+                return solve(*args, **kwargs)
+            finally:
+                stat[1] += 1
+                stat[2] += default_timer() - start
+                stat[3] += solver._iter_count
+
+        def mpi_print_wrapper(iteration, abs_res, rel_res):
+            if not histories:
+                histories.append([])
+            histories[-1].append(float(abs_res))
+            mpi_print(iteration, abs_res, rel_res)
+
+        solver.solve = solve_wrapper
+        solver._mpi_print = mpi_print_wrapper
+        self._wrapped.append((solver, 'solve'))
+        self._wrapped.append((solver, '_mpi_print'))
+
+    def remove(self):
+        """
+        Restore the original methods of all the instrumented systems and solvers.
+        """
+        for obj, name in self._wrapped:
+            if name in obj.__dict__:
+                delattr(obj, name)
+        self._wrapped = []
+
+    def reset(self):
+        """
+        Zero all the counters and timers, and clear the residual histories.
+        """
+        for stats in self._system_stats.values():
+            for stat in stats.values():
+                stat[0] = 0
+                stat[1] = 0.
+        for stat in self._solver_stats.values():
+            stat[1] = 0
+            stat[2] = 0.
+            stat[3] = 0
+            stat[4].clear()
+
+    def get_stats(self):
+        """
+        Return the stats, aggregated across all processes.
+
+        Under MPI, this must be called on all processes. The calls and times of a
+        system or solver that runs on several processes are the maxima across them.
+
+        Returns
+        -------
+        dict
+            {'systems': {pathname: {method: {'calls': int, 'time': float}}},
+            'solvers': {name: {'type': str, 'calls': int, 'time': float,
+            'iterations': int, 'histories': list of list of float}}}.
+        """
+        systems = OrderedDict()
+        for pathname, stats in iteritems(self._system_stats):
+            systems[pathname] = OrderedDict(
+                (name, {'calls': stat[0], 'time': stat[1]}) for name, stat in iteritems(stats))
+
+        solvers = OrderedDict()
+        for name, stat in iteritems(self._solver_stats):
+            solvers[name] = {'type': stat[0], 'calls': stat[1], 'time': stat[2],
+                             'iterations': stat[3], 'histories': [list(h) for h in stat[4]]}
+
+        if self._comm.size > 1:
+            systems, solvers = self._gather(systems, solvers)
+
+        return {'systems': systems, 'solvers': solvers}
+
+    def _gather(self, systems, solvers):
+        """
+        Merge the stats of all processes.
+
+        Parameters
+        ----------
+        systems : OrderedDict
+            Stats of the local systems.
+        solvers : OrderedDict
+            Stats of the local solvers.
+
+        Returns
+        -------
+        OrderedDict
+            Stats of the systems on all processes.
+        OrderedDict
+            Stats of the solvers on all processes.
+        """
+        all_systems = OrderedDict()
+        all_solvers = OrderedDict()
+        for proc_systems, proc_solvers in self._comm.allgather((systems, solvers)):
+            for pathname, stats in iteritems(proc_systems):
+                if pathname not in all_systems:
+                    all_systems[pathname] = stats
+                    continue
+                for name, stat in iteritems(stats):
+                    merged = all_systems[pathname][name]
+                    merged['calls'] = max(merged['calls'], stat['calls'])
+                    merged['time'] = max(merged['time'], stat['time'])
+
+            for name, stat in iteritems(proc_solvers):
+                if name not in all_solvers:
+                    all_solvers[name] = stat
+                    continue
+                merged = all_solvers[name]
+                for key in ('calls', 'time', 'iterations'):
+                    merged[key] = max(merged[key], stat[key])
+
+        return all_systems, all_solvers
+
+    def save_json(self, filename):
+        """
+        Write the aggregated stats to a JSON file.
+
+        Under MPI, this must be called on all processes; only the first one writes the file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        """
+        stats = self.get_stats()
+        if self._comm.rank == 0:
+            with open(filename, 'w') as f:
+                json.dump(stats, f, indent=2)
+
+    def save_csv(self, filename):
+        """
+        Write the aggregated counters and timers to a CSV file, one row per method.
+
+        Under MPI, this must be called on all processes; only the first one writes the file.
+        Residual histories are only exported to JSON.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        """
+        stats = self.get_stats()
+        if self._comm.rank != 0:
+            return
+
+        with open(filename, 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(['kind', 'name', 'type', 'method', 'calls', 'time', 'iterations'])
+            for pathname, methods in iteritems(stats['systems']):
+                for method, stat in iteritems(methods):
+                    writer.writerow(['system', pathname, '', method,
+                                     stat['calls'], repr(stat['time']), ''])
+            for name, stat in iteritems(stats['solvers']):
+                writer.writerow(['solver', name, stat['type'], 'solve',
+                                 stat['calls'], repr(stat['time']), stat['iterations']])
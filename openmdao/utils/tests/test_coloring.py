@@ -0,0 +1,91 @@
+"""Test simultaneous derivatives using a coloring of the total jacobian."""
+from __future__ import division, print_function
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp
+from openmdao.devtools.testutil import assert_rel_error
+from openmdao.utils.coloring import get_total_jac_sparsity, get_simul_coloring
+
+
+def _build_problem(mode):
+    n = 6
+
+    p = Problem()
+    model = p.model
+
+    indeps = model.add_subsystem('indeps', IndepVarComp())
+    indeps.add_output('x', np.arange(n) + 1.0)
+    indeps.add_output('z', 2.0)
+
+    model.add_subsystem('sq', ExecComp('y=x**2', x=np.ones(n), y=np.ones(n)))
+    model.add_subsystem('tot', ExecComp('s=sum(x[:3])*z', x=np.ones(n)))
+
+    model.connect('indeps.x', ['sq.x', 'tot.x'])
+    model.connect('indeps.z', 'tot.z')
+
+    model.add_design_var('indeps.x')
+    model.add_design_var('indeps.z')
+    model.add_constraint('sq.y', upper=0.0)
+    model.add_constraint('tot.s', upper=0.0)
+
+    p.setup(check=False, mode=mode)
+    p.run_model()
+
+    return p
+
+
+class SimulColoringTestCase(unittest.TestCase):
+
+    def test_coloring(self):
+        sparsity = {
+            'y': {'x': np.eye(4, dtype=bool), 'z': np.ones((4, 1), dtype=bool)},
+            's': {'x': np.array([[True, True, False, False]]), 'z': np.zeros((1, 1), dtype=bool)},
+        }
+
+        colors = get_simul_coloring(sparsity, ['y', 's'], ['x', 'z'], 'fwd')
+        self.assertEqual(len(colors), 3)
+        self.assertEqual(sorted(np.concatenate(colors)), list(range(5)))
+
+        colors = get_simul_coloring(sparsity, ['y', 's'], ['x', 'z'], 'rev')
+        self.assertEqual(len(colors), 4)
+        self.assertEqual(sorted(np.concatenate(colors)), list(range(5)))
+
+    def test_simul_totals(self):
+        of = ['sq.y', 'tot.s']
+        wrt = ['indeps.x', 'indeps.z']
+
+        for mode, nsolves in (('fwd', 4), ('rev', 2)):
+            p = _build_problem(mode)
+            expected = p.compute_total_derivs(of=of, wrt=wrt)
+
+            sparsity = get_total_jac_sparsity(p, num_full_jacs=2)
+            self.assertTrue(sparsity['sq.y']['indeps.x'][0, 0])
+            self.assertFalse(sparsity['sq.y']['indeps.x'][0, 1])
+            self.assertFalse(sparsity['sq.y']['indeps.z'][0, 0])
+            p.driver.set_total_jac_sparsity(sparsity)
+
+            calls = []
+            solve_linear = p.model._solve_linear
+
+            def counted_solve_linear(vec_names, mode, rel_systems=None):
+                calls.append(vec_names)
+                return solve_linear(vec_names, mode, rel_systems)
+
+            p.model._solve_linear = counted_solve_linear
+
+            J = p.compute_total_derivs(of=of, wrt=wrt)
+
+            self.assertEqual(len(calls), nsolves)
+            for key, val in J.items():
+                assert_rel_error(self, val, expected[key], 1e-12)
+
+            J = p.compute_total_derivs(of=of, wrt=wrt, return_format='dict')
+            for (okey, ikey), val in expected.items():
+                assert_rel_error(self, J[okey][ikey], val, 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
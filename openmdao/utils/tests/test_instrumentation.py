@@ -0,0 +1,108 @@
+"""Tests for the counters and timers of systems and solvers."""
+from __future__ import division
+
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+from openmdao.api import Problem, NonlinearBlockGS, ScipyIterativeSolver
+from openmdao.devtools.testutil import assert_rel_error
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.instrumentation import SYSTEM_METHODS
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _build(self, instrument=True):
+        prob = Problem(SellarDerivatives(nonlinear_solver=NonlinearBlockGS(),
+                                         linear_solver=ScipyIterativeSolver()))
+        prob.options['instrument'] = instrument
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        return prob
+
+    def test_disabled(self):
+        prob = self._build(instrument=False)
+        self.assertIsNone(prob.instrumentation)
+        for name in SYSTEM_METHODS:
+            self.assertNotIn(name, prob.model.__dict__)
+
+    def test_stats(self):
+        prob = self._build()
+        prob.run_model()
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+
+        stats = prob.instrumentation.get_stats()
+        systems = stats['systems']
+        self.assertEqual(systems['']['_solve_nonlinear']['calls'], 1)
+        self.assertGreater(systems['']['_solve_nonlinear']['time'], 0.)
+
+        nl_stats = stats['solvers']['nonlinear_solver']
+        self.assertEqual(nl_stats['type'], 'NonlinearBlockGS')
+        self.assertEqual(nl_stats['calls'], 1)
+        self.assertEqual(len(nl_stats['histories']), 1)
+        history = nl_stats['histories'][0]
+        self.assertEqual(len(history), nl_stats['iterations'] + 1)
+        self.assertLess(history[-1], history[0])
+
+        # one Gauss-Seidel pass through d1 per iteration, and one residual evaluation per norm
+        self.assertEqual(systems['d1']['_solve_nonlinear']['calls'], nl_stats['iterations'])
+        self.assertEqual(systems['']['_apply_nonlinear']['calls'], len(history))
+
+        prob.compute_total_derivs(of=['obj'], wrt=['x', 'z'])
+        stats = prob.instrumentation.get_stats()
+        self.assertEqual(stats['systems']['']['_linearize']['calls'], 1)
+        self.assertEqual(stats['solvers']['linear_solver']['calls'], 1)
+        self.assertGreater(stats['solvers']['linear_solver']['iterations'], 0)
+
+        prob.instrumentation.reset()
+        stats = prob.instrumentation.get_stats()
+        self.assertEqual(stats['systems']['d1']['_solve_nonlinear']['calls'], 0)
+        self.assertEqual(stats['solvers']['nonlinear_solver']['histories'], [])
+
+    def test_export(self):
+        prob = self._build()
+        prob.run_model()
+
+        json_file = os.path.join(self.tempdir, 'stats.json')
+        prob.instrumentation.save_json(json_file)
+        with open(json_file) as f:
+            stats = json.load(f)
+        self.assertEqual(stats, json.loads(json.dumps(prob.instrumentation.get_stats())))
+
+        csv_file = os.path.join(self.tempdir, 'stats.csv')
+        prob.instrumentation.save_csv(csv_file)
+        with open(csv_file) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), len(stats['systems']) * len(SYSTEM_METHODS) +
+                         len(stats['solvers']))
+        row = [r for r in rows if r['name'] == 'd1' and r['method'] == '_solve_nonlinear'][0]
+        self.assertEqual(int(row['calls']), stats['systems']['d1']['_solve_nonlinear']['calls'])
+
+    def test_setup_twice(self):
+        prob = self._build()
+        prob.setup(check=False)
+        prob.run_model()
+
+        # the methods are not wrapped twice
+        stats = prob.instrumentation.get_stats()
+        self.assertEqual(stats['systems']['']['_solve_nonlinear']['calls'], 1)
+
+        prob.options['instrument'] = False
+        prob.setup(check=False)
+        self.assertIsNone(prob.instrumentation)
+        self.assertNotIn('_solve_nonlinear', prob.model.__dict__)
+        self.assertNotIn('solve', prob.model.nonlinear_solver.__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
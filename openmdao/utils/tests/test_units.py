@@ -4,7 +4,8 @@ import os
 import unittest
 
 # from openmdao.devtools.testutil import assert_rel_error
-from openmdao.utils.units import NumberDict, PhysicalUnit, _find_unit, import_library, add_unit, add_offset_unit
+from openmdao.utils.units import NumberDict, PhysicalUnit, _find_unit, import_library, add_unit, add_offset_unit, \
+    get_conversion, convert_units
 
 
 class TestNumberDict(unittest.TestCase):
@@ -263,6 +264,18 @@ class TestModuleFunctions(unittest.TestCase):
         else:
             self.fail("Expecting Key Error")
 
+    def test_get_conversion(self):
+        factor, offset = get_conversion('degC', 'degF')
+        self.assertAlmostEqual((100. + offset) * factor, 212.)
+        self.assertAlmostEqual(convert_units(100., 'degC', 'degF'), 212.)
+
+        # the conversion of each pair of units is only computed once
+        self.assertIs(get_conversion('degC', 'degF'), get_conversion('degC', 'degF'))
+        self.assertAlmostEqual(convert_units(3., 'mm', 'cm'), .3)
+
+        with self.assertRaises(TypeError):
+            get_conversion('m', 's')
+
 
 if __name__ == "__main__":
     unittest.main()
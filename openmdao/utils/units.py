@@ -670,7 +670,33 @@ def add_unit(name, unit, comment=''):
     _UNIT_LIB.set('units', name, unit)
 
 
-_UNIT_LIB = ConfigParser()
+class _DefaultLibrary(object):
+    """
+    Stand-in for the default units library, which is only read when first needed.
+
+    On first access of any attribute, the default library is imported, replacing this
+    object as _UNIT_LIB.
+    """
+
+    def __getattr__(self, name):
+        """
+        Import the default library and get the attribute from it.
+
+        Parameters
+        ----------
+        name : str
+            name of the attribute.
+
+        Returns
+        -------
+        object
+            the attribute of the default library.
+        """
+        with open(os.path.join(os.path.dirname(__file__), 'unit_library.ini')) as default_lib:
+            return getattr(import_library(default_lib), name)
+
+
+_UNIT_LIB = _DefaultLibrary()
 
 
 def _do_nothing(string):
@@ -693,9 +719,6 @@ def _do_nothing(string):
     return string
 
 
-_UNIT_LIB.optionxform = _do_nothing
-
-
 def import_library(libfilepointer):
     """
     Import a units library, replacing any existing definitions.
@@ -712,7 +735,9 @@ def import_library(libfilepointer):
     """
     global _UNIT_LIB
     global _UNIT_CACHE
+    global _CONVERSION_CACHE
     _UNIT_CACHE = {}
+    _CONVERSION_CACHE = {}
     _UNIT_LIB = ConfigParser()
     _UNIT_LIB.optionxform = _do_nothing
     _UNIT_LIB.readfp(libfilepointer)
@@ -833,6 +858,9 @@ def _update_library(cfg):
 
 _UNIT_CACHE = {}
 
+# (factor, offset) conversion tuples, keyed by (old_units, new_units)
+_CONVERSION_CACHE = {}
+
 
 def _find_unit(unit):
     """
@@ -983,7 +1011,12 @@ def get_conversion(old_units, new_units):
     (float, float)
         Conversion factor and offset
     """
-    return _find_unit(old_units).conversion_tuple_to(_find_unit(new_units))
+    try:
+        return _CONVERSION_CACHE[old_units, new_units]
+    except KeyError:
+        conversion = _find_unit(old_units).conversion_tuple_to(_find_unit(new_units))
+        _CONVERSION_CACHE[old_units, new_units] = conversion
+        return conversion
 
 
 def convert_units(val, old_units, new_units=None):
@@ -1007,23 +1040,10 @@ def convert_units(val, old_units, new_units=None):
     if not old_units or not new_units:  # one side has no units
         return val
 
-    old_unit = _find_unit(old_units)
-    if new_units:
-        new_unit = _find_unit(new_units)
-    else:
-        new_unit = old_unit.in_base_units()
-
-    (factor, offset) = old_unit.conversion_tuple_to(new_unit)
+    (factor, offset) = get_conversion(old_units, new_units)
     return (val + offset) * factor
 
 
-# Load in the default unit library
-file_path = open(os.path.join(os.path.dirname(__file__),
-                 'unit_library.ini'))
-with file_path as default_lib:
-    import_library(default_lib)
-
-
 if __name__ == '__main__':
     for returned, expected in [
         (conversion_to_base_units('cm'), (0., 1.0e-2)),
@@ -16,6 +16,9 @@ real_types = tuple([numbers.Real, np.float32, np.float64])
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    The transfer is precompiled into a plan for each (in_set_name, out_set_name) key, which
+    copies contiguous runs of indices as slices.
     """
 
     def _initialize_transfer(self):
@@ -38,6 +41,17 @@ class DefaultTransfer(Transfer):
         self._in_inds = ins
         self._out_inds = outs
 
+        self._fwd_plan = fwd_plan = {}
+        self._rev_plan = rev_plan = {}
+        for key in ins:
+            fwd_plan[key] = _get_copy_plan(ins[key], outs[key])
+
+            uniq, inverse = np.unique(outs[key], return_inverse=True)
+            if uniq.size < outs[key].size:
+                rev_plan[key] = (ins[key], uniq, inverse)
+            else:
+                rev_plan[key] = fwd_plan[key]
+
     def __call__(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.
@@ -52,27 +66,66 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
-        in_inds = self._in_inds
-        out_inds = self._out_inds
-
         if mode == 'fwd':
-            for key in in_inds:
+            imag = in_vec._vector_info._under_complex_step and out_vec._alloc_complex
+            for key, plan in iteritems(self._fwd_plan):
                 in_set_name, out_set_name = key
-                in_vec._data[in_set_name][in_inds[key]] = \
-                    out_vec._data[out_set_name][out_inds[key]]
+                in_data = in_vec._data[in_set_name]
+                out_data = out_vec._data[out_set_name]
+                for in_idx, out_idx in plan:
+                    in_data[in_idx] = out_data[out_idx]
 
                 # Imaginary transfer
                 # (for CS, so only need in fwd)
-                if in_vec._vector_info._under_complex_step and out_vec._alloc_complex:
-                    in_vec._imag_data[in_set_name][in_inds[key]] = \
-                        out_vec._imag_data[out_set_name][out_inds[key]]
+                if imag:
+                    in_data = in_vec._imag_data[in_set_name]
+                    out_data = out_vec._imag_data[out_set_name]
+                    for in_idx, out_idx in plan:
+                        in_data[in_idx] = out_data[out_idx]
 
         elif mode == 'rev':
-            for key in in_inds:
+            for key, plan in iteritems(self._rev_plan):
                 in_set_name, out_set_name = key
-                np.add.at(
-                    out_vec._data[out_set_name], out_inds[key],
-                    in_vec._data[in_set_name][in_inds[key]])
+                in_data = in_vec._data[in_set_name]
+                out_data = out_vec._data[out_set_name]
+                if isinstance(plan, tuple):
+                    # some outputs receive more than one input, so sum them first.
+                    in_inds, uniq, inverse = plan
+                    out_data[uniq] += np.bincount(inverse, weights=in_data[in_inds],
+                                                  minlength=uniq.size)
+                else:
+                    for in_idx, out_idx in plan:
+                        out_data[out_idx] += in_data[in_idx]
+
+
+def _get_copy_plan(in_inds, out_inds, min_run=32):
+    """
+    Split a transfer into slice copies where the indices form contiguous runs.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        input indices for the transfer.
+    out_inds : int ndarray
+        output indices for the transfer.
+    min_run : int
+        minimum average run length for which slice copies are used.
+
+    Returns
+    -------
+    list of (slice, slice) or list of (ndarray, ndarray)
+        pairs of input and output indices to copy.
+    """
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    nruns = breaks.size + 1
+
+    if nruns > 1 and in_inds.size < min_run * nruns:
+        return [(in_inds, out_inds)]
+
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [in_inds.size]))
+    return [(slice(in_inds[i1], in_inds[i2 - 1] + 1), slice(out_inds[i1], out_inds[i2 - 1] + 1))
+            for i1, i2 in zip(starts, ends)]
 
 
 class DefaultVector(Vector):
@@ -97,6 +150,8 @@ class DefaultVector(Vector):
 
         sizes_byset_t = system._var_sizes_byset[type_]
         sizes_t = system._var_sizes[type_]
+        offsets_byset_t = system._var_offsets_byset[type_]
+        offsets_t = system._var_offsets[type_]
         allprocs_abs2idx_t = system._var_allprocs_abs2idx[type_]
         allprocs_abs2idx_byset_t = system._var_allprocs_abs2idx_byset[type_]
         abs2meta_t = system._var_abs2meta[type_]
@@ -113,12 +168,11 @@ class DefaultVector(Vector):
             idx_byset = allprocs_abs2idx_byset_t[abs_name]
             set_name = abs2meta_t[abs_name]['var_set']
 
-            ind1 = np.sum(sizes_t[iproc, :idx])
-            ind2 = np.sum(sizes_t[iproc, :idx + 1])
-            ind_byset1 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset])
-            ind_byset2 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset + 1])
+            ind1 = offsets_t[iproc, idx]
+            ind2 = ind1 + sizes_t[iproc, idx]
+            ind_byset1 = offsets_byset_t[set_name][iproc, idx_byset]
+            ind_byset2 = ind_byset1 + sizes_byset_t[set_name][iproc, idx_byset]
 
-            set_name = abs2meta_t[abs_name]['var_set']
             indices[set_name][ind_byset1:ind_byset2] = np.arange(ind1, ind2)
 
         return data, indices
@@ -179,6 +233,7 @@ class DefaultVector(Vector):
             ])
 
         root_vec._initialize_views()
+        root_vec._setup_contiguous()
 
     def _extract_data(self):
         """
@@ -255,6 +310,7 @@ class DefaultVector(Vector):
 
         allprocs_abs2idx_byset_t = system._var_allprocs_abs2idx_byset[type_]
         sizes_byset_t = system._var_sizes_byset[type_]
+        offsets_byset_t = system._var_offsets_byset[type_]
         abs2meta_t = system._var_abs2meta[type_]
 
         views = {}
@@ -269,8 +325,8 @@ class DefaultVector(Vector):
             idx_byset = allprocs_abs2idx_byset_t[abs_name]
             set_name = abs2meta_t[abs_name]['var_set']
 
-            ind_byset1 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset])
-            ind_byset2 = np.sum(sizes_byset_t[set_name][iproc, :idx_byset + 1])
+            ind_byset1 = offsets_byset_t[set_name][iproc, idx_byset]
+            ind_byset2 = ind_byset1 + sizes_byset_t[set_name][iproc, idx_byset]
             shape = abs2meta_t[abs_name]['shape']
 
             views_flat[abs_name] = v = self._data[set_name][ind_byset1:ind_byset2]
@@ -300,7 +356,7 @@ class DefaultVector(Vector):
         for set_name, data in iteritems(self._data):
             self._data[set_name] = np.array(data)
 
-        if self._vector_info._under_complex_step:
+        if self._alloc_complex:
             for set_name, data in iteritems(self._imag_data):
                 self._imag_data[set_name] = np.array(data)
 
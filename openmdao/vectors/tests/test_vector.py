@@ -1,6 +1,9 @@
 import unittest
 
-from openmdao.api import Problem, IndepVarComp
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp
+from openmdao.devtools.testutil import assert_rel_error
 
 class TestVector(unittest.TestCase):
 
@@ -18,7 +21,74 @@ class TestVector(unittest.TestCase):
 
         self.assertListEqual(outputs, expected, msg='Iter is not returning the expected names')
 
+    def test_transfer_plans(self):
+        n = 50
+        for mode in ('fwd', 'rev'):
+            p = Problem()
+            model = p.model
+            model.add_subsystem('px', IndepVarComp('x', np.arange(n) + 1.0))
+            model.add_subsystem('C1', ExecComp('y=2.0*x', x=np.ones(n), y=np.ones(n)))
+            model.add_subsystem('C2', ExecComp('y=3.0*x', x=np.ones(4), y=np.ones(4)))
+            model.connect('px.x', 'C1.x')
+            # px.x[0] goes to two inputs, so rev transfers accumulate repeated indices.
+            model.connect('px.x', 'C2.x', src_indices=[0, 0, 1, n - 1])
+            p.setup(check=False, mode=mode)
+            p.run_model()
+
+            assert_rel_error(self, p['C1.y'], 2.0 * (np.arange(n) + 1.0))
+            assert_rel_error(self, p['C2.x'], [1., 1., 2., n])
+
+            J = p.compute_total_derivs(of=['C1.y', 'C2.y'], wrt=['px.x'])
+            assert_rel_error(self, J['C1.y', 'px.x'], 2.0 * np.eye(n))
+            expected = np.zeros((4, n))
+            expected[[0, 1, 2, 3], [0, 0, 1, n - 1]] = 3.0
+            assert_rel_error(self, J['C2.y', 'px.x'], expected)
+
+        # the connection to C1 is one contiguous run, so it is copied as a slice.
+        plan = model._transfers['nonlinear']['fwd', 1]._fwd_plan
+        (in_idx, out_idx), = plan[0, 0]
+        self.assertEqual(in_idx, slice(0, n))
+        self.assertEqual(out_idx, slice(0, n))
+
+        # px.x[0] is sent to C1 and twice to C2
+        self.assertTrue(isinstance(model._transfers['nonlinear']['rev', 0]._rev_plan[0, 0],
+                                   tuple))
+
+    def test_combined_data(self):
+        for var_sets in (False, True):
+            p = Problem()
+            comp = IndepVarComp()
+            comp.add_output('v1', val=np.ones(2), var_set=1 if var_sets else 0)
+            comp.add_output('v2', val=2.0 * np.ones(3))
+            comp.add_output('v3', val=3.0, var_set=1 if var_sets else 0)
+            p.model.add_subsystem('des_vars', comp)
+            p.setup()
+
+            vec = p.model._outputs
+            expected = [1., 1., 2., 2., 2., 3.]
+
+            data = vec.get_data()
+            assert_rel_error(self, data, expected)
+            assert_rel_error(self, vec._get_data_view(), expected)
+
+            # the view is the data itself only for a single varset
+            self.assertEqual(vec._contiguous_set is None, var_sets)
+            self.assertEqual(np.may_share_memory(vec._get_data_view(), vec['des_vars.v2']),
+                             not var_sets)
+
+            # get_data always copies
+            data[:] = 0.
+            assert_rel_error(self, vec['des_vars.v1'], [1., 1.])
+
+            vec.set_data(np.arange(6.))
+            assert_rel_error(self, vec['des_vars.v2'], [2., 3., 4.])
+            vec.iadd_data(np.ones(6))
+            assert_rel_error(self, vec['des_vars.v3'], 6.)
+
+            out = np.empty(6)
+            vec.get_data(out)
+            assert_rel_error(self, out, np.arange(6.) + 1.)
+
 if __name__ == '__main__':
 
     unittest.main()
-
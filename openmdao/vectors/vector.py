@@ -66,6 +66,9 @@ class Vector(object):
         by varset name.
     _indices : list
         List of indices mapping the varset-grouped data to the global vector.
+    _contiguous_set : str or None
+        Name of the only varset when its data is already in the order of the global vector,
+        so that it can be used as the combined array without reordering; otherwise None.
     _vector_info : <VectorInfo>
         Object to store some global info, such as complex step state.
     _imag_views : dict
@@ -117,6 +120,7 @@ class Vector(object):
         self._root_vector = None
         self._data = {}
         self._indices = {}
+        self._contiguous_set = None
 
         # Support for Complex Step
         self._alloc_complex = alloc_complex
@@ -140,6 +144,7 @@ class Vector(object):
 
         self._initialize_data(root_vector)
         self._initialize_views()
+        self._setup_contiguous()
 
         self._length = np.sum(self._system._var_sizes[self._typ][self._iproc, :])
 
@@ -220,6 +225,13 @@ class Vector(object):
         ndarray
             Array combining the data of all the varsets.
         """
+        if self._contiguous_set is not None:
+            data = self._data[self._contiguous_set]
+            if new_array is None:
+                return data.copy()
+            new_array[:] = data
+            return new_array
+
         if new_array is None:
             new_array = np.zeros(self._length)
 
@@ -228,6 +240,22 @@ class Vector(object):
 
         return new_array
 
+    def _get_data_view(self):
+        """
+        Get the array combining the data of all the varsets, without copying it if possible.
+
+        When the vector has a single varset in global order, the returned array is that data
+        itself, so it must not be modified, and it changes along with the vector.
+
+        Returns
+        -------
+        ndarray
+            Array combining the data of all the varsets.
+        """
+        if self._contiguous_set is not None:
+            return self._data[self._contiguous_set]
+        return self.get_data()
+
     def set_data(self, array):
         """
         Set the incoming array combining the data of all the varsets.
@@ -237,6 +265,10 @@ class Vector(object):
         array : ndarray
             Array to set to the data for all the varsets.
         """
+        if self._contiguous_set is not None:
+            self._data[self._contiguous_set][:] = array
+            return
+
         for set_name, data in iteritems(self._data):
             data[:] = array[self._indices[set_name]]
 
@@ -249,9 +281,26 @@ class Vector(object):
         array : ndarray
             Array to set to the data for all the varsets.
         """
+        if self._contiguous_set is not None:
+            self._data[self._contiguous_set] += array
+            return
+
         for set_name, data in iteritems(self._data):
             data += array[self._indices[set_name]]
 
+    def _setup_contiguous(self):
+        """
+        Determine whether the data of the only varset can be used as the combined array.
+
+        Sets the following attributes:
+        _contiguous_set
+        """
+        self._contiguous_set = None
+        if len(self._data) == 1:
+            for set_name, indices in iteritems(self._indices):
+                if np.array_equal(indices, np.arange(indices.size)):
+                    self._contiguous_set = set_name
+
     def _contains_abs(self, abs_name):
         """
         Check if the variable is involved in the current mat-vec product.
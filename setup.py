@@ -79,5 +79,6 @@ setup(name='openmdao',
       iproftotals=openmdao.devtools.iprofile:prof_totals
       iprofmem=openmdao.devtools.iprof_mem:profile_py_file
       icalltrace=openmdao.devtools.itrace:trace_py_file
+      importtime=openmdao.devtools.import_time:import_time_argv
       """
 )